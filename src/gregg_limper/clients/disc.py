@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 
 import discord
@@ -10,6 +11,7 @@ from discord.ext import commands as discord_commands
 from gregg_limper import commands as gl_commands
 from gregg_limper.config import core
 from gregg_limper.event_hooks import message_hook, reaction_hook, ready_hook
+from gregg_limper.memory.cache import memo as cache_memo
 from gregg_limper.memory.rag import scheduler
 
 logger = logging.getLogger(__name__)
@@ -27,6 +29,12 @@ class GLBot(discord_commands.Bot):
     async def setup_hook(self) -> None:
         """Register slash commands and synchronise with Discord."""
 
+        # Python 3.12+: tasks run synchronously until their first real suspension,
+        # so gathers over cache-hit lookups finish without a scheduler round trip.
+        eager_factory = getattr(asyncio, "eager_task_factory", None)
+        if eager_factory is not None:
+            asyncio.get_running_loop().set_task_factory(eager_factory)
+
         await gl_commands.setup(self)
 
         try:
@@ -37,6 +45,8 @@ class GLBot(discord_commands.Bot):
 
     async def close(self) -> None:
         await scheduler.stop()
+        # Drain debounced memo snapshots before the loop goes away.
+        await cache_memo.flush()
         await super().close()
 
 
@@ -169,3 +169,65 @@ async def chat_full(
         if tool_choice:
             kwargs["tool_choice"] = tool_choice
     return await aoai.chat.completions.create(**kwargs)
+
+
+async def chat_stream_tools(
+    messages: list[dict],
+    *,
+    model=core.MSG_MODEL_ID,
+    tools: list[dict] | None = None,
+    tool_choice: str | None = None,
+    on_tool_call=None,
+) -> tuple[str, list[tuple[str, str, str]]]:
+    """
+    Stream a chat completion and return ``(content, tool_calls)``.
+
+    ``tool_calls`` holds ``(id, name, arguments)`` tuples in the model's order.
+    ``on_tool_call`` is invoked with each tuple as soon as that call's arguments
+    have finished streaming, so callers can start work before the response ends.
+    """
+    kwargs = {"model": model, "messages": messages, "stream": True}
+    if tools:
+        kwargs["tools"] = tools
+        if tool_choice:
+            kwargs["tool_choice"] = tool_choice
+    stream = await aoai.chat.completions.create(**kwargs)
+
+    content: list[str] = []
+    # index -> [id, name, argument chunks]
+    partial: dict[int, list] = {}
+    calls: list[tuple[str, str, str]] = []
+
+    def finish(index: int) -> None:
+        call_id, name, chunks = partial[index]
+        call = (call_id, name, "".join(chunks) or "{}")
+        calls.append(call)
+        if on_tool_call is not None:
+            on_tool_call(*call)
+
+    current: int | None = None
+    async for chunk in stream:
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta
+        if delta.content:
+            content.append(delta.content)
+        for tc in delta.tool_calls or ():
+            if tc.index not in partial:
+                # A new index means the previous call's arguments are complete.
+                if current is not None:
+                    finish(current)
+                partial[tc.index] = ["", "", []]
+                current = tc.index
+            entry = partial[tc.index]
+            if tc.id:
+                entry[0] = tc.id
+            if tc.function is not None:
+                if tc.function.name:
+                    entry[1] += tc.function.name
+                if tc.function.arguments:
+                    entry[2].append(tc.function.arguments)
+    if current is not None:
+        finish(current)
+
+    return "".join(content), calls
@@ -22,6 +22,11 @@ class Core:
     MAX_GIF_MB: int = int(os.getenv("MAX_GIF_MB", "10"))
     YT_THUMBNAIL_SIZE: str = os.getenv("YT_THUMBNAIL_SIZE", "medium")
     YT_DESC_MAX_LEN: int = int(os.getenv("YT_DESC_MAX_LEN", "200"))
+    # 0 = no debug_* prompt dumps, 1 = compact JSON, 2 = indented JSON
+    DEBUG_DUMP: int = int(os.getenv("DEBUG_DUMP", "2"))
+    # Cosine threshold for reusing a reply to a near-duplicate message; 0 disables
+    SEMANTIC_CACHE_TAU: float = float(os.getenv("SEMANTIC_CACHE_TAU", "0"))
+    SEMANTIC_CACHE_SIZE: int = int(os.getenv("SEMANTIC_CACHE_SIZE", "256"))
 
     def __post_init__(self) -> None:
         required = [
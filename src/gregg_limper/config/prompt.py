@@ -3,4 +3,7 @@ import os
 
 @dataclass
 class Prompt:
-    VECTOR_SEARCH_K: int = int(os.getenv("RAG_VECTOR_SEARCH_K", "3"))                  # Number of nearest neighbors to return in RAG vector search
\ No newline at end of file
+    VECTOR_SEARCH_K: int = int(os.getenv("RAG_VECTOR_SEARCH_K", "3"))                  # Number of nearest neighbors to return in RAG vector search
+    TOOL_PARALLELISM: int = int(os.getenv("TOOL_PARALLELISM", "4"))                    # Max tool calls from one model turn executed at once
+    TOOL_LOOP_DEADLINE: float = float(os.getenv("TOOL_LOOP_DEADLINE", "30"))          # Seconds of tool rounds before further tool calls are disabled
+    STREAM_TOOL_CALLS: bool = os.getenv("STREAM_TOOL_CALLS", "0").lower() in ("1", "true", "yes")  # Start tools while the model is still streaming
@@ -20,6 +20,10 @@ class Rag:
     MAINTENANCE_INTERVAL: int = int(os.getenv("MAINTENANCE_INTERVAL", "3600"))          # Seconds between maintenance tasks
     OPT_IN_LOOKBACK_DAYS: int = int(os.getenv("RAG_OPT_IN_LOOKBACK_DAYS", "180"))       # How far back to backfill user messages when they opt in to RAG
     BACKFILL_CONCURRENCY: int = int(os.getenv("RAG_BACKFILL_CONCURRENCY", "20"))        # Number of concurrent backfill tasks
+    EMBED_CACHE_SIZE: int = int(os.getenv("RAG_EMBED_CACHE_SIZE", "4096"))              # Query embeddings kept in memory
+    EMBED_CACHE_PERSIST: int = int(os.getenv("RAG_EMBED_CACHE_PERSIST", "50000"))       # Query embeddings kept in SQLite across restarts
+    MIN_QUERY_CHARS: int = int(os.getenv("RAG_MIN_QUERY_CHARS", "3"))                  # Shorter search queries are skipped (no embedding, no search)
+    MIN_QUERY_WORDS: int = int(os.getenv("RAG_MIN_QUERY_WORDS", "1"))                  # Search queries with fewer words are skipped
     REACTION_TRIGGERS: List[str] = field(
         default_factory=lambda: _split_triggers(os.getenv("RAG_REACTION_EMOJIS", ""))
     )                                                                                   # Emoji strings that trigger ingestion
@@ -4,6 +4,7 @@ Handle reaction events that should trigger RAG ingestion.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
@@ -20,6 +21,21 @@ from gregg_limper.memory.rag.triggers import (
 
 logger = logging.getLogger(__name__)
 
+# In-flight formatter runs keyed by message id so reaction bursts format once.
+_inflight: dict[int, asyncio.Task[dict]] = {}
+
+
+async def _format_once(message: discord.Message) -> dict:
+    """Format ``message`` for the cache, sharing one run across concurrent callers."""
+
+    task = _inflight.get(message.id)
+    if task is None:
+        task = asyncio.create_task(cache_formatting.format_for_cache(message))
+        _inflight[message.id] = task
+        task.add_done_callback(lambda _t, mid=message.id: _inflight.pop(mid, None))
+    # Shield so one cancelled reaction handler does not cancel the shared run.
+    return await asyncio.shield(task)
+
 
 async def handle(
     client: discord.Client, reaction: discord.Reaction, user: discord.User
@@ -28,37 +44,32 @@ async def handle(
     Ingest the reacted message when both the emoji and author qualify.
     """
 
+    # Cheapest, most selective check first: most reactions are not triggers.
+    if not emoji_matches_trigger(reaction.emoji, get_trigger_set()):
+        return
+
     message = reaction.message
     channel = getattr(message, "channel", None)
-    guild = getattr(message, "guild", None)
-
-    # Skip DM messages and other contexts without guild/channel.
-    if guild is None or channel is None:
-        logger.debug(
-            "Ignoring reaction %s on message %s without guild/channel context",
-            reaction.emoji,
-            getattr(message, "id", "unknown"),
-        )
-        return
 
     # Skip channels not in the configured set.
     channel_id = getattr(channel, "id", None)
     if channel_id not in core.CHANNEL_IDS:
         return
 
-    # Skip reactions that don't match the emoji trigger set.
-    triggers = get_trigger_set()
-    if triggers.is_empty():
-        logger.debug("Reaction ingestion skipped: no trigger emojis configured.")
-        return
-
-    if not emoji_matches_trigger(reaction.emoji, triggers):
+    # Skip DM messages and other contexts without guild context.
+    if getattr(message, "guild", None) is None:
+        logger.debug(
+            "Ignoring reaction %s on message %s without guild context",
+            reaction.emoji,
+            getattr(message, "id", "unknown"),
+        )
         return
 
     cache = GLCache()
 
     try:
-        cache_record = cache.get_memo_record(channel_id, message.id)
+        # Ingestion only reads the memo, so skip the defensive copy.
+        cache_record = cache.get_memo_record(channel_id, message.id, mutable=False)
         memo_present = True
     except KeyError:
         cache_record = None
@@ -87,7 +98,7 @@ async def handle(
         return
 
     if cache_record is None:
-        cache_record = await cache_formatting.format_for_cache(message)
+        cache_record = await _format_once(message)
 
     # Ingest the message into the RAG stores.
     try:
@@ -1,5 +1,6 @@
 import discord
 from gregg_limper.memory.cache import GLCache
+from gregg_limper.memory.cache import memo as cache_memo
 from gregg_limper.config import core, milvus, rag
 from gregg_limper.memory.rag import scheduler
 from gregg_limper.memory.rag.vector.health import validate_connection
@@ -28,6 +29,8 @@ async def handle(client: discord.Client):
     cache = GLCache()
     c_ids = [cid for cid in core.CHANNEL_IDS]
     await cache.initialize(client, c_ids)
+    # Persist any snapshots hydration queued before background work starts.
+    await cache_memo.flush()
 
     # Kick off RAG embedding maintenance after cache initialization
     await scheduler.start(rag.MAINTENANCE_INTERVAL)
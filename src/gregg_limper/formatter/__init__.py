@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from discord import Message
 
-from .classifier import classify
+from .classifier import classify, classify_slices
 from .composer import compose
 from .model import (
     Fragment,
@@ -41,7 +41,7 @@ async def format_message(msg: Message) -> dict:
         }
     """
 
-    classified_msg = classify(msg)
+    classified_msg = classify_slices(msg)
     fragments = await compose(msg, classified_msg)
     return {
         "author": msg.author.display_name,
@@ -1,6 +1,5 @@
 import re
-from typing import Any, Dict, List
-from urllib.parse import urlparse
+from typing import Any, Dict, List, Tuple
 from discord import Message
 
 import logging
@@ -12,29 +11,59 @@ logger = logging.getLogger(__name__)
 
 _URL_RE = re.compile(r"https?://\S+")
 
-_GIF_DOMAINS = {
+# Media-type ordinals; bit ``1 << ordinal`` marks the type as present in a mask.
+TEXT, IMAGE, GIF, LINK, YOUTUBE = range(5)
+MEDIA_TYPES: Tuple[str, ...] = ("text", "image", "gif", "link", "youtube")
+
+Classified = Tuple[int, List[Any]]
+
+_GIF_DOMAINS = frozenset({
     "tenor.com",
     "giphy.com",
     "media.tenor.com",
     "media.giphy.com",
-}
+})
 
-_YOUTUBE_DOMAINS = {
+_YOUTUBE_DOMAINS = frozenset({
     "youtube.com",
     "youtu.be",
-}
+})
+
+def _host(url: str) -> str:
+    """Return the lowercased host of ``url`` without a full ``urlparse``."""
+    s = url.find("://")
+    start = 0 if s < 0 else s + 3
+    end = len(url)
+    for sep in "/?#":
+        i = url.find(sep, start, end)
+        if i >= 0:
+            end = i
+    host = url[start:end]
+    # Drop userinfo and port so only the hostname is compared.
+    host = host[host.rfind("@") + 1:]
+    colon = host.find(":")
+    if colon >= 0:
+        host = host[:colon]
+    return host.lower()
+
+def _host_in(host: str, domains: frozenset[str]) -> bool:
+    """Match ``host`` exactly or as a subdomain of any entry in ``domains``."""
+    if host in domains:
+        return True
+    dot = host.find(".")
+    while dot >= 0:
+        if host[dot + 1:] in domains:
+            return True
+        dot = host.find(".", dot + 1)
+    return False
 
 def _is_youtube_url(url: str) -> bool:
-    url_lc = url.lower()
-    host = urlparse(url_lc).hostname or ""
-    return any(dom in host for dom in _YOUTUBE_DOMAINS)
+    return _host_in(_host(url), _YOUTUBE_DOMAINS)
 
 def _is_gif_url(url: str) -> bool:
-    url_lc = url.lower()
-    if url_lc.endswith(".gif"):
+    if url.lower().endswith(".gif"):
         return True
-    host = urlparse(url_lc).hostname or ""
-    return any(dom in host for dom in _GIF_DOMAINS)
+    return _host_in(_host(url), _GIF_DOMAINS)
 
 def _strip_urls(text: str) -> str:
     """Remove all URLs from the string."""
@@ -44,31 +73,26 @@ def _strip_urls(text: str) -> str:
 #  Main entry
 # --------------------------------------------------------------------- #
 
-def classify(msg: Message) -> Dict[str, Any]:
+def classify_slices(msg: Message) -> Classified:
     """
-    Classify a message into media slices.
+    Classify a message into a presence bitmask plus per-type slice data.
 
     :param msg: Discord message to analyze.
-    :returns: Mapping of media type to slice data, e.g.:
-
-    .. code-block:: python
-
-        {
-            "text":  "Look at this",
-            "gif":   ["https://tenor.com/view/..."],
-            "image": [<discord.Attachment ...>],
-            "link":  ["https://arxiv.org/abs/..."]
-        }
+    :returns: ``(mask, slices)`` where bit ``1 << ordinal`` is set for each
+        present media type and ``slices[ordinal]`` holds its data (``None``
+        when absent). Ordinals follow :data:`MEDIA_TYPES`.
     """
-    result: Dict[str, Any] = {}
+    mask = 0
+    slices: List[Any] = [None] * len(MEDIA_TYPES)
     content = msg.content or ""
 
     # 1) text content -- only added if message includes text beyond just URLs
     if (stripped := _strip_urls(content)):
-        result["text"] = stripped
+        slices[TEXT] = stripped
+        mask |= 1 << TEXT
 
     # 2) attachments -- note that GIFs are accumulated between both msg attachments and text URLs
-    images, gifs = [], []
+    images, gifs, links, youtube = [], [], [], []
     for att in msg.attachments:
         if att.content_type == "image/gif":
             gifs.append(att.url)
@@ -80,20 +104,46 @@ def classify(msg: Message) -> Dict[str, Any]:
         if _is_gif_url(url):
             gifs.append(url)
         elif _is_youtube_url(url):
-            result.setdefault("youtube", []).append(url)
+            youtube.append(url)
         else:
             # generic link for LinkHandler
-            result.setdefault("link", []).append(url)
+            links.append(url)
 
-    if images:
-        result["image"] = images
-    if gifs:
-        result["gif"] = gifs
+    for ordinal, data in ((IMAGE, images), (GIF, gifs), (LINK, links), (YOUTUBE, youtube)):
+        if data:
+            slices[ordinal] = data
+            mask |= 1 << ordinal
 
     # Log classification result
     # classify: 118235901246 [User#1234] -> types=['text', 'gif', 'link'] | 'Check this out https://tenor.com/view/...'
-    msg_snippet = (msg.content[:50] + "...") if msg.content else "<empty>"
-    logger.info(f"classify: {msg.id} [{msg.author}] -> types={list(result.keys())} | '{msg_snippet}'")
+    if logger.isEnabledFor(logging.INFO):
+        types = [name for i, name in enumerate(MEDIA_TYPES) if mask & (1 << i)]
+        msg_snippet = (msg.content[:50] + "...") if msg.content else "<empty>"
+        logger.info(f"classify: {msg.id} [{msg.author}] -> types={types} | '{msg_snippet}'")
 
-    return result
+    return mask, slices
 
+
+def classify(msg: Message) -> Dict[str, Any]:
+    """
+    Classify a message into media slices.
+
+    Dict-shaped wrapper over :func:`classify_slices` for callers that key
+    slices by media-type name.
+
+    :param msg: Discord message to analyze.
+    :returns: Mapping of media type to slice data, e.g.:
+
+    .. code-block:: python
+
+        {
+            "text":  "Look at this",
+            "gif":   ["https://tenor.com/view/..."],
+            "image": [<discord.Attachment ...>],
+            "link":  ["https://arxiv.org/abs/..."]
+        }
+    """
+    mask, slices = classify_slices(msg)
+    return {
+        name: slices[i] for i, name in enumerate(MEDIA_TYPES) if mask & (1 << i)
+    }
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
 from discord import Message
 
-from .handlers import get as get_handler
-from ..memory.rag.media_id import stable_media_id
+from .classifier import MEDIA_TYPES, Classified
+from .handlers import SliceHandler, get as get_handler
+from ..memory.rag.media_id import stable_media_ids
 from .model import Fragment
 
 import logging
@@ -14,28 +15,62 @@ logger = logging.getLogger(__name__)
 
 ORDER = ["text", "image", "gif", "link", "youtube"]
 
-
-async def compose(message: Message, classified: Dict[str, Any]) -> List[Fragment]:
+# Resolve handlers once; the registry is fully populated when ``.handlers`` imports.
+# Entries are ``(ordinal, bit, handler, needs_message)`` keyed to classifier ordinals.
+_DISPATCH: Tuple[Tuple[int, int, SliceHandler, bool], ...] = tuple(
+    (
+        MEDIA_TYPES.index(media_type),
+        1 << MEDIA_TYPES.index(media_type),
+        handler,
+        handler.needs_message,
+    )
+    for media_type in ORDER
+    if (handler := get_handler(media_type)) is not None
+)
+
+
+def _from_mapping(classified: Dict[str, Any]) -> Classified:
+    """Convert the dict shape from :func:`classifier.classify` into ``(mask, slices)``."""
+    mask = 0
+    slices: List[Any] = [None] * len(MEDIA_TYPES)
+    for i, name in enumerate(MEDIA_TYPES):
+        data = classified.get(name)
+        if data:
+            slices[i] = data
+            mask |= 1 << i
+    return mask, slices
+
+
+async def compose(
+    message: Message, classified: Classified | Dict[str, Any]
+) -> List[Fragment]:
     """
     Aggregate media-slice outputs into :class:`Fragment` objects.
 
     :param message: Source Discord message.
-    :param classified: Media slices produced by :func:`classifier.classify`.
+    :param classified: ``(mask, slices)`` from :func:`classifier.classify_slices`
+        or the dict produced by :func:`classifier.classify`.
     :returns: List of fragments with stable ``id`` values.
     """
 
-    coros: List[asyncio.Future] = []
-    for media_type in ORDER:
-        handler = get_handler(media_type)
-        if not handler:
-            continue
+    if isinstance(classified, dict):
+        classified = _from_mapping(classified)
+    mask, slices = classified
 
-        slice_data = classified.get(media_type)
-        if not slice_data:
+    # Resolve message provenance once, before any handler work.
+    guild = message.guild
+    server_id = guild.id if guild else 0
+    channel_id = message.channel.id
+    message_id = message.id
+
+    coros: List[asyncio.Future] = []
+    for ordinal, bit, handler, needs_message in _DISPATCH:
+        if not mask & bit:
             continue
+        slice_data = slices[ordinal]
 
         # Only pass the raw Discord message to handlers that explicitly request it.
-        if handler.needs_message:
+        if needs_message:
             coros.append(handler.handle(slice_data, message))
         else:
             coros.append(handler.handle(slice_data))
@@ -44,14 +79,14 @@ async def compose(message: Message, classified: Dict[str, Any]) -> List[Fragment
     results = await asyncio.gather(*coros) if coros else []
     fragments: List[Fragment] = [rec for frag_list in results for rec in frag_list]
 
-    for idx, frag in enumerate(fragments):
-        frag.id = stable_media_id(
-            cf=frag.to_dict(),
-            server_id=message.guild.id if message.guild else 0,
-            channel_id=message.channel.id,
-            message_id=message.id,
-            source_idx=idx,
-        )
+    ids = stable_media_ids(
+        [frag.to_dict() for frag in fragments],
+        server_id=server_id,
+        channel_id=channel_id,
+        message_id=message_id,
+    )
+    for frag, frag_id in zip(fragments, ids):
+        frag.id = frag_id
 
     return fragments
 
@@ -18,7 +18,8 @@ Adding a new handler requires changes across the app:
 
 1. Give it a unique ``media_type`` and place the module in this directory.
 2. Append that type to ``ORDER`` in ``formatter/composer.py`` so it runs.
-3. Teach ``formatter/classifier.py`` to populate the new slice from messages.
+3. Teach ``formatter/classifier.py`` to populate the new slice from messages,
+   giving the type an ordinal in ``MEDIA_TYPES``.
 4. Define a matching ``Fragment`` subclass and extend ``FragmentType`` in
    ``formatter/model.py`` (export from ``formatter/__init__.py`` if needed).
 5. Update ``response/prompt.py``'s ``MESSAGE_SCHEMA`` to document the new
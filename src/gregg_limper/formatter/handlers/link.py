@@ -3,7 +3,7 @@ LinkHandler Pipeline
 ===========
 1. Input slice : List[str] (URLs not already claimed by GIF / image logic)
 2. For each URL
-   a. await client_oai.summarize_url(url)
+   a. await client_oai.summarize_url(url) (recent summaries are reused)
    b. Build :class:`LinkFragment`:
       ``LinkFragment(title="<url>", description="<summary>")``
 3. Return ``list[LinkFragment]`` with one fragment per URL.
@@ -13,6 +13,8 @@ NOTE: We tolerate summarization failures here and keep the URL.
 
 from __future__ import annotations
 import re
+import time
+from collections import OrderedDict
 from typing import List
 import asyncio
 from . import register
@@ -23,6 +25,29 @@ from discord import Message
 import logging
 logger = logging.getLogger(__name__)
 
+# The same link is often reposted across messages; each summary is a paid
+# web-search completion, so keep successful ones for a while.
+_SUMMARY_TTL = 6 * 3600
+_SUMMARY_CACHE_SIZE = 256
+_summaries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+
+async def _summarize_cached(url: str) -> str:
+    entry = _summaries.get(url)
+    if entry is not None:
+        expires, summary = entry
+        if expires > time.monotonic():
+            _summaries.move_to_end(url)
+            return summary
+        del _summaries[url]
+
+    summary = await summarize_url(url, enable_citations=False)
+    if summary:
+        _summaries[url] = (time.monotonic() + _SUMMARY_TTL, summary)
+        if len(_summaries) > _SUMMARY_CACHE_SIZE:
+            _summaries.popitem(last=False)
+    return summary
+
 @register
 class LinkHandler:
     media_type = "link"
@@ -39,14 +64,16 @@ class LinkHandler:
         :returns: Fragments containing the original ``url`` and summary
             ``description``.
         """
-        async def _process(url: str) -> LinkFragment:
+        async def _summary(url: str) -> str:
             try:
-                summary = await summarize_url(url, enable_citations=False)
+                return await _summarize_cached(url)
             except Exception as e:
                 logger.error(f"Failed to summarize URL {url}: {e}")
-                summary = f"(link error: {e})"
-            return LinkFragment(title=url, url=url, description=summary)
+                return f"(link error: {e})"
 
-        # Run all URL fetches concurrently
-        return await asyncio.gather(*(_process(u) for u in urls))
+        # Summarize each distinct URL once, concurrently; every URL still gets
+        # its own fragment since fragments are mutated downstream (ids).
+        unique = list(dict.fromkeys(urls))
+        summaries = dict(zip(unique, await asyncio.gather(*(_summary(u) for u in unique))))
+        return [LinkFragment(title=u, url=u, description=summaries[u]) for u in urls]
 
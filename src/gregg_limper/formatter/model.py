@@ -18,17 +18,15 @@ stable identifier assigned during composition.
 """
 
 from __future__ import annotations
-from dataclasses import dataclass, field
-from typing import Optional, Literal, Dict, Any
-
-
-def _drop_nones(d: Dict[str, Any]) -> Dict[str, Any]:
-    """Return a shallow copy of ``d`` without keys mapped to ``None``."""
-    return {k: v for k, v in d.items() if v is not None}
+from dataclasses import MISSING, dataclass, field
+from typing import Callable, Optional, Literal, Dict, Any, get_args
 
 
 FragmentType = Literal["text", "image", "gif", "youtube", "link"]
 
+# Prebuilt markdown bullet prefixes so rendering skips per-call formatting.
+_BULLETS: Dict[str, str] = {typ: f"- **{typ}**" for typ in get_args(FragmentType)}
+
 
 @dataclass(slots=True)
 class Fragment:
@@ -43,7 +41,7 @@ class Fragment:
     def to_markdown(self) -> str:
         """Render the fragment as a concise Markdown bullet."""
 
-        parts = [f"- **{self.type}**"]
+        parts = [_BULLETS[self.type]]
         if self.title:
             parts.append(f": {self.title}")
         if self.description:
@@ -53,28 +51,33 @@ class Fragment:
         return "".join(parts)
 
     def to_dict(self) -> Dict[str, Any]:
-        base = {
-            "type": self.type,
-            "id": self.id,
-            "title": self.title,
-            "description": self.description,
-            "url": self.url,
-        }
-        return _drop_nones(base)
+        # Build the final dict directly; ``None`` fields are never inserted.
+        base: Dict[str, Any] = {"type": self.type, "id": self.id}
+        if self.title is not None:
+            base["title"] = self.title
+        if self.description is not None:
+            base["description"] = self.description
+        if self.url is not None:
+            base["url"] = self.url
+        return base
     
     def to_llm(self) -> Dict[str, Any]:
         """Return a dict with only fields useful for LLM consumption."""
-        base = {
-            "type": self.type,
-            "title": self.title,
-            "description": self.description,
-        }
-        return _drop_nones(base)
+        base: Dict[str, Any] = {"type": self.type}
+        if self.title is not None:
+            base["title"] = self.title
+        if self.description is not None:
+            base["description"] = self.description
+        return base
 
     def content_text(self) -> str:
         """Return text that should be embedded for RAG."""
         return (self.description or "").strip()
 
+    def preview_field(self) -> tuple[str, str]:
+        """Return ``(type, headline)`` for log previews without building a dict."""
+        return self.type, self.description or self.title or ""
+
     def __str__(self) -> str:  # pragma: no cover - convenience only
         import json
         return json.dumps(self.to_dict(), ensure_ascii=False)
@@ -91,7 +94,7 @@ class TextFragment(Fragment):
         body = (self.description or "").strip()
         if len(body) > 160:
             body = f"{body[:157]}…"
-        parts = [f"- **{self.type}**"]
+        parts = [_BULLETS[self.type]]
         if body:
             parts.append(f": {body}")
         if self.url:
@@ -108,7 +111,7 @@ class ImageFragment(Fragment):
     thumbnail_url: Optional[str] = None
 
     def to_markdown(self) -> str:
-        parts = [f"- **{self.type}**"]
+        parts = [_BULLETS[self.type]]
         if self.title:
             parts.append(f": {self.title}")
         caption = (self.caption or "").strip()
@@ -124,17 +127,24 @@ class ImageFragment(Fragment):
 
     def to_dict(self) -> Dict[str, Any]:
         base = Fragment.to_dict(self)
-        base.update(_drop_nones({"caption": self.caption, "thumbnail_url": self.thumbnail_url}))
+        if self.caption is not None:
+            base["caption"] = self.caption
+        if self.thumbnail_url is not None:
+            base["thumbnail_url"] = self.thumbnail_url
         return base
     
     def to_llm(self) -> Dict[str, Any]:
         base = Fragment.to_llm(self)
-        base.update(_drop_nones({"caption": self.caption}))
+        if self.caption is not None:
+            base["caption"] = self.caption
         return base
 
     def content_text(self) -> str:
         return (self.caption or "").strip()
 
+    def preview_field(self) -> tuple[str, str]:
+        return self.type, self.caption or self.description or self.title or ""
+
 
 @dataclass(slots=True)
 class GIFFragment(Fragment):
@@ -145,7 +155,7 @@ class GIFFragment(Fragment):
     thumbnail_url: Optional[str] = None
 
     def to_markdown(self) -> str:
-        parts = [f"- **{self.type}**"]
+        parts = [_BULLETS[self.type]]
         if self.title:
             parts.append(f": {self.title}")
         caption = (self.caption or "").strip()
@@ -159,16 +169,23 @@ class GIFFragment(Fragment):
 
     def to_dict(self) -> Dict[str, Any]:
         base = Fragment.to_dict(self)
-        base.update(_drop_nones({"caption": self.caption, "thumbnail_url": self.thumbnail_url}))
+        if self.caption is not None:
+            base["caption"] = self.caption
+        if self.thumbnail_url is not None:
+            base["thumbnail_url"] = self.thumbnail_url
         return base
 
     def to_llm(self) -> Dict[str, Any]:
         base = Fragment.to_llm(self)
-        base.update(_drop_nones({"caption": self.caption}))
+        if self.caption is not None:
+            base["caption"] = self.caption
         return base
 
     def content_text(self) -> str:
         return (self.caption or "").strip()
+
+    def preview_field(self) -> tuple[str, str]:
+        return self.type, self.caption or self.description or self.title or ""
     
 
 @dataclass(slots=True)
@@ -192,7 +209,7 @@ class YouTubeFragment(Fragment):
         return f"{minutes:d}:{sec:02d}"
 
     def to_markdown(self) -> str:
-        parts = [f"- **{self.type}**"]
+        parts = [_BULLETS[self.type]]
         if self.title:
             parts.append(f": {self.title}")
         elif self.description:
@@ -217,29 +234,24 @@ class YouTubeFragment(Fragment):
 
     def to_dict(self) -> Dict[str, Any]:
         base = Fragment.to_dict(self)
-        base.update(
-            _drop_nones(
-                {
-                    "thumbnail_url": self.thumbnail_url,
-                    "thumbnail_caption": self.thumbnail_caption,
-                    "channel": self.channel,
-                    "duration": self.duration,
-                }
-            )
-        )
+        if self.thumbnail_url is not None:
+            base["thumbnail_url"] = self.thumbnail_url
+        if self.thumbnail_caption is not None:
+            base["thumbnail_caption"] = self.thumbnail_caption
+        if self.channel is not None:
+            base["channel"] = self.channel
+        if self.duration is not None:
+            base["duration"] = self.duration
         return base
     
     def to_llm(self) -> Dict[str, Any]:
         base = Fragment.to_llm(self)
-        base.update(
-            _drop_nones(
-                {
-                    "thumbnail_caption": self.thumbnail_caption,
-                    "channel": self.channel,
-                    "duration": self.duration,
-                }
-            )
-        )
+        if self.thumbnail_caption is not None:
+            base["thumbnail_caption"] = self.thumbnail_caption
+        if self.channel is not None:
+            base["channel"] = self.channel
+        if self.duration is not None:
+            base["duration"] = self.duration
         return base
     
     def content_text(self) -> str:
@@ -255,7 +267,7 @@ class LinkFragment(Fragment):
     thumbnail_caption: Optional[str] = None
 
     def to_markdown(self) -> str:
-        parts = [f"- **{self.type}**"]
+        parts = [_BULLETS[self.type]]
         headline = self.title or self.url
         if headline:
             parts.append(f": {headline}")
@@ -271,27 +283,20 @@ class LinkFragment(Fragment):
 
     def to_dict(self) -> Dict[str, Any]:
         base = Fragment.to_dict(self)
-        base.update(
-            _drop_nones(
-                {
-                    "site_name": self.site_name,
-                    "thumbnail_url": self.thumbnail_url,
-                    "thumbnail_caption": self.thumbnail_caption,
-                }
-            )
-        )
+        if self.site_name is not None:
+            base["site_name"] = self.site_name
+        if self.thumbnail_url is not None:
+            base["thumbnail_url"] = self.thumbnail_url
+        if self.thumbnail_caption is not None:
+            base["thumbnail_caption"] = self.thumbnail_caption
         return base
 
     def to_llm(self) -> Dict[str, Any]:
         base = Fragment.to_llm(self)
-        base.update(
-            _drop_nones(
-                {
-                    "site_name": self.site_name,
-                    "thumbnail_caption": self.thumbnail_caption,
-                }
-            )
-        )
+        if self.site_name is not None:
+            base["site_name"] = self.site_name
+        if self.thumbnail_caption is not None:
+            base["thumbnail_caption"] = self.thumbnail_caption
         return base
 
 
@@ -310,6 +315,41 @@ _FRAG_REGISTRY: Dict[str, type[Fragment]] = {
     for cls in Fragment.__subclasses__()
 }
 
+
+def _build_factory(cls: type[Fragment]) -> Callable[[Dict[str, Any]], Fragment]:
+    """
+    Generate a constructor for ``cls`` that reads each init field from a dict.
+
+    The generated function names every field explicitly, so rehydration skips
+    building an intermediate kwargs dict for each fragment.
+
+    :param cls: Concrete fragment dataclass.
+    :returns: Function mapping a serialized dict to a ``cls`` instance.
+    """
+    namespace: Dict[str, Any] = {"cls": cls}
+    args = []
+    for name, f in cls.__dataclass_fields__.items():  # type: ignore[attr-defined]
+        if not f.init or name == "type":
+            continue
+        if f.default is not MISSING:
+            namespace[f"_default_{name}"] = f.default
+            args.append(f"{name}=d.get({name!r}, _default_{name})")
+        elif f.default_factory is not MISSING:
+            # Only build a fresh default when the key is absent.
+            namespace[f"_factory_{name}"] = f.default_factory
+            args.append(f"{name}=d[{name!r}] if {name!r} in d else _factory_{name}()")
+        else:
+            args.append(f"{name}=d[{name!r}]")
+    src = f"def _make_{cls.__name__}(d):\n    return cls({', '.join(args)})\n"
+    exec(src, namespace)
+    return namespace[f"_make_{cls.__name__}"]
+
+
+# Per-type constructors specialized at import time from the dataclass fields.
+_FACTORIES: Dict[str, Callable[[Dict[str, Any]], Fragment]] = {
+    typ: _build_factory(cls) for typ, cls in _FRAG_REGISTRY.items()
+}
+
 def fragment_from_dict(data: Dict[str, Any]) -> Fragment:
     """
     Instantiate a concrete :class:`Fragment` from a serialized dict.
@@ -318,11 +358,11 @@ def fragment_from_dict(data: Dict[str, Any]) -> Fragment:
     :returns: Constructed :class:`Fragment` subclass.
     """
     typ = data.get("type")
-    frag_cls = _FRAG_REGISTRY.get(typ)
-    if frag_cls is None:
+    factory = _FACTORIES.get(typ)
+    if factory is None:
         raise ValueError(f"Unknown fragment type: {typ}")
-    kwargs = {k: v for k, v in data.items() if k not in {"type", "id"}}
-    frag = frag_cls(**kwargs)
+    frag = factory(data)
+    # ``id`` is init=False on the dataclass, so assign it after construction.
     frag.id = data.get("id", "")
     return frag
 
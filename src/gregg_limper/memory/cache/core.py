@@ -7,16 +7,19 @@ This module defines the memo access surface used by :func:`process_message_for_r
 ``dict``-like mappings and dedicated stores (for example the on-disk
 ``MemoStore``) satisfy the same static contract.
 
-The ``_memo_has``/``_memo_get``/``_memo_set`` helpers normalize interactions
-with those memo containers. Each helper handles ``None`` up front, delegates to
-the object's bespoke method when present, and otherwise falls back to standard
-mapping operations. This keeps the ingestion pipeline unaware of the concrete
-memo implementation while still enabling consistent fragment reuse.
+:func:`_adapt` resolves a memo container into a :class:`_MemoAdapter` once at
+the call boundary. The adapter binds ``has``/``get``/``set`` directly to the
+container's own methods when it implements the protocol, falls back to
+standard mapping operations otherwise, and treats ``None`` as an empty,
+write-ignoring memo. Callers that process many messages against the same memo
+can pass a prebuilt adapter to skip the inspection entirely. This keeps the
+ingestion pipeline unaware of the concrete memo implementation while still
+enabling consistent fragment reuse.
 """
 
 from __future__ import annotations
 
-from typing import Mapping, MutableMapping, Protocol, Tuple
+from typing import Callable, Mapping, MutableMapping, Protocol, Tuple
 
 from discord import Message
 from discord.abc import User
@@ -32,41 +35,51 @@ class _MemoLike(Protocol):
     def set(self, message_id: int, payload: dict) -> None: ...
 
 
-def _memo_has(
-    memo: Mapping[int, dict] | MutableMapping[int, dict] | _MemoLike | None,
-    message_id: int,
-) -> bool:
-    if memo is None:
-        return False
-    if hasattr(memo, "has"):
-        return getattr(memo, "has")(message_id)
-    return message_id in memo  # type: ignore[arg-type]
+_MemoArg = Mapping[int, dict] | MutableMapping[int, dict] | _MemoLike | None
 
 
-def _memo_get(
-    memo: Mapping[int, dict] | MutableMapping[int, dict] | _MemoLike | None,
-    message_id: int,
-) -> dict:
-    if memo is None:
-        raise KeyError(message_id)
-    if hasattr(memo, "get"):
-        getter = getattr(memo, "get")
-        return getter(message_id)
-    return memo[message_id]  # type: ignore[index]
-
-
-def _memo_set(
-    memo: Mapping[int, dict] | MutableMapping[int, dict] | _MemoLike | None,
-    message_id: int,
-    payload: dict,
-) -> None:
+def _missing(message_id: int) -> dict:
+    raise KeyError(message_id)
+
+
+class _MemoAdapter:
+    """Memo accessors resolved once for a concrete memo container."""
+
+    __slots__ = ("has", "get", "set")
+
+    def __init__(
+        self,
+        has: Callable[[int], bool],
+        get: Callable[[int], dict],
+        set: Callable[[int, dict], None],
+    ) -> None:
+        self.has = has
+        self.get = get
+        self.set = set
+
+
+_NULL_MEMO = _MemoAdapter(
+    has=lambda message_id: False,
+    get=_missing,
+    set=lambda message_id, payload: None,
+)
+
+
+def _adapt(memo: _MemoArg | _MemoAdapter) -> _MemoAdapter:
+    """Return a :class:`_MemoAdapter` bound to ``memo``'s accessors."""
+
+    if isinstance(memo, _MemoAdapter):
+        return memo
     if memo is None:
-        return
-    if hasattr(memo, "set"):
-        setter = getattr(memo, "set")
-        setter(message_id, payload)
-        return
-    memo[message_id] = payload  # type: ignore[index]
+        return _NULL_MEMO
+    if hasattr(memo, "has"):
+        # Dedicated stores expose the full protocol; bind their methods directly.
+        return _MemoAdapter(memo.has, memo.get, memo.set)  # type: ignore[union-attr]
+    return _MemoAdapter(
+        memo.__contains__,
+        memo.__getitem__,  # type: ignore[arg-type]
+        memo.__setitem__,  # type: ignore[union-attr]
+    )
 
 
 async def process_message_for_rag(
@@ -75,29 +88,35 @@ async def process_message_for_rag(
     *,
     ingest: bool = True,
     cache_msg: dict | None = None,
-    memo: Mapping[int, dict] | MutableMapping[int, dict] | _MemoLike | None = None,
+    memo: _MemoArg | _MemoAdapter = None,
     bot_user: User | None = None,
 ) -> Tuple[dict, bool]:
     """Format ``message_obj`` and optionally ingest it into downstream RAG stores."""
 
     msg_id = message_obj.id
-    memo_present = _memo_has(memo, msg_id)
+    memo_ops = _adapt(memo)
+    memo_present = memo_ops.has(msg_id)
 
-    should_ingest, resources = await ingestion.evaluate_ingestion(
-        message_obj,
-        ingest_requested=ingest,
-        memo_present=memo_present,
-        bot_user=bot_user,
-    )
+    # Cache-only fills resolve synchronously; skip the coroutine entirely.
+    skipped = ingestion.evaluate_ingestion_preflight(ingest, memo_present)
+    if skipped is not None:
+        should_ingest, resources = False, skipped
+    else:
+        should_ingest, resources = await ingestion.evaluate_ingestion(
+            message_obj,
+            ingest_requested=ingest,
+            memo_present=memo_present,
+            bot_user=bot_user,
+        )
 
     if cache_msg is not None:
         record = cache_msg
-        _memo_set(memo, msg_id, cache_msg)
+        memo_ops.set(msg_id, cache_msg)
     elif memo_present:
-        record = _memo_get(memo, msg_id)
+        record = memo_ops.get(msg_id)
     else:
         record = await formatting.format_for_cache(message_obj)
-        _memo_set(memo, msg_id, record)
+        memo_ops.set(msg_id, record)
 
     did_ingest = False
     if should_ingest and not resources.sqlite:
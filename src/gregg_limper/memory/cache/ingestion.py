@@ -3,8 +3,9 @@ Bridge cached memos into long-term RAG stores.
 
 The cache defers to this module for deciding if messages should be pushed into
 downstream retrieval stores (SQLite + vector indices) and for performing the
-ingestion. External callers should use :func:`evaluate_ingestion` to combine
-user consent checks with duplicate detection and then invoke
+ingestion. External callers should use :func:`evaluate_ingestion` (or
+:func:`evaluate_ingestion_batch` for many messages at once) to combine user
+consent checks with duplicate detection and then invoke
 :func:`ingest_message` to persist the memo payload. Both functions are resilient
 to downstream errors and log failures without raising so the cache can continue
 operating.
@@ -15,6 +16,7 @@ from __future__ import annotations
 import datetime
 import logging
 from dataclasses import dataclass
+from typing import Sequence
 
 from discord import Message
 from discord.abc import User
@@ -34,6 +36,21 @@ class ResourceState:
     vector: bool = False
 
 
+def evaluate_ingestion_preflight(
+    ingest_requested: bool, memo_present: bool
+) -> ResourceState | None:
+    """
+    Resolve the ingestion decision without I/O when possible.
+
+    Returns the :class:`ResourceState` for a skipped ingest when ingestion was
+    not requested, or ``None`` when downstream checks are required.
+    """
+
+    if not ingest_requested:
+        return ResourceState(memo=memo_present)
+    return None
+
+
 async def evaluate_ingestion(
     message: Message,
     ingest_requested: bool,
@@ -42,10 +59,11 @@ async def evaluate_ingestion(
 ) -> tuple[bool, ResourceState]:
     """Evaluate whether ``message`` should be ingested into the RAG stores."""
 
-    resources = ResourceState(memo=memo_present)
-    if not ingest_requested:
-        return False, resources
+    skipped = evaluate_ingestion_preflight(ingest_requested, memo_present)
+    if skipped is not None:
+        return False, skipped
 
+    resources = ResourceState(memo=memo_present)
     try:
         # Respect user consent before touching downstream stores.
         if not await consent.is_opted_in(message.author.id):
@@ -62,22 +80,63 @@ async def evaluate_ingestion(
         return False, resources
 
 
+async def evaluate_ingestion_batch(
+    messages: Sequence[Message],
+    memo_present: bool,
+    bot_user: User | None = None,
+) -> list[tuple[Message, bool, ResourceState]]:
+    """
+    Evaluate ingestion for ``messages`` with one consent and one existence query.
+
+    Mirrors :func:`evaluate_ingestion` with ``ingest_requested=True`` for each
+    message, but batches the downstream lookups for backfill paths.
+    """
+
+    if not messages:
+        return []
+
+    try:
+        opted_in = await consent.are_opted_in([m.author.id for m in messages])
+        candidates = [m.id for m in messages if m.author.id in opted_in]
+        existing = await rag.messages_exist(candidates) if candidates else set()
+    except Exception:
+        # Downstream checks should not break caching; log and tell the caller to skip ingest.
+        logger.exception(
+            "Failed to evaluate ingestion state for %s messages", len(messages)
+        )
+        return [(m, False, ResourceState(memo=memo_present)) for m in messages]
+
+    results: list[tuple[Message, bool, ResourceState]] = []
+    for message in messages:
+        resources = ResourceState(memo=memo_present)
+        if message.author.id not in opted_in:
+            results.append((message, False, resources))
+            continue
+        exists = message.id in existing
+        resources.sqlite = resources.vector = exists
+        results.append((message, True, resources))
+    return results
+
+
 async def ingest_message(channel_id: int, message: Message, cache_message: dict) -> None:
     """Persist ``message`` and its memoized payload into the RAG stores."""
 
+    # Read each Discord attribute once; they resolve through descriptors.
+    message_id = message.id
     try:
+        guild = message.guild
         created_at = message.created_at
         if created_at.tzinfo is None:
             # Normalize naive timestamps so cross-region persistence is consistent.
             created_at = created_at.replace(tzinfo=datetime.timezone.utc)
         await rag.ingest_cache_message(
-            server_id=message.guild.id if message.guild else 0,
+            server_id=guild.id if guild else 0,
             channel_id=channel_id,
-            message_id=message.id,
+            message_id=message_id,
             author_id=message.author.id,
             ts=created_at.timestamp(),
             cache_message=cache_message,
         )
     except Exception:
         # Ingestion is best-effort—failures should not stop the cache from moving forward.
-        logger.exception("RAG ingestion failed for message %s", message.id)
+        logger.exception("RAG ingestion failed for message %s", message_id)
@@ -23,7 +23,7 @@ from gregg_limper.memory.rag.triggers import (
 )
 
 from .formatting import format_missing_messages
-from .ingestion import evaluate_ingestion, ingest_message
+from .ingestion import evaluate_ingestion_batch, ingest_message
 from .memo_store import MemoStore
 
 if TYPE_CHECKING:  # pragma: no cover - type-checking only
@@ -42,9 +42,11 @@ class CacheInitializer:
     async def hydrate(self, client: Client, channel_ids: List[int]) -> None:
         """Hydrate ``channel_ids`` from Discord and persisted memos."""
 
+        # Preload persisted fragments for every channel up front; files parse in parallel.
+        loaded_by_channel = self._memo_store.load_channels(channel_ids)
+
         for channel_id in channel_ids:
-            loaded_ids = self._memo_store.load_channel(channel_id)
-            # Preload persisted fragments so the cache can reuse existing memo payloads.
+            loaded_ids = loaded_by_channel.get(channel_id, set())
             channel = client.get_channel(channel_id)
             if not isinstance(channel, TextChannel):
                 logger.warning(
@@ -75,6 +77,7 @@ class CacheInitializer:
             ingest_sem = asyncio.Semaphore(cache.INGEST_CONCURRENCY)
             ingest_tasks: list[asyncio.Task[None]] = []
             
+            triggered: List[Message] = []
             for message in messages:
                 payload = formatted_missing.get(message.id)
                 try:
@@ -94,13 +97,13 @@ class CacheInitializer:
                     message, triggers=triggers
                 ):
                     continue
+                triggered.append(message)
 
-                should_ingest, resources = await evaluate_ingestion(
-                    message,
-                    ingest_requested=True,
-                    memo_present=True,
-                    bot_user=bot_user,
-                )
+            # One consent query and one existence query cover every triggered message.
+            decisions = await evaluate_ingestion_batch(
+                triggered, memo_present=True, bot_user=bot_user
+            )
+            for message, should_ingest, resources in decisions:
                 # After caching succeeds, decide whether to backfill the RAG stores for the message.
                 if should_ingest and not resources.sqlite:
                     ingest_tasks.append(
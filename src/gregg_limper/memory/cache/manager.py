@@ -26,7 +26,15 @@ from .core import process_message_for_rag
 from .channel_state import ChannelCacheState
 from .initializer import CacheInitializer
 from .memo_store import MemoStore
-from .serialization import Mode, copy_memo_entry, serialize
+from .serialization import (
+    _NO_FRAGMENTS,
+    SERIALIZERS,
+    MemoEntry,
+    Mode,
+    copy_memo_entry,
+    serialize,
+    serialize_full,
+)
 from .utils import _frags_preview
 
 logger = logging.getLogger(__name__)
@@ -108,12 +116,12 @@ class GLCache:
         )
 
         if not memo_present or evicted_id is not None or cache_msg is not None:
-            # Persist the latest retention window whenever memo membership changes.
-            self._memo_store.save_channel_snapshot(channel_id, state.message_ids())
+            # Journal the new record; evicted entries are dropped at the next compaction.
+            self._memo_store.append_record(channel_id, msg_id, state.message_ids)
 
         if logger.isEnabledFor(logging.INFO):
             preview = _frags_preview(
-                record.get("fragments", []), width_each=20, max_total_chars=200
+                record.get("fragments") or _NO_FRAGMENTS, width_each=20, max_total_chars=200
             )
             # Summarize fragment activity so operators can trace cache churn at INFO level.
             logger.info(
@@ -182,6 +190,8 @@ class GLCache:
         """
         state = self._get_state(channel_id)
         messages = state.iter_messages(n)
+        # Resolve the mode once rather than per message.
+        to_view = SERIALIZERS.get(mode, serialize_full)
         formatted: list[dict] = []
         missing: list[int] = []
 
@@ -191,7 +201,7 @@ class GLCache:
             except KeyError:
                 missing.append(msg.id)
                 continue
-            formatted.append(serialize(memo_entry, mode))
+            formatted.append(to_view(memo_entry))
 
         if missing:
             logger.debug(
@@ -257,7 +267,9 @@ class GLCache:
         cache_msg = self._get_memo_entry(channel_id, message_id)
         return serialize(cache_msg, mode)
 
-    def get_memo_record(self, channel_id: int, message_id: int) -> dict:
+    def get_memo_record(
+        self, channel_id: int, message_id: int, *, mutable: bool = True
+    ) -> dict | MemoEntry:
         """
         Fetch a defensive copy of the memo for ``message_id``.
 
@@ -267,10 +279,12 @@ class GLCache:
 
         :param channel_id: Discord channel identifier that owns the message.
         :param message_id: Identifier of the cached message to retrieve.
+        :param mutable: When ``False``, return a read-only :class:`MemoEntry` view
+            instead of copying the memo.
         :return: Copy of the memo dictionary detached from the live cache.
         """
         cache_msg = self._get_memo_entry(channel_id, message_id)
-        return copy_memo_entry(cache_msg)
+        return copy_memo_entry(cache_msg, mutable=mutable)
 
     # ------------------------------------------------------------------ #
     # INITIALIZATION
@@ -6,19 +6,41 @@ simple mapping schema::
 
     {msg_id: {"author": str, "fragments": [Fragment-as-dict, ...]}, ...}
 
+Fragments are written by orjson's native dataclass encoder, so unset optional
+fields appear as ``null``; :func:`load` treats them the same as missing keys.
+
+Each compacted ``{channel_id}.json.gz`` base may be followed by an append-only
+``{channel_id}.jrnl`` journal of NDJSON lines shaped like
+``{"msg_id": int, "author": str, "fragments": [...]}``. Loading replays the
+journal over the base, so single-message updates never rewrite the whole file.
+Taking a snapshot rotates the live journal to a numbered generation
+(``{channel_id}.jrnl.{n}``) that is deleted once the snapshot reaches disk;
+until then loading replays generations in order before the live journal.
+
 The public helpers in this module mirror that schema. Callers can check for a
 memo file with :func:`exists`, load and deserialize fragments with
-:func:`load`, reduce the payload to the configured cache length with
-:func:`prune`, and atomically write updates with :func:`save`.
+:func:`load` (or :func:`load_many` for several channels at once), reduce the
+payload to the configured cache length with :func:`prune`, journal single
+records with :func:`append`, and atomically write compacted snapshots with
+:func:`save`. :func:`needs_compaction` reports when the journal has grown large
+enough that a fresh snapshot is worthwhile. Callers on the event loop should
+prefer :func:`schedule_save`, which debounces bursts of snapshot requests into
+a single background write per channel; :func:`flush` drains anything pending
+(for example at shutdown).
 """
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import asyncio
 import gzip
-import json
+import itertools
 import os
-from typing import Dict
+import threading
+from typing import Dict, Iterable, Sequence, Tuple
+
+import orjson
 
 from gregg_limper.config import cache
 from gregg_limper.formatter.model import fragment_from_dict, Fragment
@@ -28,28 +50,126 @@ def _memo_dir() -> Path:
     return Path(cache.MEMO_DIR)
 
 
+# Compact once the journal grows past this fraction of the base file size.
+_COMPACT_RATIO = 0.25
+
+# Debounce window for :func:`schedule_save`; requests inside it collapse to one write.
+_SAVE_DEBOUNCE_S = 0.5
+
+# Serializes base-file replacement and journal edits across writer threads.
+_io_lock = threading.Lock()
+# Snapshot sequence numbers let a writer skip snapshots older than what is on disk.
+_seq = itertools.count(1)
+_written_seq: Dict[int, int] = {}
+# channel_id -> (seq, memo_dict, journal generations the snapshot covers)
+_pending: Dict[int, Tuple[int, Dict[int, dict], Tuple[Path, ...]]] = {}
+_flush_task: asyncio.Task[None] | None = None
+
+
 def _path(channel_id: int) -> Path:
     d = _memo_dir()
     d.mkdir(parents=True, exist_ok=True)
     return d / f"{channel_id}.json.gz"
 
 
+def _journal_path(channel_id: int) -> Path:
+    return _path(channel_id).with_suffix("").with_suffix(".jrnl")
+
+
+def _generations(channel_id: int) -> list[Path]:
+    """Return rotated journal generations for ``channel_id``, oldest first."""
+    gens = []
+    for g in _memo_dir().glob(f"{channel_id}.jrnl.*"):
+        n = g.name.rsplit(".", 1)[1]
+        if n.isdigit():
+            gens.append((int(n), g))
+    return [g for _, g in sorted(gens)]
+
+
+def _rotate_journal(channel_id: int) -> Tuple[Path, ...]:
+    """
+    Seal the live journal as a new generation and return every generation.
+
+    The caller's snapshot covers all of them; records appended afterwards go to
+    a fresh journal, so deleting these files later can never drop them.
+    """
+    with _io_lock:
+        gens = _generations(channel_id)
+        j = _journal_path(channel_id)
+        if j.exists():
+            n = int(gens[-1].name.rsplit(".", 1)[1]) + 1 if gens else 1
+            sealed = j.with_name(f"{j.name}.{n}")
+            os.replace(j, sealed)
+            gens.append(sealed)
+    return tuple(gens)
+
+
+def _rehydrate(entry: dict) -> dict:
+    # Rehydrate fragment instances so the cache can reuse formatter helpers directly.
+    frags = [fragment_from_dict(fd) for fd in entry.get("fragments") or ()]
+    return {"author": entry.get("author"), "fragments": frags}
+
+
 def exists(channel_id: int) -> bool:
-    return _path(channel_id).exists()
+    return (
+        _path(channel_id).exists()
+        or _journal_path(channel_id).exists()
+        or bool(_generations(channel_id))
+    )
+
+
+def _replay(path: Path, out: Dict[int, dict]) -> None:
+    for line in path.read_bytes().splitlines():
+        try:
+            entry = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            # A crash mid-append can leave a torn final line; skip it.
+            continue
+        out[int(entry["msg_id"])] = _rehydrate(entry)
 
 
 def load(channel_id: int) -> Dict[int, dict]:
     p = _path(channel_id)
-    if not p.exists():
-        return {}
-    with gzip.open(p, "rt", encoding="utf-8") as f:
-        raw = json.load(f)
+    j = _journal_path(channel_id)
     out: Dict[int, dict] = {}
-    for k, v in raw.items():
-        # Rehydrate fragment instances so the cache can reuse formatter helpers directly.
-        frags = [fragment_from_dict(fd) for fd in v.get("fragments", [])]
-        out[int(k)] = {"author": v.get("author"), "fragments": frags}
-    return out
+    if p.exists():
+        # Decompress and parse as raw bytes to skip the text codec layer.
+        raw = orjson.loads(gzip.decompress(p.read_bytes()))
+        for k, v in raw.items():
+            out[int(k)] = _rehydrate(v)
+    # Generations sealed by snapshots that never reached disk predate the live journal.
+    journals = _generations(channel_id)
+    if j.exists():
+        journals.append(j)
+    if not journals:
+        return out
+    for path in journals:
+        try:
+            _replay(path, out)
+        except FileNotFoundError:
+            # A snapshot covering this generation landed while we were reading.
+            continue
+    # Journals may still hold entries evicted since the last compaction.
+    return prune(channel_id, out)
+
+
+def load_many(channel_ids: Iterable[int]) -> Dict[int, Dict[int, dict]]:
+    """
+    Load memo files for several channels concurrently.
+
+    Only zlib decompression releases the GIL; orjson parsing and fragment
+    rehydration hold it. A small thread pool therefore overlaps file reads and
+    decompression across channels at startup, and more workers will not speed
+    up the parsing.
+
+    :param channel_ids: Channels whose memo files should be loaded.
+    :returns: Mapping of channel id to the same payload :func:`load` returns.
+    """
+    ids = list(dict.fromkeys(channel_ids))
+    if len(ids) <= 1:
+        return {cid: load(cid) for cid in ids}
+    with ThreadPoolExecutor(max_workers=min(8, len(ids))) as pool:
+        return dict(zip(ids, pool.map(load, ids)))
 
 
 def prune(channel_id: int, memo_dict: Dict[int, dict]) -> Dict[int, dict]:
@@ -60,18 +180,131 @@ def prune(channel_id: int, memo_dict: Dict[int, dict]) -> Dict[int, dict]:
     return dict(items)
 
 
-def save(channel_id: int, memo_dict: Dict[int, dict]) -> None:
+def append(channel_id: int, message_id: int, entry: dict) -> None:
+    """
+    Journal a single memo record without rewriting the channel's base file.
+
+    :param channel_id: Channel whose journal receives the record.
+    :param message_id: Discord message id the record belongs to.
+    :param entry: Memo record shaped like ``{"author": str, "fragments": [...]}``.
+    """
+    line = orjson.dumps(
+        {
+            "msg_id": message_id,
+            "author": entry.get("author"),
+            "fragments": entry.get("fragments") or (),
+        }
+    )
+    flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND
+    with _io_lock:
+        fd = os.open(_journal_path(channel_id), flags, 0o644)
+        try:
+            os.write(fd, line + b"\n")
+        finally:
+            os.close(fd)
+
+
+def needs_compaction(channel_id: int) -> bool:
+    """Return ``True`` when the journal outweighs the base enough to rewrite it."""
+    j = _journal_path(channel_id)
+    if not j.exists():
+        return False
+    p = _path(channel_id)
+    if not p.exists():
+        return True
+    return j.stat().st_size > p.stat().st_size * _COMPACT_RATIO
+
+
+def _write_snapshot(
+    channel_id: int, seq: int, memo_dict: Dict[int, dict], covered: Tuple[Path, ...]
+) -> None:
     p = _path(channel_id)
     tmp = p.with_suffix(".tmp")
-    # Convert keys and fragment payloads into JSON-friendly structures before writing.
+    # orjson encodes the fragment dataclasses natively, so no per-fragment to_dict.
     serializable = {
-        str(k): {
-            "author": v.get("author"),
-            "fragments": [f.to_dict() for f in v.get("fragments", [])],
-        }
+        str(k): {"author": v.get("author"), "fragments": v.get("fragments") or ()}
         for k, v in memo_dict.items()
     }
-    with gzip.open(tmp, "wt", encoding="utf-8") as f:
-        json.dump(serializable, f)
-    # Atomic rename keeps partially written files from being observed by other processes.
-    os.replace(tmp, p)
+    data = orjson.dumps(serializable)
+    # Level 3 trades a slightly larger file for far less CPU than the default 9.
+    payload = gzip.compress(data, compresslevel=3)
+    with _io_lock:
+        if seq <= _written_seq.get(channel_id, 0):
+            # A newer snapshot already reached disk; writing this one would regress it.
+            return
+        tmp.write_bytes(payload)
+        # Atomic rename keeps partially written files from being observed by other processes.
+        os.replace(tmp, p)
+        _written_seq[channel_id] = seq
+        # Records in these generations are all part of the base just written.
+        for g in covered:
+            g.unlink(missing_ok=True)
+
+
+def save(channel_id: int, memo_dict: Dict[int, dict]) -> None:
+    # A direct save supersedes any debounced snapshot still waiting for this channel.
+    _pending.pop(channel_id, None)
+    # The new base already covers every journaled record.
+    _write_snapshot(channel_id, next(_seq), memo_dict, _rotate_journal(channel_id))
+
+
+def _write_pending(
+    batch: Sequence[Tuple[int, Tuple[int, Dict[int, dict], Tuple[Path, ...]]]]
+) -> None:
+    if len(batch) <= 1:
+        for channel_id, (seq, memo_dict, covered) in batch:
+            _write_snapshot(channel_id, seq, memo_dict, covered)
+        return
+    with ThreadPoolExecutor(max_workers=min(8, len(batch))) as pool:
+        futures = [
+            pool.submit(_write_snapshot, channel_id, seq, memo_dict, covered)
+            for channel_id, (seq, memo_dict, covered) in batch
+        ]
+        for fut in futures:
+            fut.result()
+
+
+def is_save_pending(channel_id: int) -> bool:
+    """Return ``True`` if a debounced snapshot for ``channel_id`` awaits flushing."""
+    return channel_id in _pending
+
+
+def schedule_save(channel_id: int, memo_dict: Dict[int, dict]) -> None:
+    """
+    Queue ``memo_dict`` as ``channel_id``'s next snapshot and flush it shortly.
+
+    Repeated calls inside the debounce window replace the queued snapshot, so a
+    burst of updates results in one disk write. Without a running event loop
+    the snapshot is written immediately.
+
+    :param channel_id: Channel whose memo file should be rewritten.
+    :param memo_dict: Complete snapshot to persist.
+    """
+    global _flush_task
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        save(channel_id, memo_dict)
+        return
+    # Records journaled up to this point are covered by the snapshot; later
+    # appends start a fresh journal that its write will not touch.
+    _pending[channel_id] = (next(_seq), memo_dict, _rotate_journal(channel_id))
+    if _flush_task is None or _flush_task.done():
+        _flush_task = loop.create_task(_flush_soon())
+
+
+async def _flush_soon() -> None:
+    # Snapshots queued while a write is in flight find this task still running
+    # and start none of their own, so keep draining until nothing is left.
+    while _pending:
+        await asyncio.sleep(_SAVE_DEBOUNCE_S)
+        await flush()
+
+
+async def flush() -> None:
+    """Write every pending snapshot now, in parallel across channels."""
+    if not _pending:
+        return
+    batch = list(_pending.items())
+    _pending.clear()
+    await asyncio.to_thread(_write_pending, batch)
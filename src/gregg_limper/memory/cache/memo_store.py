@@ -10,7 +10,7 @@ across channel operations.
 
 from __future__ import annotations
 
-from typing import Iterable
+from typing import Callable, Iterable
 
 from . import memo
 
@@ -63,15 +63,52 @@ class MemoStore:
         self._records.update(loaded)
         return set(loaded.keys())
 
-    def save_channel_snapshot(self, channel_id: int, message_ids: Iterable[int]) -> None:
-        """Persist memo snapshot for ``channel_id`` covering ``message_ids``."""
+    def load_channels(self, channel_ids: Iterable[int]) -> dict[int, set[int]]:
+        """Load memo records from disk for every channel in ``channel_ids``."""
+
+        loaded_by_channel = memo.load_many(channel_ids)
+        out: dict[int, set[int]] = {}
+        for channel_id, loaded in loaded_by_channel.items():
+            # Merge on the calling thread; only the file parsing runs in the pool.
+            self._records.update(loaded)
+            out[channel_id] = set(loaded.keys())
+        return out
 
+    def _snapshot(self, channel_id: int, message_ids: Iterable[int]) -> dict[int, dict]:
         ordered_ids = list(message_ids)
         # Preserve cache ordering when selecting memo payloads for the snapshot.
         memo_dict = {mid: self._records[mid] for mid in ordered_ids if mid in self._records}
         # Ensure disk state enforces the global cache length just like in-memory state.
-        memo_dict = memo.prune(channel_id, memo_dict)
-        memo.save(channel_id, memo_dict)
+        return memo.prune(channel_id, memo_dict)
+
+    def save_channel_snapshot(self, channel_id: int, message_ids: Iterable[int]) -> None:
+        """Persist memo snapshot for ``channel_id`` covering ``message_ids``."""
+
+        memo.save(channel_id, self._snapshot(channel_id, message_ids))
+
+    def schedule_channel_snapshot(
+        self, channel_id: int, message_ids: Iterable[int]
+    ) -> None:
+        """Queue a debounced memo snapshot for ``channel_id`` covering ``message_ids``."""
+
+        memo.schedule_save(channel_id, self._snapshot(channel_id, message_ids))
+
+    def append_record(
+        self, channel_id: int, message_id: int, message_ids: Callable[[], Iterable[int]]
+    ) -> None:
+        """
+        Journal ``message_id``'s memo for ``channel_id`` and compact when due.
+
+        ``message_ids`` is only invoked when the journal has outgrown the base
+        snapshot and a full rewrite is needed.
+        """
+
+        record = self._records.get(message_id)
+        if record is None:
+            return
+        memo.append(channel_id, message_id, record)
+        if memo.needs_compaction(channel_id) and not memo.is_save_pending(channel_id):
+            self.schedule_channel_snapshot(channel_id, message_ids())
 
     def reconcile_channel(
         self,
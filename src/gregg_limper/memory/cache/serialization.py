@@ -4,47 +4,110 @@ Memo serialization helpers.
 Expose utilities for converting memo payloads into structures consumed by
 callers. 
 
-:func:`serialize` transforms memo fragments into the compact LLM view
-or full-fidelity dictionaries, while :func:`copy_memo_entry` returns a shallow
-copy suitable for mutation by callers without affecting the memo store.
+:func:`serialize` transforms memo fragments into the compact LLM view,
+full-fidelity dictionaries, or Markdown bullets (``serialize_llm``,
+``serialize_full`` and ``serialize_markdown`` are the per-mode forms), while
+:func:`copy_memo_entry` returns a shallow copy suitable for mutation by callers
+without affecting the memo store, or a lightweight read-only
+:class:`MemoEntry` view when no mutation is needed.
 """
 
 from __future__ import annotations
 
-from typing import Literal
+from typing import Any, Callable, Literal, Sequence
 
 Mode = Literal["llm", "full", "markdown"]
 
+# Shared default for records without fragments; tuples are immutable, so one suffices.
+_NO_FRAGMENTS: tuple = ()
 
-def serialize(cache_msg: dict, mode: Mode) -> dict:
-    """Serialize ``cache_msg`` for the requested ``mode``."""
-
-    fragments = cache_msg.get("fragments", [])
-    if mode == "llm":
-        # Compact form strips fragment metadata to what downstream prompting needs.
-        return {
-            "author": cache_msg.get("author"),
-            "fragments": [frag.to_llm() for frag in fragments],
-        }
-    if mode == "markdown":
-        return {
-            "author": cache_msg.get("author"),
-            "fragments": [frag.to_markdown() for frag in fragments],
-        }
-    # Full form keeps every field so operators can inspect the formatter output verbatim.
+
+def serialize_llm(cache_msg: dict) -> dict:
+    """Compact form: fragment metadata stripped to what downstream prompting needs."""
+    return {
+        "author": cache_msg.get("author"),
+        "fragments": [frag.to_llm() for frag in cache_msg.get("fragments") or _NO_FRAGMENTS],
+    }
+
+
+def serialize_full(cache_msg: dict) -> dict:
+    """Full form: every field so operators can inspect the formatter output verbatim."""
     return {
         "author": cache_msg.get("author"),
-        "fragments": [frag.to_dict() for frag in fragments],
+        "fragments": [frag.to_dict() for frag in cache_msg.get("fragments") or _NO_FRAGMENTS],
     }
 
 
-def copy_memo_entry(cache_msg: dict | None) -> dict:
-    """Return a shallow copy of ``cache_msg`` safe for callers."""
+def serialize_markdown(cache_msg: dict) -> dict:
+    """Markdown form: one natural-language bullet per fragment."""
+    return {
+        "author": cache_msg.get("author"),
+        "fragments": [frag.to_markdown() for frag in cache_msg.get("fragments") or _NO_FRAGMENTS],
+    }
+
+
+SERIALIZERS: dict[str, Callable[[dict], dict]] = {
+    "llm": serialize_llm,
+    "full": serialize_full,
+    "markdown": serialize_markdown,
+}
+
+
+def serialize(cache_msg: dict, mode: Mode) -> dict:
+    """
+    Serialize ``cache_msg`` for the requested ``mode``.
+
+    Unknown modes fall back to the full form. Callers serializing many entries
+    should resolve the function once via :data:`SERIALIZERS` instead.
+    """
+
+    return SERIALIZERS.get(mode, serialize_full)(cache_msg)
+
+
+class MemoEntry:
+    """
+    Read-only view of a memo record that shares the live fragment sequence.
+
+    Exposes ``get`` so it can stand in for the memo dict on read paths such as
+    ingestion; use :meth:`as_dict` when a plain dictionary is required.
+    """
+
+    __slots__ = ("author", "fragments")
+
+    def __init__(self, author: str | None, fragments: Sequence) -> None:
+        self.author = author
+        self.fragments = fragments
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key == "author":
+            return self.author
+        if key == "fragments":
+            return self.fragments
+        return default
+
+    def as_dict(self) -> dict:
+        return {"author": self.author, "fragments": list(self.fragments)}
+
+
+_EMPTY = MemoEntry(None, ())
+
+
+def copy_memo_entry(cache_msg: dict | None, *, mutable: bool = True) -> dict | MemoEntry:
+    """
+    Return a shallow copy of ``cache_msg`` safe for callers.
+
+    With ``mutable=False`` a :class:`MemoEntry` view is returned instead, skipping
+    the dict and fragment-list copies for callers that only read.
+    """
 
+    if not mutable:
+        if cache_msg is None:
+            return _EMPTY
+        return MemoEntry(cache_msg.get("author"), cache_msg.get("fragments") or _NO_FRAGMENTS)
     if cache_msg is None:
         # Provide a predictable empty skeleton for callers expecting fragment-like structures.
         return {"author": None, "fragments": []}
     return {
         "author": cache_msg.get("author"),
-        "fragments": list(cache_msg.get("fragments", [])),
+        "fragments": list(cache_msg.get("fragments") or _NO_FRAGMENTS),
     }
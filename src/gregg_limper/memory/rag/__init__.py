@@ -8,9 +8,9 @@ Stable, async API for medium/long-term recall. Import from here::
 """
 
 from __future__ import annotations
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 import json
-import asyncio
+import orjson
 import time
 
 from gregg_limper.config import core as core_cfg, milvus
@@ -18,23 +18,31 @@ from gregg_limper.config import core as core_cfg, milvus
 from .sql import db as _db
 from .sql.repositories import FragmentsRepo as _FragmentsRepo, MetaRepo as _MetaRepo
 from .vector.search import vector_search as _vector_search
-from .sql.admin import retention_prune as _retention_prune, vacuum as _vacuum
+from .sql.admin import (
+    checkpoint as _checkpoint,
+    retention_prune as _retention_prune,
+    vacuum as _vacuum,
+)
 from .vector import vector_index as _vector_index
+from . import embed_cache as _embed_cache
 
 # Limit the public surface (keeps star-imports clean)
 __all__ = [
     "ingest_cache_message",
     "message_exists",
+    "messages_exist",
     "vector_search",
     "fetch_vectors_for_index",
     "channel_summary",
     "user_profile",
+    "user_profiles",
     "server_stylesheet",
     "set_user_profile",
     "set_server_stylesheet",
     "set_channel_summary",
     "retention_prune",
     "vacuum",
+    "checkpoint",
     "purge_user",
 ]
 
@@ -48,10 +56,23 @@ with _conn:
         "INSERT OR IGNORE INTO rag_consent(user_id, ts) VALUES(?, ?)",
         (core_cfg.BOT_USER_ID, time.time()),
     )
-_db_lock = asyncio.Lock()
 
-_frag_repo = _FragmentsRepo(_conn, _db_lock)
-_meta_repo = _MetaRepo(_conn, _db_lock)
+_frag_repo = _FragmentsRepo(_conn)
+_embed_cache.bind(_conn)
+_meta_repo = _MetaRepo(_conn)
+
+
+def _dumps(blob: Any) -> str:
+    # orjson writes UTF-8 directly, matching the old ensure_ascii=False output.
+    return orjson.dumps(blob, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _loads(s: str) -> Any:
+    try:
+        return orjson.loads(s)
+    except orjson.JSONDecodeError:
+        # Blobs written by json.dumps may hold NaN/Infinity, which orjson rejects.
+        return json.loads(s)
 
 # --- Public async-friendly API ----------------------------------------------
 
@@ -61,6 +82,12 @@ async def message_exists(message_id: int) -> bool:
     """
     return await _frag_repo.message_exists(message_id)
 
+async def messages_exist(message_ids: Sequence[int]) -> set[int]:
+    """
+    Return the subset of ``message_ids`` that exist in the SQL database.
+    """
+    return await _frag_repo.messages_exist(message_ids)
+
 async def ingest_cache_message(
     server_id: int,
     channel_id: int,
@@ -117,15 +144,16 @@ async def vector_search(
     )
 
 
-async def fetch_vectors_for_index(*, conn=None, lock=None):
+async def fetch_vectors_for_index(*, conn=None):
     """
-    Fetch all stored fragment vectors.
+    Stream all stored fragment vectors in batches.
 
-    Optional ``conn`` and ``lock`` parameters allow callers to supply their own
-    database connection and lock, primarily for testing.
+    An optional ``conn`` parameter allows callers to supply their own database
+    connection, primarily for testing.
     """
-    repo = _frag_repo if conn is None or lock is None else _FragmentsRepo(conn, lock)
-    return await repo.fetch_vectors_for_index()
+    repo = _frag_repo if conn is None else _FragmentsRepo(conn)
+    async for batch in repo.fetch_vectors_for_index():
+        yield batch
 
 
 # --- Metadata ---------------------------------------------------------------
@@ -148,7 +176,18 @@ async def user_profile(user_id: int) -> Dict[str, Any]:
     :returns: Decoded JSON dict or empty dict.
     """
     s = await _meta_repo.get_user_profile(user_id)
-    return json.loads(s) if s else {}
+    return _loads(s) if s else {}
+
+
+async def user_profiles(user_ids: Sequence[int]) -> Dict[int, Dict[str, Any]]:
+    """
+    Get stored profile blobs for several users in one query.
+
+    :param user_ids: User ids.
+    :returns: Mapping of user id to decoded JSON dict; users without a profile are omitted.
+    """
+    blobs = await _meta_repo.get_user_profiles(user_ids)
+    return {uid: _loads(s) for uid, s in blobs.items() if s}
 
 
 async def server_stylesheet(server_id: int) -> Optional[Dict[str, Any]]:
@@ -159,7 +198,7 @@ async def server_stylesheet(server_id: int) -> Optional[Dict[str, Any]]:
     :returns: Decoded JSON dict or None.
     """
     s = await _meta_repo.get_server_style(server_id)
-    return json.loads(s) if s else None
+    return _loads(s) if s else None
 
 
 async def set_user_profile(user_id: int, blob: Dict[str, Any]) -> None:
@@ -169,7 +208,7 @@ async def set_user_profile(user_id: int, blob: Dict[str, Any]) -> None:
     :param user_id: User id.
     :param blob: JSON-serializable dict.
     """
-    await _meta_repo.set_user_profile(user_id, json.dumps(blob, ensure_ascii=False))
+    await _meta_repo.set_user_profile(user_id, _dumps(blob))
 
 
 async def set_server_stylesheet(server_id: int, blob: Dict[str, Any]) -> None:
@@ -179,7 +218,7 @@ async def set_server_stylesheet(server_id: int, blob: Dict[str, Any]) -> None:
     :param server_id: Server (guild) id.
     :param blob: JSON-serializable dict.
     """
-    await _meta_repo.set_server_style(server_id, json.dumps(blob, ensure_ascii=False))
+    await _meta_repo.set_server_style(server_id, _dumps(blob))
 
 
 async def set_channel_summary(channel_id: int, summary: str) -> None:
@@ -216,8 +255,7 @@ async def purge_user(author_id: int) -> int:
             )
         return ids, cur.rowcount
 
-    async with _db_lock:
-        ids, count = await asyncio.to_thread(_run)
+    ids, count = await _db.run_sql(_run)
 
     if milvus.ENABLE_MILVUS:
         try:
@@ -236,12 +274,18 @@ async def retention_prune(older_than_seconds: float) -> int:
     :param older_than_seconds: Age threshold in seconds.
     :returns: Number of rows deleted.
     """
-    return await _retention_prune(_conn, _db_lock, older_than_seconds)
+    return await _retention_prune(_conn, older_than_seconds)
 
 
 async def vacuum() -> None:
     """
     Run ``VACUUM`` and ``ANALYZE`` on the database.
     """
-    await _vacuum(_conn, _db_lock)
+    await _vacuum(_conn)
 
+
+async def checkpoint() -> None:
+    """
+    Run a passive WAL checkpoint on the database.
+    """
+    await _checkpoint(_conn)
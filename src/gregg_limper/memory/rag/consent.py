@@ -1,14 +1,54 @@
+"""
+Consent registry with an in-memory mirror.
+
+Consent is checked for every message, but the opted-in set is tiny and only
+changes through :func:`add_user`/:func:`remove_user`. The first lookup loads the
+whole ``rag_consent`` table into a set; later checks are set lookups and writes
+update the set after they commit. This assumes a single bot process owns the
+database; call :func:`invalidate_cache` after writing consent rows elsewhere.
+"""
+
 from __future__ import annotations
+from typing import Sequence
 from .sql.repositories import ConsentRepo as _ConsentRepo
-from . import _conn, _db_lock
+from . import _conn
+
+_repo = _ConsentRepo(_conn)
+
+_CACHE: set[int] | None = None
+
+
+async def _ensure_cache() -> set[int]:
+    global _CACHE
+    if _CACHE is None:
+        users = await _repo.all_users()
+        # A concurrent loader may have won while we awaited; keep the first set.
+        if _CACHE is None:
+            _CACHE = users
+    return _CACHE
+
+
+def invalidate_cache() -> None:
+    """Drop the in-memory mirror so the next check reloads from SQLite."""
+    global _CACHE
+    _CACHE = None
 
-_repo = _ConsentRepo(_conn, _db_lock)
 
 async def is_opted_in(user_id: int) -> bool:
-    return await _repo.is_opted_in(user_id)
+    return user_id in await _ensure_cache()
+
+async def are_opted_in(user_ids: Sequence[int]) -> set[int]:
+    cache = await _ensure_cache()
+    return {uid for uid in user_ids if uid in cache}
 
 async def add_user(user_id: int) -> bool:
-    return await _repo.add_user(user_id)
+    # Load first so the mirror cannot be populated from a pre-write read.
+    cache = await _ensure_cache()
+    added = await _repo.add_user(user_id)
+    cache.add(user_id)
+    return added
 
 async def remove_user(user_id: int) -> None:
+    cache = await _ensure_cache()
     await _repo.remove_user(user_id)
+    cache.discard(user_id)
@@ -0,0 +1,83 @@
+"""
+Query embedding cache
+=====================
+
+Search queries repeat (the same tool query across turns), so their embeddings
+are memoized: an in-memory LRU in front of the
+``embedding_cache`` SQLite table, keyed by ``blake16("<model>:<text>")`` so a
+model change never serves stale vectors. Failed (all-zero) embeddings are never
+cached.
+
+The persistent tier is attached with :func:`bind` once the RAG connection
+exists; until then only the in-memory tier is used. Maintenance
+(:mod:`.sql.sql_tasks`) trims it to ``rag.EMBED_CACHE_PERSIST`` rows.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import logging
+
+import numpy as np
+
+from gregg_limper.config import rag
+from .embeddings import blake16, embed, from_bytes, to_bytes
+from .sql.repositories import EmbeddingCacheRepo
+
+logger = logging.getLogger(__name__)
+
+_mem: OrderedDict[str, np.ndarray] = OrderedDict()
+_repo: EmbeddingCacheRepo | None = None
+
+
+def bind(conn) -> None:
+    """Persist cache entries through ``conn``."""
+    global _repo
+    _repo = EmbeddingCacheRepo(conn)
+
+
+def clear() -> None:
+    """Drop the in-memory tier (the SQLite tier is left alone)."""
+    _mem.clear()
+
+
+def _remember(key: str, vec: np.ndarray) -> None:
+    _mem[key] = vec
+    _mem.move_to_end(key)
+    while len(_mem) > rag.EMBED_CACHE_SIZE:
+        _mem.popitem(last=False)
+
+
+async def embed_cached(text: str) -> np.ndarray:
+    """
+    Return the embedding for ``text``, reusing a cached vector when possible.
+
+    :param text: Input string to embed.
+    :returns: ``np.ndarray`` of shape ``(EMB_DIM,)``; zeros if embedding failed.
+    """
+    key = blake16(f"{rag.EMB_MODEL_ID}:{text.strip()}")
+    vec = _mem.get(key)
+    if vec is not None:
+        _mem.move_to_end(key)
+        return vec
+
+    if _repo is not None:
+        try:
+            blob = await _repo.get(key)
+        except Exception as e:
+            logger.warning("Embedding cache read failed: %s", e)
+            blob = None
+        if blob is not None and len(blob) == rag.EMB_DIM * 4:
+            vec = from_bytes(blob)
+            _remember(key, vec)
+            return vec
+
+    vec = await embed(text)
+    if np.any(vec):
+        _remember(key, vec)
+        if _repo is not None:
+            try:
+                await _repo.put(key, to_bytes(vec))
+            except Exception as e:
+                logger.warning("Embedding cache write failed: %s", e)
+    return vec
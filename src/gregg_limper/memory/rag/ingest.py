@@ -40,7 +40,7 @@ async def project_and_upsert(
     :param cache_message: Dict produced by :func:`formatter.format_message`.
     :returns: ``None``.
     """
-    frags = cache_message.get("fragments") or []
+    frags = cache_message.get("fragments") or ()
 
     # Collect fragment data for embedding
     prep: list[Dict] = []
@@ -68,6 +68,8 @@ async def project_and_upsert(
         # Embed fragments concurrently; network failures yield exceptions
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
+    rows: list[tuple] = []
+    vecs: list[np.ndarray] = []
     for p, vec in zip(prep, results):
         embed_ts = time.time()
         if isinstance(vec, Exception):
@@ -89,8 +91,7 @@ async def project_and_upsert(
             source_idx=p["i"],
         )
 
-        # Upsert into SQL db
-        await repo.insert_or_update_fragment((
+        rows.append((
             server_id,
             channel_id,
             message_id,
@@ -108,7 +109,12 @@ async def project_and_upsert(
             p["content_h"],
             embed_ts,
         ))
+        vecs.append(vec)
 
+    # Upsert every fragment of the message into SQL in one transaction
+    await repo.insert_or_update_fragments(rows)
+
+    for p, vec in zip(prep, vecs):
         # Insert into vector index if enabled
         rid = await repo.lookup_fragment_id(message_id, p["i"], p["typ"], p["content_h"])
         if rid is not None:
@@ -134,4 +140,3 @@ async def project_and_upsert(
                 p["i"],
                 p["typ"],
             )
-
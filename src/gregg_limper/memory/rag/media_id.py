@@ -9,7 +9,7 @@ Functions here generate deterministic IDs for assets
 """
 
 from __future__ import annotations
-from typing import Dict, Optional, Any
+from typing import Any, Dict, Iterable, List, Optional
 from urllib.parse import urlparse, parse_qs, parse_qsl, urlencode
 import re
 from .embeddings import blake16
@@ -76,6 +76,45 @@ def stable_media_id(
     :param source_idx: Index within source message.
     :returns: Stable identifier string.
     """
+    return _resolve_media_id(
+        cf,
+        message_id=message_id,
+        source_idx=source_idx,
+        prov_prefix=f"{server_id}:{channel_id}:{message_id}",
+    )
+
+
+def stable_media_ids(
+    cfs: Iterable[Dict[str, Any]],
+    *,
+    server_id: int,
+    channel_id: int,
+    message_id: int,
+) -> List[str]:
+    """
+    Batch form of :func:`stable_media_id` for every fragment of one message.
+
+    The provenance prefix is built once and each fragment's ``source_idx`` is
+    its position in ``cfs``. Results match per-fragment calls exactly.
+
+    :param cfs: Serialized fragment dicts in source order.
+    :param server_id: Discord server id.
+    :param channel_id: Channel id.
+    :param message_id: Source message id.
+    :returns: Stable identifier strings aligned with ``cfs``.
+    """
+    prov_prefix = f"{server_id}:{channel_id}:{message_id}"
+    return [
+        _resolve_media_id(
+            cf, message_id=message_id, source_idx=idx, prov_prefix=prov_prefix
+        )
+        for idx, cf in enumerate(cfs)
+    ]
+
+
+def _resolve_media_id(
+    cf: Dict[str, Any], *, message_id: int, source_idx: int, prov_prefix: str
+) -> str:
     typ = (cf.get("type") or "").strip()
     url = _normalize_url(cf.get("url"))
 
@@ -99,5 +138,5 @@ def stable_media_id(
         return f"msg:{message_id}:{source_idx}:{typ}"
 
     # Absolute fallback (should rarely fire)
-    prov = f"{server_id}:{channel_id}:{message_id}:{source_idx}:{typ}:{cf.get('title') or ''}"
+    prov = f"{prov_prefix}:{source_idx}:{typ}:{cf.get('title') or ''}"
     return f"fallback:{blake16(prov)}"
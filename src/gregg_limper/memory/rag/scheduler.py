@@ -9,7 +9,7 @@ from gregg_limper.maintenance import startup as _startup, shutdown as _shutdown
 from gregg_limper.config import rag, milvus
 from .sql import sql_tasks
 from .vector import vector_tasks
-from . import _conn as _default_conn, _db_lock as _default_lock
+from . import _conn as _default_conn
 import logging
 
 logger = logging.getLogger(__name__)
@@ -18,34 +18,32 @@ _sql_task: asyncio.Task | None = None
 _vec_task: asyncio.Task | None = None
 
 
-async def start(interval: float = 3600, *, conn=None, lock=None) -> Tuple[asyncio.Task, asyncio.Task]:
+async def start(interval: float = 3600, *, conn=None) -> Tuple[asyncio.Task, asyncio.Task]:
     """
     Run maintenance once and schedule periodic cycles.
 
     :param interval: Seconds between maintenance passes.
     :param conn: Optional SQLite connection for testing.
-    :param lock: Optional lock guarding ``conn``.
     :returns: ``(sql_task, vector_task)`` handles.
     """
     global _sql_task, _vec_task
 
     conn = conn or _default_conn
-    lock = lock or _default_lock
 
     # Run one cycle immediately
     logger.info("Starting SQL maintenance (interval=%ds)", rag.MAINTENANCE_INTERVAL)
-    await sql_tasks.run(conn, lock)
+    await sql_tasks.run(conn)
 
     if milvus.ENABLE_MILVUS:
         logger.info("Starting vector maintenance (interval=%ds)", rag.MAINTENANCE_INTERVAL)
-        await vector_tasks.run(conn, lock)
+        await vector_tasks.run(conn)
     else:
         logger.info("ENABLE_MILVUS is false; skipping vector maintenance")
 
     if not _sql_task or _sql_task.done():
         async def _sql_loop():
             logger.info("Starting SQL maintenance (interval=%ds)", rag.MAINTENANCE_INTERVAL)
-            await sql_tasks.run(conn, lock)
+            await sql_tasks.run(conn)
 
         _sql_task = await _startup(_sql_loop, interval)
 
@@ -55,7 +53,7 @@ async def start(interval: float = 3600, *, conn=None, lock=None) -> Tuple[asynci
                 logger.info(
                     "Starting vector maintenance (interval=%ds)", rag.MAINTENANCE_INTERVAL
                 )
-                await vector_tasks.run(conn, lock)
+                await vector_tasks.run(conn)
 
             _vec_task = await _startup(_vec_loop, interval)
     else:
@@ -1,41 +1,48 @@
 """
-Maintenance helpers: retention and vacuum
-=========================================
+Maintenance helpers: retention, vacuum, and WAL checkpoints
+===========================================================
 """
 
 from __future__ import annotations
 import time
-import asyncio
-
-async def retention_prune(
-    conn,
-    lock: asyncio.Lock,
-    older_than_seconds: float, 
-    vacuum: bool = False
-) -> int:
+
+from .db import run_sql, wal_checkpoint_passive
+
+async def retention_prune(conn, older_than_seconds: float) -> int:
     # TODO: Schedule this helper from maintenance once automated pruning is implemented.
     def _run():
         cutoff = time.time() - older_than_seconds
         with conn:
-            conn.execute(
-                "DELETE FROM fragments WHERE rowid IN (SELECT id FROM fragments WHERE ts < ?)",
-                (cutoff,),
-            )
+            # Single indexed delete (idx_frag_ts); there is no FTS shadow table to sync.
             cur = conn.execute("DELETE FROM fragments WHERE ts < ?", (cutoff,))
-            if vacuum:
-                conn.execute("INSERT INTO fragments(fragments) VALUES('optimize')")
 
         return cur.rowcount
     
-    async with lock:
-        return await asyncio.to_thread(_run)
+    return await run_sql(_run)
+
+def _optimize(conn) -> None:
+    conn.execute("PRAGMA optimize")
 
-async def vacuum(conn, lock: asyncio.Lock) -> None:
+async def optimize(conn) -> None:
+    """
+    Refresh query-planner statistics where SQLite deems it worthwhile.
+
+    Can rescan whole indexes, so it belongs with :func:`vacuum` rather than
+    on the per-prune path.
+    """
+    await run_sql(_optimize, conn)
+
+async def vacuum(conn) -> None:
     # TODO: hook this into a background task so periodic VACUUM/ANALYZE runs automatically.
     def _run():
         conn.execute("VACUUM")
         conn.execute("ANALYZE")
+        _optimize(conn)
+        wal_checkpoint_passive(conn)
     
-    async with lock:
-        await asyncio.to_thread(_run)
+    await run_sql(_run)
+
+async def checkpoint(conn) -> None:
+    """Run a passive WAL checkpoint so the log does not grow unbounded."""
+    await run_sql(wal_checkpoint_passive, conn)
 
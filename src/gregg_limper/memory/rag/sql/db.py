@@ -4,13 +4,32 @@ SQLite bootstrap and connection helpers
 
 - Database location configured via ``rag.SQL_DB_DIR``.
 - WAL + pragmatic PRAGMAs for decent concurrent read perf.
+- All blocking sqlite work runs on one dedicated thread via :func:`run_sql`,
+  which serializes access structurally instead of through an asyncio lock.
 """
 
 from __future__ import annotations
 from gregg_limper.config import rag
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import asyncio
+import functools
+import logging
 import sqlite3
-from typing import Optional
+from typing import Any, Callable, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Single writer thread: every sqlite call is queued here, in submission order.
+_SQL_EXEC = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rag-sql")
+
+
+async def run_sql(fn: Callable[..., T], *args: Any) -> T:
+    """Run blocking sqlite work ``fn(*args)`` on the dedicated SQL thread."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_SQL_EXEC, functools.partial(fn, *args))
 
 
 def db_path() -> str:
@@ -26,17 +45,22 @@ def connect(path: Optional[str] = None) -> sqlite3.Connection:
         isolation_level=None,
         check_same_thread=False,
         detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
+        # Room for every repo query plus the IN (...) chunk variants.
+        cached_statements=256,
     )
 
     # Pragmas: order matters a bit; set WAL first, then tuning.
-    conn.execute("PRAGMA journal_mode=WAL;")
+    mode = conn.execute("PRAGMA journal_mode=WAL;").fetchone()[0]
+    if str(mode).lower() != "wal":
+        # e.g. in-memory databases; writers will block readers on this connection.
+        logger.warning("SQLite journal_mode is %s, expected wal", mode)
     conn.execute("PRAGMA synchronous=NORMAL;")
     conn.execute("PRAGMA foreign_keys=ON;")
     conn.execute("PRAGMA temp_store=MEMORY;")
     conn.execute("PRAGMA cache_size=-65536;")    # ~64 MiB page cache
     conn.execute("PRAGMA mmap_size=268435456;")  # 256 MiB
     # Reduce SQLITE_BUSY errors under contention
-    conn.execute("PRAGMA busy_timeout=3000;")    # 3s
+    conn.execute("PRAGMA busy_timeout=5000;")    # 5s
 
     # dict-like rows
     conn.row_factory = sqlite3.Row
@@ -55,6 +79,12 @@ def migrate(conn: sqlite3.Connection) -> None:
         conn.executescript(sql)
 
 
+def wal_checkpoint_passive(conn: sqlite3.Connection) -> None:
+    """Checkpoint as much of the WAL as possible without blocking readers or writers."""
+    # Cheap enough to run every maintenance pass; prevents checkpoint starvation.
+    conn.execute("PRAGMA wal_checkpoint(PASSIVE);")
+
+
 def wal_checkpoint_truncate(conn: sqlite3.Connection) -> None:
     """Run a WAL checkpoint + truncate to keep WAL from growing unbounded."""
     # Safe to run periodically (e.g., on shutdown or a background maintenance task)
@@ -5,18 +5,114 @@ Repositories (SQL-only)
 """
 
 from __future__ import annotations
-from typing import Any, Optional, Sequence, Tuple
-import asyncio
+from typing import Any, AsyncIterator, Optional, Sequence, Tuple
 import sqlite3
 import time
 
+import orjson
 
-class FragmentsRepo:
-    """Async CRUD helpers for the ``fragments`` table."""
+from .db import run_sql
+
+# Max ids bound per ``IN (...)`` query; SQLite's default variable limit is 999.
+_IN_CHUNK = 900
+
+# SQL lives in class-level constants shared by every caller of a query, and
+# methods hand the statement to :meth:`_Repo._exec` rather than defining a
+# closure per call. Statement reuse itself comes from the connection's
+# ``cached_statements`` size (see :func:`.db.connect`), which keys on SQL text.
+
+
+class _Repo:
+    """Shared plumbing: run one statement on the SQL thread."""
 
-    def __init__(self, conn: sqlite3.Connection, lock: asyncio.Lock):
+    def __init__(self, conn: sqlite3.Connection):
         self.conn = conn
-        self._lock = lock
+
+    def _run(self, sql: str, params: Any, mode: str) -> Any:
+        # Runs on the SQL thread; ``mode`` picks the result shape.
+        if mode == "one":
+            return self.conn.execute(sql, params).fetchone()
+        if mode == "all":
+            return self.conn.execute(sql, params).fetchall()
+        with self.conn:
+            if mode == "many":
+                cur = self.conn.executemany(sql, params)
+            else:
+                cur = self.conn.execute(sql, params)
+        return cur.rowcount
+
+    async def _exec(self, sql: str, params: Any = (), mode: str = "write") -> Any:
+        """
+        Run ``sql`` on the dedicated SQL thread.
+
+        :param mode: ``"one"``/``"all"`` fetch rows; ``"write"``/``"many"`` run
+            ``execute``/``executemany`` in a transaction and return the rowcount.
+        """
+        return await run_sql(self._run, sql, params, mode)  # blocking sqlite call
+
+    def _existing(self, sql_prefix: str, ids: list[int]) -> set[int]:
+        """Return the values of column 0 for ``ids`` matched by ``sql_prefix IN (...)``."""
+        found: set[int] = set()
+        # Stay under SQLite's default bound-parameter limit.
+        for start in range(0, len(ids), _IN_CHUNK):
+            chunk = ids[start:start + _IN_CHUNK]
+            sql = f"{sql_prefix} IN ({','.join(['?'] * len(chunk))})"
+            found.update(int(r[0]) for r in self.conn.execute(sql, chunk))
+        return found
+
+
+class FragmentsRepo(_Repo):
+    """Async CRUD helpers for the ``fragments`` table."""
+
+    _UPSERT_SQL = """
+        INSERT INTO fragments (
+          server_id, channel_id, message_id, author_id, ts,
+          content, type, title, url, media_id,
+          embedding, emb_model, emb_dim,
+          source_idx, content_hash, last_embedded_ts
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(message_id, source_idx, type, content_hash) DO UPDATE SET
+          content=excluded.content,
+          title=excluded.title,
+          url=excluded.url,
+          media_id=excluded.media_id,
+          embedding=excluded.embedding,
+          emb_model=excluded.emb_model,
+          emb_dim=excluded.emb_dim,
+          ts=excluded.ts,
+          last_embedded_ts=excluded.last_embedded_ts
+    """
+
+    _UPDATE_EMB_SQL = """
+        UPDATE fragments
+        SET embedding=?, emb_model=?, emb_dim=?, last_embedded_ts=?
+        WHERE id=?
+    """
+
+    _LOOKUP_SQL = """
+        SELECT id FROM fragments
+        WHERE message_id=? AND source_idx=? AND type=? AND content_hash=?
+    """
+
+    _EXISTS_SQL = "SELECT 1 FROM fragments WHERE message_id=? LIMIT 1"
+
+    _EXISTING_PREFIX = "SELECT DISTINCT message_id FROM fragments WHERE message_id"
+
+    _RECENT_SQL = """
+        SELECT id, content, type, ts, embedding
+        FROM fragments
+        WHERE server_id=? AND channel_id=? AND ts>=?
+        ORDER BY ts DESC LIMIT ?
+    """
+
+    _BY_IDS_SQL = """
+        SELECT id, server_id, channel_id, message_id, author_id, ts,
+               content, type, title, url, media_id, source_idx
+        FROM fragments
+        WHERE id IN (SELECT value FROM json_each(?))
+    """
+
+    _VECTORS_SQL = "SELECT id, server_id, channel_id, embedding FROM fragments"
 
     async def insert_or_update_fragment(self, row: tuple[Any, ...]) -> None:
         """
@@ -24,30 +120,17 @@ class FragmentsRepo:
 
         :param row: Column values matching the table schema.
         """
-        sql = """
-            INSERT INTO fragments (
-              server_id, channel_id, message_id, author_id, ts,
-              content, type, title, url, media_id,
-              embedding, emb_model, emb_dim,
-              source_idx, content_hash, last_embedded_ts
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(message_id, source_idx, type, content_hash) DO UPDATE SET
-              content=excluded.content,
-              title=excluded.title,
-              url=excluded.url,
-              media_id=excluded.media_id,
-              embedding=excluded.embedding,
-              emb_model=excluded.emb_model,
-              emb_dim=excluded.emb_dim,
-              ts=excluded.ts,
-              last_embedded_ts=excluded.last_embedded_ts
-        """
-        def _run():
-            with self.conn:
-                self.conn.execute(sql, row)
-
-        async with self._lock:
-            await asyncio.to_thread(_run)  # blocking sqlite call
+        await self.insert_or_update_fragments([row])
+
+    async def insert_or_update_fragments(self, rows: Sequence[tuple[Any, ...]]) -> None:
+        """
+        Insert or update many fragment rows in a single transaction.
+
+        :param rows: Column tuples matching the table schema.
+        """
+        if not rows:
+            return
+        await self._exec(self._UPSERT_SQL, rows, "many")
 
     async def update_embedding(self, rid: int, emb: bytes, model: str, dim: int) -> None:
         """
@@ -58,17 +141,7 @@ class FragmentsRepo:
         :param model: Embedding model id.
         :param dim: Embedding dimension.
         """
-        sql = """
-            UPDATE fragments
-            SET embedding=?, emb_model=?, emb_dim=?, last_embedded_ts=?
-            WHERE id=?
-        """
-        def _run():
-            with self.conn:
-                self.conn.execute(sql, (emb, model, dim, time.time(), rid))
-        
-        async with self._lock:
-            await asyncio.to_thread(_run)
+        await self._exec(self._UPDATE_EMB_SQL, (emb, model, dim, time.time(), rid))
 
     async def lookup_fragment_id(
         self,
@@ -78,28 +151,22 @@ class FragmentsRepo:
         content_hash: str,
     ) -> Optional[int]:
         """Return fragment id for a (message, index, type, hash) tuple."""
-        sql = """
-            SELECT id FROM fragments
-            WHERE message_id=? AND source_idx=? AND type=? AND content_hash=?
-        """
+        row = await self._exec(
+            self._LOOKUP_SQL, (message_id, source_idx, typ, content_hash), "one"
+        )
+        return row[0] if row else None
 
-        def _query() -> Optional[int]:
-            row = self.conn.execute(sql, (message_id, source_idx, typ, content_hash)).fetchone()
-            return row[0] if row else None
-
-        async with self._lock:
-            return await asyncio.to_thread(_query)  # blocking sqlite call
-        
     async def message_exists(self, message_id: int) -> bool:
         """Return True if any fragment exists for the given message id."""
-        sql = "SELECT 1 FROM fragments WHERE message_id=? LIMIT 1"
-
-        def _query() -> bool:
-            return self.conn.execute(sql, (message_id,)).fetchone() is not None
-        
-        async with self._lock:
-            return await asyncio.to_thread(_query)  # blocking sqlite call
-        
+        return await self._exec(self._EXISTS_SQL, (message_id,), "one") is not None
+
+    async def messages_exist(self, message_ids: Sequence[int]) -> set[int]:
+        """Return the subset of ``message_ids`` that have at least one fragment."""
+        ids = list(dict.fromkeys(message_ids))
+        if not ids:
+            return set()
+        return await run_sql(self._existing, self._EXISTING_PREFIX, ids)  # blocking sqlite call
+
     async def rows_recent(
         self,
         server_id: int,
@@ -108,56 +175,67 @@ class FragmentsRepo:
         limit: int = 300,
     ) -> Sequence[Tuple]:
         """Return rows newer than ``time_min`` for a channel."""
-        sql = """
-            SELECT id, content, type, ts, embedding
-            FROM fragments
-            WHERE server_id=? AND channel_id=? AND ts>=?
-            ORDER BY ts DESC LIMIT ?
-        """
-        def _query():
-            return self.conn.execute(sql, (server_id, channel_id, time_min, limit)).fetchall()
-
-        async with self._lock:
-            return await asyncio.to_thread(_query)  # blocking sqlite call
+        return await self._exec(
+            self._RECENT_SQL, (server_id, channel_id, time_min, limit), "all"
+        )
 
     async def rows_by_ids(self, ids: list[int]) -> Sequence[Tuple]:
         """Fetch rows by primary key list."""
         if not ids:
             return []
-        ph = ",".join(["?"] * len(ids))
-        sql = f"""
-            SELECT id, server_id, channel_id, message_id, author_id, ts,
-                   content, type, title, url, media_id, source_idx
-            FROM fragments
-            WHERE id IN ({ph})
+        # One JSON array parameter: a single cached statement for any list size.
+        payload = orjson.dumps([int(i) for i in ids]).decode()
+        return await self._exec(self._BY_IDS_SQL, (payload,), "all")
+
+    def _open_vectors(self, batch_size: int) -> sqlite3.Cursor:
+        cur = self.conn.execute(self._VECTORS_SQL)
+        cur.arraysize = batch_size
+        return cur
+
+    async def fetch_vectors_for_index(
+        self, batch_size: int = 1000
+    ) -> AsyncIterator[Sequence[Tuple[int, int, int, bytes]]]:
         """
-        def _query():
-            return self.conn.execute(sql, ids).fetchall()
+        Yield ``(id, server_id, channel_id, embedding)`` rows for vector sync.
 
-        async with self._lock:
-            return await asyncio.to_thread(_query)  # blocking sqlite call
-
-    async def fetch_vectors_for_index(self) -> Sequence[Tuple[int, int, int, bytes]]:
-        """Return ``(id, server_id, channel_id, embedding)`` rows for vector sync."""
-        sql = "SELECT id, server_id, channel_id, embedding FROM fragments"
-
-        def _query() -> list[tuple[int, int, int, bytes]]:
-            rows = self.conn.execute(sql).fetchall()
-            return [
-                (int(r["id"]), int(r["server_id"]), int(r["channel_id"]), r["embedding"])
-                for r in rows
-            ]
-
-        async with self._lock:
-            return await asyncio.to_thread(_query)  # blocking sqlite call
-
-
-class MetaRepo:
+        Rows are streamed from one cursor in batches of ``batch_size`` so a full
+        index rebuild never holds every embedding blob in memory at once.
+        """
+        cur = await run_sql(self._open_vectors, batch_size)  # blocking sqlite call
+        try:
+            while True:
+                batch = await run_sql(cur.fetchmany)
+                if not batch:
+                    return
+                yield batch
+        finally:
+            await run_sql(cur.close)
+
+
+class MetaRepo(_Repo):
     """Repository for miscellaneous metadata tables."""
 
-    def __init__(self, conn: sqlite3.Connection, lock: asyncio.Lock):
-        self.conn = conn
-        self._lock = lock
+    _SET_PROFILE_SQL = """
+        INSERT INTO user_profiles(user_id, blob) VALUES(?, ?)
+        ON CONFLICT(user_id) DO UPDATE SET blob=excluded.blob
+    """
+    _GET_PROFILE_SQL = "SELECT blob FROM user_profiles WHERE user_id=?"
+    _GET_PROFILES_SQL = """
+        SELECT user_id, blob FROM user_profiles
+        WHERE user_id IN (SELECT value FROM json_each(?))
+    """
+
+    _SET_STYLE_SQL = """
+        INSERT INTO server_styles(server_id, blob) VALUES(?, ?)
+        ON CONFLICT(server_id) DO UPDATE SET blob=excluded.blob
+    """
+    _GET_STYLE_SQL = "SELECT blob FROM server_styles WHERE server_id=?"
+
+    _SET_SUMMARY_SQL = """
+        INSERT INTO channel_summaries(channel_id, summary) VALUES(?, ?)
+        ON CONFLICT(channel_id) DO UPDATE SET summary=excluded.summary
+    """
+    _GET_SUMMARY_SQL = "SELECT summary FROM channel_summaries WHERE channel_id=?"
 
     async def set_user_profile(self, user_id: int, blob: str) -> None:
         """
@@ -167,16 +245,7 @@ class MetaRepo:
         :param blob: JSON string representing the profile.
         :returns: ``None``.
         """
-        sql = """
-            INSERT INTO user_profiles(user_id, blob) VALUES(?, ?)
-            ON CONFLICT(user_id) DO UPDATE SET blob=excluded.blob
-        """
-        def _run():
-            with self.conn:
-                self.conn.execute(sql, (user_id, blob))
-
-        async with self._lock:
-            await asyncio.to_thread(_run)
+        await self._exec(self._SET_PROFILE_SQL, (user_id, blob))
 
     async def get_user_profile(self, user_id: int) -> Optional[str]:
         """
@@ -185,14 +254,21 @@ class MetaRepo:
         :param user_id: Discord user id.
         :returns: Stored JSON string or ``None``.
         """
-        def _query() -> Optional[str]:
-            row = self.conn.execute(
-                "SELECT blob FROM user_profiles WHERE user_id=?", (user_id,)
-            ).fetchone()
-            return row[0] if row else None
+        row = await self._exec(self._GET_PROFILE_SQL, (user_id,), "one")
+        return row[0] if row else None
 
-        async with self._lock:
-            return await asyncio.to_thread(_query)
+    async def get_user_profiles(self, user_ids: Sequence[int]) -> dict[int, str]:
+        """
+        Return JSON profile blobs for every stored id in ``user_ids``.
+
+        :param user_ids: Discord user ids.
+        :returns: Mapping of user id to stored JSON string; missing ids are omitted.
+        """
+        if not user_ids:
+            return {}
+        payload = orjson.dumps([int(i) for i in user_ids]).decode()
+        rows = await self._exec(self._GET_PROFILES_SQL, (payload,), "all")
+        return {int(uid): blob for uid, blob in rows}
 
     async def set_server_style(self, server_id: int, blob: str) -> None:
         """
@@ -202,16 +278,7 @@ class MetaRepo:
         :param blob: JSON string representing the style.
         :returns: ``None``.
         """
-        sql = """
-            INSERT INTO server_styles(server_id, blob) VALUES(?, ?)
-            ON CONFLICT(server_id) DO UPDATE SET blob=excluded.blob
-        """
-        def _run():
-            with self.conn:
-                self.conn.execute(sql, (server_id, blob))
-
-        async with self._lock:
-            await asyncio.to_thread(_run)
+        await self._exec(self._SET_STYLE_SQL, (server_id, blob))
 
     async def get_server_style(self, server_id: int) -> Optional[str]:
         """
@@ -220,14 +287,8 @@ class MetaRepo:
         :param server_id: Discord server id.
         :returns: Stored JSON string or ``None``.
         """
-        def _query() -> Optional[str]:
-            row = self.conn.execute(
-                "SELECT blob FROM server_styles WHERE server_id=?", (server_id,)
-            ).fetchone()
-            return row[0] if row else None
-
-        async with self._lock:
-            return await asyncio.to_thread(_query)
+        row = await self._exec(self._GET_STYLE_SQL, (server_id,), "one")
+        return row[0] if row else None
 
     async def set_channel_summary(self, channel_id: int, summary: str) -> None:
         """
@@ -237,16 +298,7 @@ class MetaRepo:
         :param summary: Summary text to store.
         :returns: ``None``.
         """
-        sql = """
-            INSERT INTO channel_summaries(channel_id, summary) VALUES(?, ?)
-            ON CONFLICT(channel_id) DO UPDATE SET summary=excluded.summary
-        """
-        def _run():
-            with self.conn:
-                self.conn.execute(sql, (channel_id, summary))
-
-        async with self._lock:
-            await asyncio.to_thread(_run)
+        await self._exec(self._SET_SUMMARY_SQL, (channel_id, summary))
 
     async def get_channel_summary(self, channel_id: int) -> str:
         """
@@ -255,22 +307,18 @@ class MetaRepo:
         :param channel_id: Channel id.
         :returns: Stored summary text.
         """
-        def _query() -> str:
-            row = self.conn.execute(
-                "SELECT summary FROM channel_summaries WHERE channel_id=?", (channel_id,)
-            ).fetchone()
-            return row[0] if row else ""
+        row = await self._exec(self._GET_SUMMARY_SQL, (channel_id,), "one")
+        return row[0] if row else ""
 
-        async with self._lock:
-            return await asyncio.to_thread(_query)
 
-
-class ConsentRepo:
+class ConsentRepo(_Repo):
     """Simple opt-in/opt-out registry."""
 
-    def __init__(self, conn: sqlite3.Connection, lock: asyncio.Lock):
-        self.conn = conn
-        self._lock = lock
+    _OPTED_IN_SQL = "SELECT 1 FROM rag_consent WHERE user_id=? LIMIT 1"
+    _OPTED_IN_PREFIX = "SELECT user_id FROM rag_consent WHERE user_id"
+    _ALL_SQL = "SELECT user_id FROM rag_consent"
+    _ADD_SQL = "INSERT OR IGNORE INTO rag_consent(user_id, ts) VALUES(?, ?)"
+    _REMOVE_SQL = "DELETE FROM rag_consent WHERE user_id=?"
 
     async def is_opted_in(self, user_id: int) -> bool:
         """
@@ -279,13 +327,28 @@ class ConsentRepo:
         :param user_id: Discord user id.
         :returns: ``True`` if user has opted in.
         """
-        sql = "SELECT 1 FROM rag_consent WHERE user_id=? LIMIT 1"
+        return await self._exec(self._OPTED_IN_SQL, (user_id,), "one") is not None
+
+    async def opted_in_users(self, user_ids: Sequence[int]) -> set[int]:
+        """
+        Return the subset of ``user_ids`` present in consent table.
 
-        def _query() -> bool:
-            return self.conn.execute(sql, (user_id,)).fetchone() is not None
+        :param user_ids: Discord user ids to check.
+        :returns: Ids that have opted in.
+        """
+        ids = list(dict.fromkeys(user_ids))
+        if not ids:
+            return set()
+        return await run_sql(self._existing, self._OPTED_IN_PREFIX, ids)
 
-        async with self._lock:
-            return await asyncio.to_thread(_query)
+    async def all_users(self) -> set[int]:
+        """
+        Return every opted-in user id.
+
+        :returns: Ids present in consent table.
+        """
+        rows = await self._exec(self._ALL_SQL, (), "all")
+        return {int(r[0]) for r in rows}
 
     async def add_user(self, user_id: int) -> bool:
         """
@@ -294,15 +357,7 @@ class ConsentRepo:
         :param user_id: Discord user id.
         :returns: ``True`` if a new row was added.
         """
-        sql = "INSERT OR IGNORE INTO rag_consent(user_id, ts) VALUES(?, ?)"
-
-        def _run() -> bool:
-            with self.conn:
-                cur = self.conn.execute(sql, (user_id, time.time()))
-            return cur.rowcount > 0
-
-        async with self._lock:
-            return await asyncio.to_thread(_run)
+        return await self._exec(self._ADD_SQL, (user_id, time.time())) > 0
 
     async def remove_user(self, user_id: int) -> None:
         """
@@ -311,11 +366,47 @@ class ConsentRepo:
         :param user_id: Discord user id.
         :returns: ``None``.
         """
-        sql = "DELETE FROM rag_consent WHERE user_id=?"
+        await self._exec(self._REMOVE_SQL, (user_id,))
+
+
+class EmbeddingCacheRepo(_Repo):
+    """Persistent half of the query-embedding cache."""
+
+    _GET_SQL = "SELECT embedding FROM embedding_cache WHERE key=?"
+    _PUT_SQL = """
+        INSERT INTO embedding_cache(key, embedding, ts) VALUES(?, ?, ?)
+        ON CONFLICT(key) DO UPDATE SET embedding=excluded.embedding, ts=excluded.ts
+    """
+    _TRIM_SQL = """
+        DELETE FROM embedding_cache WHERE key NOT IN (
+            SELECT key FROM embedding_cache ORDER BY ts DESC LIMIT ?
+        )
+    """
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """
+        Return the stored embedding blob for ``key`` or ``None``.
 
-        def _run() -> None:
-            with self.conn:
-                self.conn.execute(sql, (user_id,))
+        :param key: Cache key.
+        :returns: Raw float32 bytes or ``None``.
+        """
+        row = await self._exec(self._GET_SQL, (key,), "one")
+        return row[0] if row else None
+
+    async def put(self, key: str, blob: bytes) -> None:
+        """
+        Store an embedding blob under ``key``.
+
+        :param key: Cache key.
+        :param blob: Raw float32 bytes.
+        """
+        await self._exec(self._PUT_SQL, (key, blob, time.time()))
+
+    async def trim(self, keep: int) -> int:
+        """
+        Drop all but the ``keep`` most recently written entries.
 
-        async with self._lock:
-            await asyncio.to_thread(_run)
+        :param keep: Number of entries to retain.
+        :returns: Number of rows deleted.
+        """
+        return await self._exec(self._TRIM_SQL, (keep,))
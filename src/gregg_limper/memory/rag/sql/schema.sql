@@ -24,11 +24,24 @@ CREATE TABLE IF NOT EXISTS fragments (
   UNIQUE(message_id, source_idx, type, content_hash)
 );
 
-CREATE INDEX IF NOT EXISTS idx_frag_sc  ON fragments(server_id, channel_id);
+-- The UNIQUE constraint's autoindex already serves lookup_fragment_id and the
+-- message_id existence checks, so a separate message_id index only costs writes.
+-- (server_id, channel_id) is a prefix of idx_frag_chan_ts, which also returns
+-- rows_recent in ts order without a sort step.
+DROP INDEX IF EXISTS idx_frag_msg;
+DROP INDEX IF EXISTS idx_frag_sc;
+
+CREATE INDEX IF NOT EXISTS idx_frag_chan_ts ON fragments(server_id, channel_id, ts DESC);
 CREATE INDEX IF NOT EXISTS idx_frag_ts  ON fragments(ts);
-CREATE INDEX IF NOT EXISTS idx_frag_msg ON fragments(message_id);
 CREATE INDEX IF NOT EXISTS idx_frag_media ON fragments(media_id);
 
+-- Query embeddings keyed by blake16("<model>:<text>"); see embed_cache.py
+CREATE TABLE IF NOT EXISTS embedding_cache (
+  key        TEXT PRIMARY KEY,
+  embedding  BLOB NOT NULL, -- float32 bytes
+  ts         REAL NOT NULL  -- last write, for trimming
+);
+
 -- Simple metadata tables (JSON blobs)
 -- Consent allowlist
 CREATE TABLE IF NOT EXISTS rag_consent (
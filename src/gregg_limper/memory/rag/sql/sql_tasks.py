@@ -3,25 +3,28 @@ Embedding maintenance tasks
 ==========================
 
 Ensures fragments table embeddings conform to the configured
-spec (model + dimension) and are non-zero. Intended to run on
-startup and periodically as a background task.
+spec (model + dimension) and are non-zero, trims the query
+embedding cache, then checkpoints the WAL. Intended to run on startup and periodically as a background
+task.
 """
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import time
 
 from gregg_limper.config import rag
 from ..embeddings import embed, to_bytes
+from .admin import checkpoint
+from .db import run_sql
+from .repositories import EmbeddingCacheRepo
 
 logger = logging.getLogger(__name__)
 
 _last_run_ts: float = 0.0
 
 
-async def _enforce_spec(conn, lock) -> None:
+async def _enforce_spec(conn) -> None:
     """Re-embed fragments that are out of date or wrong."""
 
     global _last_run_ts
@@ -38,8 +41,7 @@ async def _enforce_spec(conn, lock) -> None:
               (_last_run_ts, rag.EMB_MODEL_ID, rag.EMB_DIM, rag.EMB_DIM * 4),
         ).fetchall()
 
-    async with lock:
-        rows = await asyncio.to_thread(_rows)
+    rows = await run_sql(_rows)
 
     for row in rows:
         rid = row["id"]
@@ -82,16 +84,17 @@ async def _enforce_spec(conn, lock) -> None:
                       (new_blob, rag.EMB_MODEL_ID, rag.EMB_DIM, now, rid),
                 )
 
-        async with lock:
-            await asyncio.to_thread(_update)
+        await run_sql(_update)
 
     _last_run_ts = now
 
-async def run(conn, lock) -> None:
+async def run(conn) -> None:
     """
     Run one maintenance pass over stored embeddings.
 
     :param conn: SQLite connection.
-    :param lock: Asyncio lock protecting ``conn``.
     """
-    await _enforce_spec(conn, lock)
+    await _enforce_spec(conn)
+    await EmbeddingCacheRepo(conn).trim(rag.EMBED_CACHE_PERSIST)
+    # Re-embedding writes can be heavy; fold them back into the main DB file.
+    await checkpoint(conn)
@@ -18,6 +18,7 @@ offline backfill routines.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 import logging
 import re
 from typing import Iterable, Sequence
@@ -28,10 +29,15 @@ from gregg_limper.config import rag as rag_cfg
 
 logger = logging.getLogger(__name__)
 
-_CUSTOM_FULL_RE = re.compile(r"^<a?:(?P<name>[\w~\-]+):(?P<id>\d+)>$")
-_NAMED_ID_RE = re.compile(r"^(?P<name>[\w~\-]+):(?P<id>\d+)$")
-_NUMERIC_ID_RE = re.compile(r"^\d+$")
-_NAME_RE = re.compile(r"^[\w~\-]+$")
+# One alternation, tried in priority order: ``<a:name:id>``, ``name:id``, bare
+# id, ``:name:`` shortcode, then bare name.
+_ENTRY_RE = re.compile(
+    r"^(?:<a?:(?P<cn>[\w~\-]+):(?P<cid>\d+)>"
+    r"|(?P<nn>[\w~\-]+):(?P<nid>\d+)"
+    r"|(?P<numid>\d+)"
+    r"|:(?P<short>.+):"
+    r"|(?P<bare>[\w~\-]+))$"
+)
 
 
 @dataclass(frozen=True)
@@ -46,30 +52,25 @@ class TriggerSet:
         return not (self.unicode_emojis or self.custom_ids or self.custom_names)
 
 
+@lru_cache(maxsize=256)
 def _parse_trigger_entry(entry: str) -> tuple[str | None, int | None, str | None]:
     text = entry.strip()
     if not text:
         return None, None, None
 
-    match = _CUSTOM_FULL_RE.match(text)
-    if match:
-        return None, int(match.group("id")), match.group("name")
-
-    match = _NAMED_ID_RE.match(text)
-    if match:
-        return None, int(match.group("id")), match.group("name")
-
-    if _NUMERIC_ID_RE.match(text):
+    match = _ENTRY_RE.match(text)
+    if match is None:
+        # Fallback: treat as Unicode emoji literal (multi-codepoint safe)
+        return text, None, None
+
+    kind = match.lastgroup
+    if kind == "cid":
+        return None, int(match["cid"]), match["cn"]
+    if kind == "nid":
+        return None, int(match["nid"]), match["nn"]
+    if kind == "numid":
         return None, int(text), None
-
-    if text.startswith(":") and text.endswith(":") and len(text) > 2:
-        return None, None, text[1:-1]
-
-    if _NAME_RE.match(text):
-        return None, None, text
-
-    # Fallback: treat as Unicode emoji literal (multi-codepoint safe)
-    return text, None, None
+    return None, None, match[kind]
 
 
 def build_trigger_set(entries: Sequence[str]) -> TriggerSet:
@@ -99,16 +100,32 @@ _CACHED_TRIGGERS: TriggerSet | None = None
 def get_trigger_set(force_refresh: bool = False) -> TriggerSet:
     """
     Return the configured trigger set, refreshing from config when requested.
+
+    The parsed set is memoized at module scope so hot paths (reaction hooks,
+    hydration, backfill) only pay the parsing cost once per configuration.
     """
 
     global _CACHED_TRIGGERS
-    if _CACHED_TRIGGERS is None or force_refresh:
+    if force_refresh:
+        invalidate_triggers()
+    if _CACHED_TRIGGERS is None:
         _CACHED_TRIGGERS = build_trigger_set(rag_cfg.REACTION_TRIGGERS)
         if _CACHED_TRIGGERS.is_empty():
             logger.info("RAG reaction triggers not configured; reaction ingestion disabled.")
     return _CACHED_TRIGGERS
 
 
+def invalidate_triggers() -> None:
+    """
+    Drop the memoized trigger set so the next lookup re-reads the config.
+
+    Call this after mutating ``rag.REACTION_TRIGGERS`` at runtime.
+    """
+
+    global _CACHED_TRIGGERS
+    _CACHED_TRIGGERS = None
+
+
 def emoji_matches_trigger(
     emoji: discord.PartialEmoji | discord.Emoji | str,
     triggers: TriggerSet | None = None,
@@ -117,24 +134,19 @@ def emoji_matches_trigger(
     Return True if ``emoji`` matches the configured trigger set.
     """
 
-    triggers = triggers or get_trigger_set()
-    if triggers.is_empty():
-        return False
+    if triggers is None:
+        triggers = _CACHED_TRIGGERS or get_trigger_set()
+    uni, cids, cnames = triggers.unicode_emojis, triggers.custom_ids, triggers.custom_names
 
     if isinstance(emoji, str):
-        return emoji in triggers.unicode_emojis
-
-    emoji_id = getattr(emoji, "id", None)
-    if emoji_id is not None and emoji_id in triggers.custom_ids:
-        return True
+        return emoji in uni
 
-    emoji_name = getattr(emoji, "name", None)
-    if emoji_name and emoji_name in triggers.custom_names:
+    # Custom emoji ids are the most common configured trigger, so check them first.
+    if emoji.id in cids or emoji.name in cnames:
         return True
 
     # PartialEmoji.__str__ returns "<:name:id>" which may appear in config entries.
-    emoji_repr = str(emoji)
-    return emoji_repr in triggers.unicode_emojis
+    return bool(uni) and str(emoji) in uni
 
 
 def message_has_trigger_reaction(
@@ -146,21 +158,42 @@ def message_has_trigger_reaction(
     Check whether ``message`` already has a reaction that matches the trigger set.
     """
 
-    triggers = triggers or get_trigger_set()
+    if triggers is None:
+        triggers = _CACHED_TRIGGERS or get_trigger_set()
     if triggers.is_empty():
         return False
 
-    reactions: Iterable[discord.Reaction] = getattr(message, "reactions", [])
+    reactions: Iterable[discord.Reaction] = getattr(message, "reactions", ())
+    glyphs: set[str] = set()
+    ids: set[int | None] = set()
+    names: set[str | None] = set()
+    customs = []
     for reaction in reactions:
-        if emoji_matches_trigger(reaction.emoji, triggers):
-            return True
-    return False
+        emoji = reaction.emoji
+        if isinstance(emoji, str):
+            glyphs.add(emoji)
+        else:
+            ids.add(emoji.id)
+            names.add(emoji.name)
+            customs.append(emoji)
+
+    # One set operation per category instead of three lookups per reaction.
+    uni = triggers.unicode_emojis
+    if not (
+        triggers.custom_ids.isdisjoint(ids)
+        and triggers.custom_names.isdisjoint(names)
+        and uni.isdisjoint(glyphs)
+    ):
+        return True
+    # Rare: a "<:name:id>" config entry that only matches the rendered form.
+    return bool(uni) and any(str(emoji) in uni for emoji in customs)
 
 
 __all__ = [
     "TriggerSet",
     "build_trigger_set",
     "get_trigger_set",
+    "invalidate_triggers",
     "emoji_matches_trigger",
     "message_has_trigger_reaction",
 ]
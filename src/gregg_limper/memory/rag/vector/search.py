@@ -1,14 +1,20 @@
 import logging
 from typing import Optional, List, Dict, Any
-from ..embeddings import embed
+from ..embed_cache import embed_cached
 from . import vector_index
-from gregg_limper.config import milvus
+from gregg_limper.config import milvus, rag
 
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
 
+def _searchable(query: str) -> bool:
+    """Return whether ``query`` carries enough text to be worth a search."""
+    q = query.strip()
+    return len(q) >= rag.MIN_QUERY_CHARS and len(q.split()) >= rag.MIN_QUERY_WORDS
+
+
 async def vector_search(
     *,
     repo,
@@ -16,6 +22,7 @@ async def vector_search(
     channel_id: int,
     query: str,
     k: int = 50,
+    query_vec: Optional[np.ndarray] = None,
 ) -> List[Dict[str, Any]]:
     """
     Embed the query and search the Milvus vector index.
@@ -25,6 +32,7 @@ async def vector_search(
     :param channel_id: Channel id to scope the search.
     :param query: Natural language query to embed and search with.
     :param k: Maximum number of nearest fragments to return.
+    :param query_vec: Precomputed embedding of ``query``; skips embedding.
     :returns: Ordered list of fragment dictionaries. Each dictionary contains
         fragment metadata such as ``id``, ``message_id``, ``author_id`` and
         ``content``. An empty list is returned on failure or when no results are
@@ -35,7 +43,11 @@ async def vector_search(
         logger.info("ENABLE_MILVUS is false; returning empty vector search results")
         return []
 
-    qvec = await embed(query)
+    if query_vec is None and not _searchable(query):
+        logger.info("Query too short for vector search; skipping")
+        return []
+
+    qvec = query_vec if query_vec is not None else await embed_cached(query)
 
     # If the embedding failed (returned a zero vector), log and return empty results
     if not np.any(qvec):
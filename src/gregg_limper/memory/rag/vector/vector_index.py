@@ -3,6 +3,7 @@
 from __future__ import annotations
 import asyncio
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, List, Tuple, Set
 
 import numpy as np
@@ -24,6 +25,12 @@ _collection: Collection | None = None
 _collection_loaded = False
 _collection_lock = threading.Lock()
 
+# Searches sit on the reply path; keep them off the default executor so they
+# never wait behind upserts, compaction or other background to_thread work.
+_SEARCH_EXEC = ThreadPoolExecutor(
+    max_workers=max(1, milvus.MILVUS_SEARCH_WORKERS), thread_name_prefix="milvus-search"
+)
+
 
 def _normalize(v) -> list[float]:
     """Return a length-normalized embedding as a writable list."""
@@ -255,9 +262,8 @@ async def search(
         logger.info("ENABLE_MILVUS is false; returning empty search results")
         return []
 
-    vec = _normalize(query_vec)
-
     def _run() -> List[Tuple[int, float]]:
+        vec = _normalize(query_vec)
         col = _get_collection()
         expr = f"server_id == {int(server_id)} and channel_id == {int(channel_id)}"
         res = col.search(
@@ -271,5 +277,5 @@ async def search(
         hits = res[0] if res else []
         return [(int(h.id), float(h.score)) for h in hits]
 
-    return await asyncio.to_thread(_run)
-
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_SEARCH_EXEC, _run)
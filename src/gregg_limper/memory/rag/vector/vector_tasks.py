@@ -19,24 +19,22 @@ from gregg_limper.config import milvus
 logger = logging.getLogger(__name__)
 
 
-async def _sync_index(conn, lock) -> None:
+async def _sync_index(conn) -> None:
     """Ensure fragment vectors are in sync with Milvus."""
 
-    rows = await fetch_vectors_for_index(conn=conn, lock=lock)
     existing = await vector_index.existing_ids()
 
-    items = []
     seen: set[int] = set()
-    for rid, server_id, channel_id, blob in rows:
-        rid = int(rid)
-        seen.add(rid)
-        if not blob or rid in existing:
-            continue
-        vec = from_bytes(blob)
-        items.append((rid, int(server_id), int(channel_id), vec))
-
-    if items:
-        await vector_index.upsert_many(items)
+    async for rows in fetch_vectors_for_index(conn=conn):
+        # Upsert per batch so only one batch of decoded vectors is alive at a time.
+        items = []
+        for rid, server_id, channel_id, blob in rows:
+            seen.add(rid)
+            if not blob or rid in existing:
+                continue
+            items.append((rid, server_id, channel_id, from_bytes(blob)))
+        if items:
+            await vector_index.upsert_many(items)
 
     missing = existing - seen
     if missing:
@@ -57,10 +55,10 @@ async def _compact() -> None:
         logger.error("Vector compaction failed: %s", e)
 
 
-async def run(conn, lock) -> None:
+async def run(conn) -> None:
     """Perform one maintenance cycle for the vector index."""
     if not milvus.ENABLE_MILVUS:
         logger.info("ENABLE_MILVUS is false; skipping vector maintenance run")
         return
-    await _sync_index(conn, lock)
+    await _sync_index(conn)
     await _compact()
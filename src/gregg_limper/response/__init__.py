@@ -2,82 +2,221 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import contextlib
 import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Iterable, NamedTuple
 
 import discord
+import orjson
 
 from gregg_limper.clients import oai, ollama
-from gregg_limper.config import core, local_llm
+from gregg_limper.config import core, local_llm, prompt
+from gregg_limper.memory.rag.embed_cache import embed_cached
 from gregg_limper.tools import (
     ToolContext,
     ToolExecutionError,
-    get_registered_tool_specs,
+    get_openai_tools,
 )
 from gregg_limper.tools.executor import execute_tool
 
+from . import semantic_cache
 from .pipeline import build_prompt_payload
 
 logger = logging.getLogger(__name__)
 
 
 async def handle(message: discord.Message) -> str:
-    """Generate a reply using the prompt pipeline."""
+    """Generate a reply, reusing a cached one for near-duplicate messages."""
 
-    payload = await build_prompt_payload(message)
+    if not semantic_cache.enabled():
+        return await _generate(message)
 
-    tool_specs = get_registered_tool_specs()
-    use_tools = bool(tool_specs) and not local_llm.USE_LOCAL
+    content = (message.content or "").strip()
+    if not content:
+        return await _generate(message)
 
-    messages = list(payload.messages)
+    channel_id = message.channel.id
+    # Build the prompt speculatively while the cache is consulted; a hit only
+    # wastes the local context lookups, a miss no longer waits on the embedding.
+    payload_task = asyncio.create_task(build_prompt_payload(message))
+    try:
+        vec = await embed_cached(content)
+        cached = semantic_cache.lookup(channel_id, vec)
+    except BaseException:
+        payload_task.cancel()
+        raise
+    if cached is not None:
+        payload_task.cancel()
+        # The speculative build's outcome, error included, is irrelevant on a hit.
+        with contextlib.suppress(asyncio.CancelledError, Exception):
+            await payload_task
+        logger.info("Semantic cache hit for message %s", message.id)
+        return cached
+
+    result_text = await _generate(message, payload=await payload_task)
+    semantic_cache.store(channel_id, vec, result_text)
+    return result_text
+
+
+async def _generate(message: discord.Message, payload=None) -> str:
+    """Generate a reply using the prompt pipeline (or a prebuilt ``payload``)."""
+
+    if payload is None:
+        payload = await build_prompt_payload(message)
+
+    # build_prompt_payload returns a fresh list and _run_with_tools works on
+    # its own copy, so no defensive copy is needed here.
+    messages = payload.messages
+
+    if local_llm.USE_LOCAL:
+        result_text = await ollama.chat(messages, model=local_llm.LOCAL_MODEL_ID)
+        _write_debug_payload(payload, messages)
+        return result_text
 
-    if local_llm.USE_LOCAL or not use_tools:
-        result_text = (
-            await ollama.chat(messages, model=local_llm.LOCAL_MODEL_ID)
-            if local_llm.USE_LOCAL
-            else await oai.chat(messages, model=core.MSG_MODEL_ID)
-        )
+    # Cached registry payload: no per-reply spec list or schema rebuild.
+    openai_tools = get_openai_tools()
+    if not openai_tools:
+        result_text = await oai.chat(messages, model=core.MSG_MODEL_ID)
         _write_debug_payload(payload, messages)
         return result_text
 
     result_text, final_messages = await _run_with_tools(
         messages=messages,
-        tool_specs=tool_specs,
+        openai_tools=openai_tools,
         context=ToolContext(
             guild_id=getattr(message.guild, "id", None),
             channel_id=getattr(message.channel, "id", None),
             message_id=getattr(message, "id", None),
+            guild=message.guild,
         ),
     )
     _write_debug_payload(payload, final_messages)
     return result_text
 
 
+# Strong refs so in-flight debug writes are not garbage collected mid-run.
+_debug_tasks: set[asyncio.Task] = set()
+
+
 def _write_debug_payload(payload, final_messages: Iterable[dict[str, str]]) -> None:
-    _write_debug_file("debug_history.md", payload.history.messages)
-    _write_debug_file("debug_context.md", payload.context.user_profiles)
-    _write_debug_file("debug_messages.json", list(final_messages), json_dump=True)
+    level = core.DEBUG_DUMP
+    if not level:
+        return
+    files = (
+        ("debug_history.md", list(payload.history.messages), False),
+        ("debug_context.md", payload.context.user_profiles, False),
+        ("debug_messages.json", list(final_messages), True),
+    )
+    # Disk I/O runs off the event loop so the reply is not held up by it.
+    task = asyncio.create_task(asyncio.to_thread(_write_debug_files, files, level))
+    _debug_tasks.add(task)
+    task.add_done_callback(_debug_tasks.discard)
+
 
+def _write_debug_files(files, level: int) -> None:  # pragma: no cover - debug helper
+    for filename, data, json_dump in files:
+        _write_debug_file(filename, data, json_dump=json_dump, indent=level >= 2)
+
+
+@lru_cache(maxsize=256)
+def _canonical_arguments(arguments: str) -> str:
+    """Normalize tool-call JSON so key order does not defeat the result cache."""
+
+    try:
+        return orjson.dumps(
+            orjson.loads(arguments), option=orjson.OPT_SORT_KEYS
+        ).decode()
+    except (orjson.JSONDecodeError, TypeError):
+        return arguments
 
-async def _run_with_tools(*, messages, tool_specs, context: ToolContext) -> tuple[str, list[dict[str, str]]]:
-    openai_tools = [spec.to_openai() for spec in tool_specs]
+
+class _ToolCall(NamedTuple):
+    id: str
+    name: str
+    arguments: str
+
+
+async def _execute_tool_call(name: str, arguments: str, context: ToolContext) -> str:
+    try:
+        result = await execute_tool(name, arguments, context=context)
+    except ToolExecutionError as exc:
+        return f"Tool '{name}' failed: {exc}"
+    return result.content
+
+
+async def _run_with_tools(
+    *,
+    messages,
+    context: ToolContext,
+    tool_specs=(),
+    openai_tools: list[dict[str, Any]] | None = None,
+) -> tuple[str, list[dict[str, str]]]:
+    if openai_tools is None:
+        openai_tools = [spec.to_openai() for spec in tool_specs]
     conversation = list(messages)
     max_iters = 5
 
     cached_tool_results: dict[tuple[str, str], str] = {}
+    sem = asyncio.Semaphore(max(1, prompt.TOOL_PARALLELISM))
+
+    async def bounded(name: str, arguments: str) -> str:
+        async with sem:
+            return await _execute_tool_call(name, arguments, context)
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + prompt.TOOL_LOOP_DEADLINE
 
     for _ in range(max_iters):
-        resp = await oai.chat_full(
-            conversation,
-            model=core.MSG_MODEL_ID,
-            tools=openai_tools,
-        )
-        choice = resp.choices[0]
-        message = choice.message
-        assistant_content = message.content or ""
-        tool_calls = getattr(message, "tool_calls", None) or []
+        tool_choice = None
+        if loop.time() >= deadline:
+            # Out of budget: forbid further calls so this round must produce the
+            # answer. Tools stay in the request so its cached prefix still matches.
+            logger.warning("Tool loop deadline reached; requesting a final answer")
+            tool_choice = "none"
+
+        # Calls started while the response was still streaming, by cache key.
+        started: dict[tuple[str, str], asyncio.Task] = {}
+        if prompt.STREAM_TOOL_CALLS:
+
+            def dispatch(call_id: str, name: str, arguments: str) -> None:
+                cache_key = (name, _canonical_arguments(arguments))
+                if (
+                    name
+                    and cache_key not in cached_tool_results
+                    and cache_key not in started
+                ):
+                    started[cache_key] = asyncio.create_task(bounded(name, arguments))
+
+            try:
+                assistant_content, raw_calls = await oai.chat_stream_tools(
+                    conversation,
+                    model=core.MSG_MODEL_ID,
+                    tools=openai_tools,
+                    tool_choice=tool_choice,
+                    on_tool_call=dispatch,
+                )
+            except BaseException:
+                for task in started.values():
+                    task.cancel()
+                raise
+            tool_calls = [_ToolCall(*call) for call in raw_calls]
+        else:
+            resp = await oai.chat_full(
+                conversation,
+                model=core.MSG_MODEL_ID,
+                tools=openai_tools,
+                tool_choice=tool_choice,
+            )
+            message = resp.choices[0].message
+            assistant_content = message.content or ""
+            # Normalize SDK tool-call objects once; both passes below read the tuples.
+            tool_calls = [
+                _ToolCall(call.id, call.function.name or "", call.function.arguments or "{}")
+                for call in getattr(message, "tool_calls", None) or ()
+            ]
 
         assistant_entry: dict[str, Any] = {
             "role": "assistant",
@@ -87,12 +226,9 @@ async def _run_with_tools(*, messages, tool_specs, context: ToolContext) -> tupl
         if tool_calls:
             assistant_entry["tool_calls"] = [
                 {
-                    "id": getattr(call, "id", None),
+                    "id": call.id,
                     "type": "function",
-                    "function": {
-                        "name": getattr(call.function, "name", None),
-                        "arguments": getattr(call.function, "arguments", "{}"),
-                    },
+                    "function": {"name": call.name, "arguments": call.arguments},
                 }
                 for call in tool_calls
             ]
@@ -102,33 +238,48 @@ async def _run_with_tools(*, messages, tool_specs, context: ToolContext) -> tupl
         if not tool_calls:
             return assistant_content.strip(), conversation
 
-        for call in tool_calls:
-            name = getattr(call.function, "name", None)
-            arguments = getattr(call.function, "arguments", "{}")
+        # Resolve cache hits up front, run the remaining distinct calls
+        # concurrently, then answer in the model's call order.
+        pending: dict[tuple[str, str], str] = {}
+        named_calls = []
+        for call_id, name, arguments in tool_calls:
             if not name:
                 continue
             logger.info(
                 "Executing tool call id=%s name=%s arguments=%s",
-                getattr(call, "id", None),
+                call_id,
                 name,
                 arguments,
             )
-            cache_key = (name, arguments)
-            if cache_key in cached_tool_results:
-                content = cached_tool_results[cache_key]
-            else:
-                try:
-                    result = await execute_tool(name, arguments, context=context)
-                    content = result.content
-                except ToolExecutionError as exc:
-                    content = f"Tool '{name}' failed: {exc}"
-                cached_tool_results[cache_key] = content
+            cache_key = (name, _canonical_arguments(arguments))
+            if cache_key not in cached_tool_results and cache_key not in started:
+                pending.setdefault(cache_key, arguments)
+            named_calls.append((call_id, name, cache_key))
+
+        if pending or started:
+            tasks = [
+                *started.values(),
+                *(
+                    asyncio.create_task(bounded(name, arguments))
+                    for (name, _), arguments in pending.items()
+                ),
+            ]
+            try:
+                contents = await asyncio.gather(*tasks)
+            except BaseException:
+                # A failed or abandoned reply must not leave tools running unobserved.
+                for task in tasks:
+                    task.cancel()
+                raise
+            cached_tool_results.update(zip([*started, *pending], contents))
+
+        for call_id, name, cache_key in named_calls:
             conversation.append(
                 {
                     "role": "tool",
-                    "tool_call_id": getattr(call, "id", None),
+                    "tool_call_id": call_id,
                     "name": name,
-                    "content": content,
+                    "content": cached_tool_results[cache_key],
                 }
             )
 
@@ -136,13 +287,13 @@ async def _run_with_tools(*, messages, tool_specs, context: ToolContext) -> tupl
 
 
 def _write_debug_file(
-    filename: str, data, json_dump: bool = False
+    filename: str, data, json_dump: bool = False, indent: bool = True
 ) -> None:  # pragma: no cover - debug helper
     try:
         path = Path(filename)
         if json_dump:
-            path.write_text(
-                json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8"
+            path.write_bytes(
+                orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
             )
         else:
             with path.open("w", encoding="utf-8") as handle:
@@ -12,13 +12,13 @@ from discord import Message
 from gregg_limper.memory.rag import consent
 from gregg_limper.memory.rag import (
     channel_summary as fetch_channel_summary,
-    user_profile as fetch_user_profile,
+    user_profiles as fetch_user_profiles,
 )
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class ConversationContext:
     """Dynamic data retrieved to aid a model response."""
 
@@ -36,16 +36,16 @@ async def gather_context(
     This function remains for surfacing channel summaries and user profiles.
     """
 
-    channel_summary_task = asyncio.create_task(
-        fetch_channel_summary(message.channel.id)
-    )
-    user_profiles_task = asyncio.create_task(
-        _gather_user_profiles(participant_ids)
-    )
-    channel_summary, user_profiles = await asyncio.gather(
-        channel_summary_task,
-        user_profiles_task,
-    )
+    participants = [pid for pid in participant_ids if pid is not None]
+    if not participants:
+        # Only the summary lookup remains; await it without scheduling tasks.
+        channel_summary = await fetch_channel_summary(message.channel.id)
+        user_profiles: list[dict[str, Any]] = []
+    else:
+        channel_summary, user_profiles = await asyncio.gather(
+            fetch_channel_summary(message.channel.id),
+            _gather_user_profiles(participants),
+        )
 
     return ConversationContext(
         channel_summary=channel_summary,
@@ -62,18 +62,14 @@ async def _gather_user_profiles(
     if not participants:
         return []
 
-    consent_checks = await asyncio.gather(
-        *(consent.is_opted_in(pid) for pid in participants)
-    )
-
-    consenting = [
-        pid for pid, opted_in in zip(participants, consent_checks) if opted_in
-    ]
+    # One membership pass over the cached consent set instead of N coroutines.
+    opted_in = await consent.are_opted_in(participants)
+    consenting = [pid for pid in participants if pid in opted_in]
     if not consenting:
         return []
 
-    profiles = await asyncio.gather(*(fetch_user_profile(pid) for pid in consenting))
-    return [profile for profile in profiles if profile]
+    profiles = await fetch_user_profiles(consenting)
+    return [profiles[pid] for pid in consenting if profiles.get(pid)]
 
 
 __all__ = ["ConversationContext", "gather_context"]
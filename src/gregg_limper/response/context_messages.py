@@ -2,55 +2,66 @@
 
 from __future__ import annotations
 
-import json
-from typing import Iterable
+from collections import OrderedDict
+from typing import Iterable, Iterator
+
+import orjson
 
 from .context import ConversationContext
 
 __all__ = ["build_context_messages"]
 
 
-def build_context_messages(context: ConversationContext) -> list[dict[str, str]]:
-    """Convert context into assistant messages for the LLM."""
+# (summary, compact profile JSON) -> rendered context message; small LRU that
+# absorbs bursts of replies in one channel where neither input has changed.
+_RENDER_CACHE_SIZE = 64
+_rendered: OrderedDict[tuple[str | None, bytes], dict[str, str]] = OrderedDict()
 
-    sections: list[str] = []
 
-    sections.append(
-        _format_section(
-            "Channel Summary",
-            context.channel_summary
-            or "_No persistent channel summary was retrieved._",
-        )
+def build_context_messages(context: ConversationContext) -> list[dict[str, str]]:
+    """
+    Convert context into assistant messages for the LLM.
+
+    Always returns exactly one block, with placeholders for missing sections,
+    so the message layout is stable from turn to turn. Rendered blocks are
+    memoized on the context's content; callers must not mutate them.
+    """
+
+    key = (context.channel_summary, orjson.dumps(context.user_profiles))
+    message = _rendered.get(key)
+    if message is None:
+        message = _render_context(context)
+        _rendered[key] = message
+        if len(_rendered) > _RENDER_CACHE_SIZE:
+            _rendered.popitem(last=False)
+    else:
+        _rendered.move_to_end(key)
+    return [message]
+
+
+def _render_context(context: ConversationContext) -> dict[str, str]:
+    return {
+        "role": "assistant",
+        "content": "### Context\n" + "\n\n".join(_sections(context)),
+    }
+
+
+def _sections(context: ConversationContext) -> Iterator[str]:
+    summary = (context.channel_summary or "").strip()
+    yield "#### Channel Summary\n" + (
+        summary or "_No persistent channel summary was retrieved._"
     )
-
-    sections.append(
-        _format_section(
-            "User Profiles",
-            _format_user_profiles(context.user_profiles)
-            if context.user_profiles
-            else "_No opted-in user profiles were available._",
-        )
+    yield "#### User Profiles\n" + (
+        _format_user_profiles(context.user_profiles)
+        if context.user_profiles
+        else "_No opted-in user profiles were available._"
     )
 
-    content = "\n\n".join(sections).strip()
-    if not content:
-        return []
-
-    return [
-        {
-            "role": "assistant",
-            "content": "### Context\n" + content,
-        }
-    ]
-
-
-def _format_section(title: str, body: str) -> str:
-    return f"#### {title}\n{body.strip()}" if body else f"#### {title}\n"
-
 
 def _format_user_profiles(profiles: Iterable[dict]) -> str:
-    serialized = [
-        f"- {json.dumps(profile, ensure_ascii=False, indent=2)}" for profile in profiles
-    ]
-    return "\n".join(serialized)
+    # orjson emits UTF-8 directly (no ASCII escaping) with the same 2-space layout.
+    return "\n".join(
+        "- " + orjson.dumps(profile, option=orjson.OPT_INDENT_2).decode()
+        for profile in profiles
+    )
 
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import Iterable, List, Sequence, Set
+from typing import List, Sequence, Set
 
 from gregg_limper.clients import disc
 from gregg_limper.memory.cache import GLCache
@@ -12,7 +12,7 @@ from gregg_limper.memory.cache import GLCache
 logger = logging.getLogger(__name__)
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class HistoryContext:
     """Cached history messages and referenced participant identifiers."""
 
@@ -45,41 +45,43 @@ async def build_history(channel_id: int, limit: int) -> HistoryContext:
 def _convert_history(formatted_messages: Sequence[dict]) -> List[dict[str, str]]:
     """Translate cached structured messages to readable chat messages."""
 
+    # Resolve the bot's name once per history rather than once per message.
+    bot_name = _bot_display_name()
     converted: list[dict[str, str]] = []
+    append = converted.append
     for formatted in formatted_messages:
         author_name = formatted.get("author") or "Unknown speaker"
-        role = _resolve_role(author_name)
-        fragments = formatted.get("fragments", [])
-        content = _render_fragments(fragments)
+        role = "assistant" if bot_name and author_name == bot_name else "user"
+        content = _render_fragments(formatted.get("fragments") or ())
         if content:
             body = f"{author_name} said:\n{content}"
         else:
             body = f"{author_name} shared non-text content."
-        converted.append({"role": role, "content": body})
+        append({"role": role, "content": body})
     return converted
 
 
-def _resolve_role(author_name: str) -> str:
+def _bot_display_name() -> str | None:
     bot_user = getattr(getattr(disc, "bot", None), "user", None)
-    bot_display_name = getattr(bot_user, "display_name", None)
-    if bot_display_name and author_name == bot_display_name:
-        return "assistant"
-    return "user"
+    return getattr(bot_user, "display_name", None)
 
 
-def _render_fragments(fragments: Iterable[dict]) -> str:
+def _render_fragments(fragments: Sequence[dict]) -> str:
     lines: list[str] = []
+    append = lines.append
     for fragment in fragments:
-        fragment_type = fragment.get("type") or "text"
-        description = fragment.get("description") or fragment.get("content")
-        caption = fragment.get("caption")
-        title = fragment.get("title")
-        url = fragment.get("url") or fragment.get("href")
+        get = fragment.get
+        fragment_type = get("type") or "text"
+        description = get("description") or get("content")
 
         if fragment_type == "text" and description:
-            lines.append(description.strip())
+            append(description.strip())
             continue
 
+        caption = get("caption")
+        title = get("title")
+        url = get("url") or get("href")
+
         pieces: list[str] = [fragment_type.upper()]
         if title:
             pieces.append(title.strip())
@@ -92,27 +94,30 @@ def _render_fragments(fragments: Iterable[dict]) -> str:
 
         rendered = " - ".join(piece for piece in pieces if piece)
         if rendered:
-            lines.append(rendered)
+            append(rendered)
 
     return "\n".join(lines).strip()
 
 
-def _extract_participants(raw_messages: Iterable) -> Set[int]:
+def _extract_participants(raw_messages: Sequence) -> Set[int]:
     """Collect participant IDs from raw Discord messages."""
 
-    participants: set[int] = set()
     bot_user = getattr(getattr(disc, "bot", None), "user", None)
-    bot_user_id = getattr(bot_user, "id", None)
-
-    for raw in raw_messages:
-        author_id = getattr(raw.author, "id", None)
-        if author_id is not None and author_id != bot_user_id:
-            participants.add(author_id)
+    excluded = (None, getattr(bot_user, "id", None))
 
-        for mentioned in getattr(raw, "mentions", []) or []:
-            mentioned_id = getattr(mentioned, "id", None)
-            if mentioned_id is not None and mentioned_id != bot_user_id:
-                participants.add(mentioned_id)
+    # set.update drains each generator in C instead of one add() per id.
+    participants: set[int] = set()
+    participants.update(
+        author_id
+        for raw in raw_messages
+        if (author_id := getattr(raw.author, "id", None)) not in excluded
+    )
+    participants.update(
+        mentioned_id
+        for raw in raw_messages
+        for mentioned in getattr(raw, "mentions", None) or ()
+        if (mentioned_id := getattr(mentioned, "id", None)) not in excluded
+    )
 
     return participants
 
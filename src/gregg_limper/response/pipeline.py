@@ -8,17 +8,17 @@ from typing import List
 from discord import Message
 
 from gregg_limper.config import core
-from gregg_limper.tools import build_tool_prompt, get_registered_tool_specs
+from gregg_limper.tools import get_tool_prompt_message
 
 from .context import ConversationContext, gather_context
 from .context_messages import build_context_messages
 from .history import HistoryContext, build_history
-from .system_prompt import get_system_prompt
+from .system_prompt import get_system_message
 
 __all__ = ["PromptPayload", "build_prompt_payload"]
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class PromptPayload:
     """All artifacts required to call the chat completion API."""
 
@@ -35,14 +35,14 @@ async def build_prompt_payload(message: Message) -> PromptPayload:
         message, participant_ids=history.participant_ids
     )
 
-    messages: list[dict[str, str]] = [
-        {"role": "system", "content": get_system_prompt()}
-    ]
+    messages: list[dict[str, str]] = [get_system_message()]
 
-    tool_specs = get_registered_tool_specs()
-    if tool_specs:
-        messages.append({"role": "assistant", "content": build_tool_prompt(tool_specs)})
-    messages.extend(build_context_messages(context))
+    tool_message = get_tool_prompt_message()
+    if tool_message is not None:
+        messages.append(tool_message)
+    # Per-turn context goes last so the system/tool prefix stays byte-identical
+    # across turns and remains eligible for provider-side prompt caching.
     messages.extend(history.messages)
+    messages.extend(build_context_messages(context))
 
     return PromptPayload(messages=messages, history=history, context=context)
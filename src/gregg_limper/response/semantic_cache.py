@@ -0,0 +1,68 @@
+"""
+Semantic reply cache.
+
+Short-circuits :func:`gregg_limper.response.handle` when an incoming message is
+a near-duplicate of one answered recently in the same channel. Each channel
+keeps up to ``core.SEMANTIC_CACHE_SIZE`` ``(unit embedding, reply)`` pairs in a
+small matrix; a lookup is one matrix-vector product and a hit requires cosine
+similarity of at least ``core.SEMANTIC_CACHE_TAU``. A tau of ``0`` disables the
+cache entirely, which is the default because replies also depend on channel
+history that the key does not capture.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from gregg_limper.config import core
+
+# channel_id -> (row-normalized embedding matrix, replies); rows oldest-first.
+_entries: dict[int, tuple[np.ndarray, list[str]]] = {}
+
+
+def enabled() -> bool:
+    return core.SEMANTIC_CACHE_TAU > 0
+
+
+def _unit(vec: np.ndarray) -> np.ndarray | None:
+    v = np.asarray(vec, dtype=np.float32)
+    n = float(np.linalg.norm(v))
+    return v / n if n > 0 else None
+
+
+def lookup(channel_id: int, vec: np.ndarray) -> str | None:
+    """Return the cached reply most similar to ``vec`` if it clears tau."""
+
+    entry = _entries.get(channel_id)
+    q = _unit(vec)
+    if entry is None or q is None:
+        return None
+    matrix, replies = entry
+    scores = matrix @ q
+    best = int(np.argmax(scores))
+    if scores[best] < core.SEMANTIC_CACHE_TAU:
+        return None
+    return replies[best]
+
+
+def store(channel_id: int, vec: np.ndarray, reply: str) -> None:
+    """Remember ``reply`` for ``vec``, evicting the oldest entry past the cap."""
+
+    q = _unit(vec)
+    if q is None or not reply:
+        return
+    cap = max(1, core.SEMANTIC_CACHE_SIZE)
+    entry = _entries.get(channel_id)
+    if entry is None:
+        matrix, replies = q[None, :], [reply]
+    else:
+        matrix = np.vstack((entry[0], q))[-cap:]
+        replies = (entry[1] + [reply])[-cap:]
+    _entries[channel_id] = (matrix, replies)
+
+
+def clear() -> None:
+    _entries.clear()
+
+
+__all__ = ["enabled", "lookup", "store", "clear"]
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-__all__ = ["get_system_prompt"]
+__all__ = ["get_system_prompt", "get_system_message"]
 
 
 _SYSTEM_PROMPT = (
@@ -11,8 +11,8 @@ _SYSTEM_PROMPT = (
     "respect privacy expectations, and defer to moderators when appropriate. "
     "Respond in Markdown unless plain text is explicitly requested."
     "\n\n"
-    "Additional conversation context may be provided in assistant messages "
-    "labelled as context blocks. Treat them as high-priority background "
+    "Additional conversation context may be provided after the conversation "
+    "history in assistant messages labelled as context blocks. Treat them as high-priority background "
     "knowledge, but never quote them verbatim unless they are relevant to the "
     "user's request. If the context seems outdated or irrelevant, explain the "
     "concern before relying on it."
@@ -27,3 +27,16 @@ def get_system_prompt() -> str:
 
     return _SYSTEM_PROMPT
 
+
+_SYSTEM_MESSAGE = {"role": "system", "content": _SYSTEM_PROMPT}
+
+
+def get_system_message() -> dict[str, str]:
+    """
+    Return the shared system message for the head of every payload.
+
+    The same dict is returned on each call; callers must not mutate it.
+    """
+
+    return _SYSTEM_MESSAGE
+
@@ -36,6 +36,8 @@ __all__ = [
     "ToolSpec",
     "ToolExecutionError",
     "build_tool_prompt",
+    "get_openai_tools",
+    "get_tool_prompt_message",
     "get_registered_tool_specs",
     "get_tool_entry",
     "register_tool",
@@ -49,6 +51,11 @@ class ToolSpec:
     name: str
     description: str
     parameters: Dict[str, Any]
+    # Opt-in reuse of results across turns; leave off for tools with side effects.
+    cacheable: bool = False
+    ttl_seconds: float = 60.0
+    # Upper bound on one execution so a stalled tool cannot hold up the reply.
+    timeout_seconds: float = 15.0
 
     def to_openai(self) -> Dict[str, Any]:
         """Return this spec formatted for OpenAI function calling."""
@@ -70,6 +77,8 @@ class ToolContext:
     guild_id: int | None
     channel_id: int | None
     message_id: int | None
+    # Live guild handle, when available, for resolving member display names.
+    guild: Any = None
 
 
 @dataclass(slots=True)
@@ -98,6 +107,9 @@ class Tool:
 
 _registry: dict[str, Type[Tool]] = {}
 _HANDLERS_IMPORTED = False
+# Derived from the registry once and reset on registration.
+_tool_prompt_message: dict[str, str] | None = None
+_openai_tools: list[Dict[str, Any]] | None = None
 
 
 def register_tool(spec: ToolSpec):
@@ -108,8 +120,11 @@ def register_tool(spec: ToolSpec):
             raise TypeError("register_tool expects a Tool subclass")
         if spec.name in _registry:
             raise ValueError(f"Tool with name '{spec.name}' already registered")
+        global _tool_prompt_message, _openai_tools
         cls.spec = spec
         _registry[spec.name] = cls
+        _tool_prompt_message = None
+        _openai_tools = None
         return cls
 
     return decorator
@@ -136,6 +151,38 @@ def build_tool_prompt(specs: Iterable[ToolSpec]) -> str:
     return "\n".join(lines)
 
 
+def get_tool_prompt_message() -> dict[str, str] | None:
+    """
+    Return the assistant message advertising every registered tool.
+
+    Built once and shared until another tool is registered, so each payload
+    carries a byte-identical tool listing. Callers must not mutate it.
+    ``None`` when no tools are registered.
+    """
+
+    global _tool_prompt_message
+    if _tool_prompt_message is None and _registry:
+        _tool_prompt_message = {
+            "role": "assistant",
+            "content": build_tool_prompt(get_registered_tool_specs()),
+        }
+    return _tool_prompt_message
+
+
+def get_openai_tools() -> list[Dict[str, Any]]:
+    """
+    Return the OpenAI ``tools`` payload for every registered tool.
+
+    Built once and shared until another tool is registered. Callers must not
+    mutate it.
+    """
+
+    global _openai_tools
+    if _openai_tools is None:
+        _openai_tools = [spec.to_openai() for spec in get_registered_tool_specs()]
+    return _openai_tools
+
+
 def _import_handlers() -> None:
     """Import every handler module exactly once."""
 
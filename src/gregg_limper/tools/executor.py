@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 from typing import Any
 
+import orjson
+
 from . import ToolContext, ToolExecutionError, ToolResult, get_tool_entry
+from .result_cache import tool_results
 
 
 async def execute_tool(name: str, arguments: str | dict[str, Any], *, context: ToolContext) -> ToolResult:
@@ -14,7 +17,9 @@ async def execute_tool(name: str, arguments: str | dict[str, Any], *, context: T
 
     ``arguments`` may be a JSON string (as provided by OpenAI) or a parsed
     mapping.  The helper normalises the payload, instantiates the tool class,
-    and returns its :class:`ToolResult`.
+    and returns its :class:`ToolResult`. Results of tools whose spec is
+    ``cacheable`` are shared across calls for ``ttl_seconds``. Executions
+    exceeding the spec's ``timeout_seconds`` raise :class:`ToolExecutionError`.
     """
 
     entry = get_tool_entry(name)
@@ -23,18 +28,41 @@ async def execute_tool(name: str, arguments: str | dict[str, Any], *, context: T
 
     if isinstance(arguments, str):
         try:
-            parsed_args = json.loads(arguments) if arguments.strip() else {}
-        except json.JSONDecodeError as exc:
+            parsed_args = orjson.loads(arguments) if arguments.strip() else {}
+        except orjson.JSONDecodeError as exc:
             raise ToolExecutionError(f"Invalid JSON arguments for tool '{name}': {exc}") from exc
     else:
         parsed_args = arguments
 
+    spec = entry.spec
+    cache_key = None
+    if spec.cacheable:
+        try:
+            canonical = orjson.dumps(parsed_args, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            canonical = None
+        if canonical is not None:
+            cache_key = (name, context.guild_id, context.channel_id, canonical)
+            cached = tool_results.get(cache_key)
+            if cached is not None:
+                return cached
+
     tool = entry()
     try:
-        return await tool.run(context=context, **parsed_args)
+        result = await asyncio.wait_for(
+            tool.run(context=context, **parsed_args), timeout=spec.timeout_seconds
+        )
     except ToolExecutionError:
         raise
+    except asyncio.TimeoutError as exc:
+        raise ToolExecutionError(
+            f"Tool '{name}' timed out after {spec.timeout_seconds:g}s"
+        ) from exc
     except TypeError as exc:
         raise ToolExecutionError(str(exc)) from exc
     except Exception as exc:  # pragma: no cover - defensive guard
         raise ToolExecutionError(f"Tool '{name}' execution failed: {exc}") from exc
+
+    if cache_key is not None:
+        tool_results.put(cache_key, result, spec.ttl_seconds)
+    return result
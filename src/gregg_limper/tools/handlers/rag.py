@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Iterable
 
 from gregg_limper.config import prompt as prompt_cfg
 from gregg_limper.memory import rag
@@ -13,6 +13,28 @@ _MAX_RESULTS = max(1, prompt_cfg.VECTOR_SEARCH_K)
 _DEFAULT_RESULTS = min(3, _MAX_RESULTS)
 
 
+def _map_author_display_names(guild: Any, author_ids: Iterable[int]) -> dict[int, str]:
+    """
+    Resolve ``author_ids`` to display names from ``guild``'s member cache.
+
+    Only cached members are used, so retrieval never waits on the Discord API;
+    authors missing from the cache are omitted and shown by id.
+
+    :param guild: Discord guild, or ``None`` to skip resolution.
+    :param author_ids: Author ids to resolve.
+    :returns: Mapping of author id to display name.
+    """
+    if guild is None:
+        return {}
+
+    names: dict[int, str] = {}
+    for aid in set(author_ids):
+        member = guild.get_member(aid)
+        if member is not None:
+            names[aid] = member.display_name
+    return names
+
+
 @register_tool(
     ToolSpec(
         name="retrieve_context",
@@ -34,6 +56,9 @@ _DEFAULT_RESULTS = min(3, _MAX_RESULTS)
             },
             "required": ["query"],
         },
+        # Memories only change on reaction-triggered ingestion; brief reuse is safe.
+        cacheable=True,
+        ttl_seconds=60.0,
     )
 )
 class RetrieveContextTool(Tool):
@@ -60,10 +85,15 @@ class RetrieveContextTool(Tool):
         if not results:
             return ToolResult(content="No related context was found.")
 
+        names = _map_author_display_names(
+            context.guild, {row["author_id"] for row in results if row.get("author_id")}
+        )
+
         lines: list[str] = []
         for idx, row in enumerate(results, start=1):
             snippet = row.get("content") or row.get("title") or "(no content)"
-            author = row.get("author_id") or "unknown"
+            author_id = row.get("author_id")
+            author = names.get(author_id) or author_id or "unknown"
             lines.append(f"{idx}. {snippet} (author: {author}, message: {row.get('message_id')})")
 
         return ToolResult(content="\n".join(lines))
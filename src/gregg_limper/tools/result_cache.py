@@ -0,0 +1,64 @@
+"""
+Process-wide cache for tool results.
+
+Tools opt in through :attr:`ToolSpec.cacheable` and bound freshness with
+:attr:`ToolSpec.ttl_seconds`; everything else (side effects, live lookups)
+always executes. Entries are keyed on the tool name, the guild and channel the
+call was scoped to, and the canonical JSON of its arguments, so equivalent
+calls from different turns or users share one execution.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Hashable
+
+from . import ToolResult
+
+__all__ = ["ToolResultCache", "tool_results"]
+
+
+class ToolResultCache:
+    """LRU of :class:`ToolResult` objects with a per-entry expiry."""
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, tuple[float, ToolResult]] = OrderedDict()
+
+    def get(self, key: Hashable) -> ToolResult | None:
+        """
+        Return the live result for ``key`` or ``None``.
+
+        :param key: Cache key built by the caller.
+        :returns: Cached result, or ``None`` when absent or expired.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, result = entry
+        if expires <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return result
+
+    def put(self, key: Hashable, result: ToolResult, ttl_seconds: float) -> None:
+        """
+        Store ``result`` under ``key`` for ``ttl_seconds``.
+
+        :param key: Cache key built by the caller.
+        :param result: Successful tool result.
+        :param ttl_seconds: Seconds until the entry expires.
+        """
+        self._entries[key] = (time.monotonic() + ttl_seconds, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+# Shared by every caller of :func:`gregg_limper.tools.executor.execute_tool`.
+tool_results = ToolResultCache()
@@ -68,10 +68,16 @@ def test_initialize_hydrates_recent_history(monkeypatch):
     async def fake_is_opted_in(uid):
         return False
 
+    async def fake_are_opted_in(uids):
+        return set()
+
     async def fake_format_message(msg):
         return {"author": msg.author.display_name, "fragments": []}
 
     monkeypatch.setattr(cache_ingestion.consent, "is_opted_in", fake_is_opted_in)
+    monkeypatch.setattr(
+        cache_ingestion.consent, "are_opted_in", fake_are_opted_in
+    )
     monkeypatch.setattr(
         cache_formatting, "format_for_cache", fake_format_message
     )
@@ -79,6 +85,7 @@ def test_initialize_hydrates_recent_history(monkeypatch):
     monkeypatch.setattr(cache_memo, "load", lambda cid: {})
     monkeypatch.setattr(cache_memo, "prune", lambda cid, d: d)
     monkeypatch.setattr(cache_memo, "save", lambda cid, d: None)
+    monkeypatch.setattr(cache_memo, "append", lambda cid, mid, d: None)
 
     now = datetime.datetime.now(datetime.timezone.utc)
     messages = [
@@ -118,12 +125,18 @@ def test_initialize_preserves_order_with_slow_formatter(monkeypatch):
     async def fake_is_opted_in(uid):
         return False
 
+    async def fake_are_opted_in(uids):
+        return set()
+
     async def fake_format_message(msg):
         # Sleep inversely proportional to id so completion order differs
         await asyncio.sleep(0.01 * (5 - msg.id))
         return {"author": msg.author.display_name, "fragments": []}
 
     monkeypatch.setattr(cache_ingestion.consent, "is_opted_in", fake_is_opted_in)
+    monkeypatch.setattr(
+        cache_ingestion.consent, "are_opted_in", fake_are_opted_in
+    )
     monkeypatch.setattr(
         cache_formatting, "format_for_cache", fake_format_message
     )
@@ -131,6 +144,7 @@ def test_initialize_preserves_order_with_slow_formatter(monkeypatch):
     monkeypatch.setattr(cache_memo, "load", lambda cid: {})
     monkeypatch.setattr(cache_memo, "prune", lambda cid, d: d)
     monkeypatch.setattr(cache_memo, "save", lambda cid, d: None)
+    monkeypatch.setattr(cache_memo, "append", lambda cid, mid, d: None)
 
     now = datetime.datetime.now(datetime.timezone.utc)
     messages = [
@@ -165,10 +179,16 @@ def test_initialize_formats_only_missing_payloads(monkeypatch):
     async def fake_is_opted_in(uid):
         return False
 
+    async def fake_are_opted_in(uids):
+        return set()
+
     async def fake_format_message(msg):
         return {"author": msg.author.display_name, "fragments": []}
 
     monkeypatch.setattr(cache_ingestion.consent, "is_opted_in", fake_is_opted_in)
+    monkeypatch.setattr(
+        cache_ingestion.consent, "are_opted_in", fake_are_opted_in
+    )
     monkeypatch.setattr(
         cache_formatting, "format_for_cache", fake_format_message
     )
@@ -180,6 +200,7 @@ def test_initialize_formats_only_missing_payloads(monkeypatch):
     )
     monkeypatch.setattr(cache_memo, "prune", lambda cid, d: d)
     monkeypatch.setattr(cache_memo, "save", lambda cid, d: None)
+    monkeypatch.setattr(cache_memo, "append", lambda cid, mid, d: None)
 
     created: list[int] = []
     orig_create_task = asyncio.create_task
@@ -226,10 +247,16 @@ def test_initialize_skips_command_and_feedback(monkeypatch):
     async def fake_is_opted_in(uid):
         return False
 
+    async def fake_are_opted_in(uids):
+        return set()
+
     async def fake_format_message(msg):
         return {"author": msg.author.display_name, "fragments": []}
 
     monkeypatch.setattr(cache_ingestion.consent, "is_opted_in", fake_is_opted_in)
+    monkeypatch.setattr(
+        cache_ingestion.consent, "are_opted_in", fake_are_opted_in
+    )
     monkeypatch.setattr(
         cache_formatting, "format_for_cache", fake_format_message
     )
@@ -237,6 +264,7 @@ def test_initialize_skips_command_and_feedback(monkeypatch):
     monkeypatch.setattr(cache_memo, "load", lambda cid: {})
     monkeypatch.setattr(cache_memo, "prune", lambda cid, d: d)
     monkeypatch.setattr(cache_memo, "save", lambda cid, d: None)
+    monkeypatch.setattr(cache_memo, "append", lambda cid, mid, d: None)
 
     now = datetime.datetime.now(datetime.timezone.utc)
     bot_user = SimpleNamespace(id=99, display_name="gregg", bot=True)
@@ -280,3 +308,35 @@ def test_initialize_skips_command_and_feedback(monkeypatch):
     stored_ids = [m.id for m in cache_inst._states[1].messages]
     # All messages, including command text, are retained during hydration.
     assert stored_ids == [1, 2, 3, 4]
+
+
+def test_evaluate_ingestion_batch_uses_single_lookups(monkeypatch):
+    calls = []
+
+    async def fake_are_opted_in(uids):
+        calls.append(("consent", list(uids)))
+        return {1}
+
+    async def fake_messages_exist(ids):
+        calls.append(("exists", list(ids)))
+        return {10}
+
+    monkeypatch.setattr(cache_ingestion.consent, "are_opted_in", fake_are_opted_in)
+    monkeypatch.setattr(cache_ingestion.rag, "messages_exist", fake_messages_exist)
+
+    messages = [
+        FakeMessage(id=10, author=SimpleNamespace(id=1)),
+        FakeMessage(id=11, author=SimpleNamespace(id=1)),
+        FakeMessage(id=12, author=SimpleNamespace(id=2)),
+    ]
+
+    results = asyncio.run(
+        cache_ingestion.evaluate_ingestion_batch(messages, memo_present=True)
+    )
+
+    assert calls == [("consent", [1, 1, 2]), ("exists", [10, 11])]
+    assert [(m.id, ok, res.sqlite) for m, ok, res in results] == [
+        (10, True, True),
+        (11, True, False),
+        (12, False, False),
+    ]
@@ -43,3 +43,33 @@ def test_list_formatted_messages_skips_missing_memos(monkeypatch):
         {"author": "cached", "fragments": cache._memo_store.get(present.id)["fragments"]}
     ]
     assert memo_copies[0]["fragments"] is not cache._memo_store.get(present.id)["fragments"]
+
+    view = cache.get_memo_record(1, present.id, mutable=False)
+    assert view.get("author") == "cached"
+    assert view.fragments is cache._memo_store.get(present.id)["fragments"]
+    assert view.as_dict() == memo_copies[0]
+
+
+def test_frags_preview_caps_budget():
+    from gregg_limper.formatter.model import ImageFragment, TextFragment
+    from gregg_limper.memory.cache.utils import _frags_preview
+
+    frags = [TextFragment(description="hello"), ImageFragment(caption="a cat")]
+    assert _frags_preview(frags) == "text:'hello', image:'a cat'"
+    assert _frags_preview(frags, max_total_chars=len("text:'hello'")) == "text:'hello', …"
+    assert _frags_preview(frags, max_total_chars=3) == ""
+
+
+def test_frag_summary_leads_image_and_gif_with_caption():
+    from gregg_limper.formatter.model import GIFFragment, ImageFragment, LinkFragment
+    from gregg_limper.memory.cache.utils import _frag_summary
+
+    img = ImageFragment(caption="a cat", description="tabby on a sofa", title="cat.png")
+    gif = GIFFragment(caption="dancing", description="a looping clip")
+    link = LinkFragment(title="Docs", description="summary", url="https://example.com")
+
+    assert _frag_summary(img) == "image:'a cat'"
+    assert _frag_summary(gif) == "gif:'dancing'"
+    # Without a caption the image preview falls back to the description.
+    assert _frag_summary(ImageFragment(description="tabby")) == "image:'tabby'"
+    assert _frag_summary(link) == "link:'summary'"
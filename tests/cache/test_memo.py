@@ -0,0 +1,169 @@
+import asyncio
+import gzip
+import json
+import threading
+
+from gregg_limper.config import cache as cache_cfg
+from gregg_limper.formatter.model import TextFragment
+from gregg_limper.memory.cache import memo as cache_memo
+
+
+def test_memo_round_trip(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache_cfg, "MEMO_DIR", str(tmp_path))
+    frag = TextFragment(description="hello")
+    frag.id = "t1"
+    cache_memo.save(42, {7: {"author": "alice", "fragments": [frag]}})
+
+    loaded = cache_memo.load(42)
+
+    assert list(loaded) == [7]
+    assert loaded[7]["author"] == "alice"
+    assert [f.to_dict() for f in loaded[7]["fragments"]] == [frag.to_dict()]
+
+
+def test_memo_load_reads_legacy_text_gzip(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache_cfg, "MEMO_DIR", str(tmp_path))
+    payload = {"9": {"author": "bob", "fragments": [{"type": "text", "id": "t", "description": "hi"}]}}
+    with gzip.open(tmp_path / "5.json.gz", "wt", encoding="utf-8") as f:
+        json.dump(payload, f)
+
+    loaded = cache_memo.load(5)
+
+    assert loaded[9]["fragments"][0].description == "hi"
+
+
+def test_memo_load_many_matches_per_channel_load(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache_cfg, "MEMO_DIR", str(tmp_path))
+    for cid in (1, 2, 3):
+        frag = TextFragment(description=f"c{cid}")
+        cache_memo.save(cid, {cid * 10: {"author": "u", "fragments": [frag]}})
+
+    loaded = cache_memo.load_many([1, 2, 3, 4])
+
+    assert list(loaded) == [1, 2, 3, 4]
+    assert loaded[4] == {}
+    for cid in (1, 2, 3):
+        assert loaded[cid][cid * 10]["fragments"][0].description == f"c{cid}"
+
+
+def test_memo_journal_replays_and_compacts(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache_cfg, "MEMO_DIR", str(tmp_path))
+    monkeypatch.setattr(cache_cfg, "CACHE_LENGTH", 2)
+    cache_memo.save(3, {1: {"author": "a", "fragments": [TextFragment(description="one")]}})
+    cache_memo.append(3, 2, {"author": "b", "fragments": [TextFragment(description="two")]})
+    cache_memo.append(3, 3, {"author": "c", "fragments": [TextFragment(description="three")]})
+
+    loaded = cache_memo.load(3)
+
+    # Replay appends in order and drops entries beyond the cache window.
+    assert list(loaded) == [2, 3]
+    assert loaded[3]["fragments"][0].description == "three"
+    assert cache_memo.needs_compaction(3)
+
+    cache_memo.save(3, loaded)
+
+    assert not cache_memo.needs_compaction(3)
+    assert not (tmp_path / "3.jrnl").exists()
+    assert list(cache_memo.load(3)) == [2, 3]
+
+
+def test_memo_schedule_save_coalesces_and_keeps_later_appends(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache_cfg, "MEMO_DIR", str(tmp_path))
+    writes = []
+    orig_write = cache_memo._write_snapshot
+
+    def counting_write(channel_id, seq, memo_dict, offset):
+        writes.append(list(memo_dict))
+        orig_write(channel_id, seq, memo_dict, offset)
+
+    monkeypatch.setattr(cache_memo, "_write_snapshot", counting_write)
+
+    def entry(text):
+        return {"author": "u", "fragments": [TextFragment(description=text)]}
+
+    async def scenario():
+        cache_memo.append(8, 1, entry("one"))
+        cache_memo.schedule_save(8, {1: entry("one")})
+        cache_memo.append(8, 2, entry("two"))
+        cache_memo.schedule_save(8, {1: entry("one"), 2: entry("two")})
+        # Recorded after the last snapshot, so it must survive the flush.
+        cache_memo.append(8, 3, entry("three"))
+        await cache_memo.flush()
+
+    asyncio.run(scenario())
+
+    assert writes == [[1, 2]]
+    assert not cache_memo.is_save_pending(8)
+    assert list(cache_memo.load(8)) == [1, 2, 3]
+
+
+def test_memo_schedule_save_during_inflight_flush_is_written(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache_cfg, "MEMO_DIR", str(tmp_path))
+    monkeypatch.setattr(cache_memo, "_SAVE_DEBOUNCE_S", 0)
+    writes = []
+    orig_write = cache_memo._write_snapshot
+
+    def entry(text):
+        return {"author": "u", "fragments": [TextFragment(description=text)]}
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+
+        def slow_write(channel_id, seq, memo_dict, offset):
+            if not writes:
+                # Queue another snapshot while this one is still being written.
+                asyncio.run_coroutine_threadsafe(queue_second(), loop).result()
+            writes.append(channel_id)
+            orig_write(channel_id, seq, memo_dict, offset)
+
+        async def queue_second():
+            cache_memo.schedule_save(10, {2: entry("two")})
+
+        monkeypatch.setattr(cache_memo, "_write_snapshot", slow_write)
+        cache_memo.schedule_save(9, {1: entry("one")})
+        task = cache_memo._flush_task
+        await asyncio.wait_for(task, timeout=1)
+
+    asyncio.run(scenario())
+
+    assert writes == [9, 10]
+    assert not cache_memo.is_save_pending(10)
+    assert list(cache_memo.load(10)) == [2]
+
+
+def test_memo_appends_after_overlapping_snapshots_survive(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache_cfg, "MEMO_DIR", str(tmp_path))
+    monkeypatch.setattr(cache_memo, "_SAVE_DEBOUNCE_S", 0)
+    orig_write = cache_memo._write_snapshot
+    first_started = threading.Event()
+    release_first = threading.Event()
+
+    def blocking_write(channel_id, seq, memo_dict, covered):
+        if not first_started.is_set():
+            first_started.set()
+            release_first.wait(timeout=5)
+        orig_write(channel_id, seq, memo_dict, covered)
+
+    monkeypatch.setattr(cache_memo, "_write_snapshot", blocking_write)
+
+    def entry(text):
+        return {"author": "u", "fragments": [TextFragment(description=text)]}
+
+    async def scenario():
+        cache_memo.append(11, 1, entry("one"))
+        cache_memo.append(11, 2, entry("two"))
+        cache_memo.schedule_save(11, {1: entry("one"), 2: entry("two")})
+        task = cache_memo._flush_task
+        await asyncio.to_thread(first_started.wait, 5)
+        # While the first snapshot is mid-write, queue a second and keep journaling.
+        cache_memo.append(11, 3, entry("three"))
+        cache_memo.schedule_save(11, {1: entry("one"), 2: entry("two"), 3: entry("three")})
+        cache_memo.append(11, 4, entry("four"))
+        release_first.set()
+        await asyncio.wait_for(task, timeout=5)
+
+    asyncio.run(scenario())
+
+    assert not cache_memo.is_save_pending(11)
+    assert list(cache_memo.load(11)) == [1, 2, 3, 4]
+    assert not list(tmp_path.glob("11.jrnl.*"))
@@ -0,0 +1,61 @@
+import asyncio
+from types import SimpleNamespace
+
+from gregg_limper.clients import oai
+
+
+def _chunk(content=None, tool_calls=None):
+    delta = SimpleNamespace(content=content, tool_calls=tool_calls)
+    return SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+
+def _tc(index, call_id=None, name=None, arguments=None):
+    return SimpleNamespace(
+        index=index,
+        id=call_id,
+        function=SimpleNamespace(name=name, arguments=arguments),
+    )
+
+
+def test_chat_stream_tools_assembles_deltas_and_reports_finished_calls(monkeypatch):
+    chunks = [
+        SimpleNamespace(choices=[]),
+        _chunk(content="Let me "),
+        _chunk(content="check."),
+        _chunk(tool_calls=[_tc(0, "call-1", "retrieve_", '{"qu')]),
+        _chunk(tool_calls=[_tc(0, None, "context", 'ery": "x"}')]),
+        _chunk(tool_calls=[_tc(1, "call-2", "other")]),
+        _chunk(),
+    ]
+    reported = []
+    seen_kwargs = {}
+
+    async def stream():
+        for i, chunk in enumerate(chunks):
+            if i == 6:
+                # Call 0 is finished as soon as index 1 starts streaming.
+                assert reported == [("call-1", "retrieve_context", '{"query": "x"}')]
+            yield chunk
+
+    async def fake_create(**kwargs):
+        seen_kwargs.update(kwargs)
+        return stream()
+
+    monkeypatch.setattr(oai.aoai.chat.completions, "create", fake_create)
+
+    content, calls = asyncio.run(
+        oai.chat_stream_tools(
+            [{"role": "user", "content": "hi"}],
+            model="m",
+            tools=[{"type": "function"}],
+            on_tool_call=lambda *call: reported.append(call),
+        )
+    )
+
+    assert seen_kwargs["stream"] is True
+    assert content == "Let me check."
+    assert calls == [
+        ("call-1", "retrieve_context", '{"query": "x"}'),
+        ("call-2", "other", "{}"),
+    ]
+    assert reported == calls
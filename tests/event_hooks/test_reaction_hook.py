@@ -37,7 +37,7 @@ def test_reaction_hook_ingests_when_trigger_matches(monkeypatch):
         reaction_hook.cache_formatting, "format_for_cache", fake_format_for_cache
     )
 
-    def _raise_key_error(_cid, mid):
+    def _raise_key_error(_cid, mid, **_kwargs):
         raise KeyError(mid)
 
     cache_stub = SimpleNamespace(get_memo_record=_raise_key_error)
@@ -76,7 +76,7 @@ def test_reaction_hook_ignores_non_trigger(monkeypatch):
     monkeypatch.setattr(
         reaction_hook,
         "GLCache",
-        lambda: SimpleNamespace(get_memo_record=lambda *_: None),
+        lambda: SimpleNamespace(get_memo_record=lambda *_, **__: None),
     )
     monkeypatch.setattr(reaction_hook.core, "CHANNEL_IDS", [1])
 
@@ -141,3 +141,69 @@ def test_reaction_hook_allows_bot_authored_message_when_trigger_matches(monkeypa
     asyncio.run(reaction_hook.handle(client, reaction, user))
 
     assert ingested == [55]
+
+
+def test_reaction_hook_rejects_non_trigger_before_touching_message(monkeypatch):
+    _setup_trigger_patches(monkeypatch, should_match=False)
+
+    class _ExplodingMessage:
+        def __getattr__(self, name):
+            raise AssertionError(f"message.{name} should not be accessed")
+
+    reaction = SimpleNamespace(message=_ExplodingMessage(), emoji="💡")
+    client = SimpleNamespace(user=SimpleNamespace(id=999))
+
+    asyncio.run(reaction_hook.handle(client, reaction, SimpleNamespace(name="tester")))
+
+
+def test_reaction_hook_coalesces_concurrent_formats(monkeypatch):
+    ingested = []
+    format_calls = []
+
+    async def fake_evaluate(*args, **kwargs):
+        return True, ResourceState(memo=False, sqlite=False)
+
+    async def fake_ingest(channel_id, message, cache_message):
+        ingested.append(cache_message)
+
+    async def fake_format_for_cache(message):
+        format_calls.append(message.id)
+        await asyncio.sleep(0)
+        return {"message_id": message.id}
+
+    _setup_trigger_patches(monkeypatch, should_match=True)
+
+    monkeypatch.setattr(reaction_hook, "evaluate_ingestion", fake_evaluate)
+    monkeypatch.setattr(reaction_hook, "ingest_message", fake_ingest)
+    monkeypatch.setattr(
+        reaction_hook.cache_formatting, "format_for_cache", fake_format_for_cache
+    )
+
+    def _raise_key_error(_cid, mid, **_kwargs):
+        raise KeyError(mid)
+
+    cache_stub = SimpleNamespace(get_memo_record=_raise_key_error)
+    monkeypatch.setattr(reaction_hook, "GLCache", lambda: cache_stub)
+    monkeypatch.setattr(reaction_hook.core, "CHANNEL_IDS", [1])
+
+    message = SimpleNamespace(
+        id=42,
+        author=SimpleNamespace(id=10, bot=False),
+        guild=SimpleNamespace(id=7),
+        channel=SimpleNamespace(id=1),
+        reactions=[],
+    )
+    reaction = SimpleNamespace(message=message, emoji="🧠")
+    client = SimpleNamespace(user=SimpleNamespace(id=999))
+
+    async def burst():
+        await asyncio.gather(
+            reaction_hook.handle(client, reaction, SimpleNamespace(name="a")),
+            reaction_hook.handle(client, reaction, SimpleNamespace(name="b")),
+        )
+
+    asyncio.run(burst())
+
+    assert format_calls == [42]
+    assert ingested == [{"message_id": 42}, {"message_id": 42}]
+    assert reaction_hook._inflight == {}
@@ -1,8 +1,14 @@
 import asyncio
 from types import SimpleNamespace
 
-from gregg_limper.formatter import format_message, classify
-from gregg_limper.formatter.model import TextFragment, LinkFragment
+from gregg_limper.formatter import format_message, classify, classify_slices
+from gregg_limper.formatter.classifier import LINK, TEXT, YOUTUBE
+from gregg_limper.formatter.model import (
+    TextFragment,
+    LinkFragment,
+    YouTubeFragment,
+    fragment_from_dict,
+)
 
 
 class DummyMessage(SimpleNamespace):
@@ -34,6 +40,29 @@ def test_classify_splits_text_and_links():
     assert result["link"] == ["https://example.com"]
 
 
+def test_classify_matches_media_hosts_exactly():
+    msg = make_message(
+        "https://www.youtube.com/watch?v=x https://media.tenor.com:443/a "
+        "https://nottenor.com/view/1 https://youtube.com.evil.net/v"
+    )
+    result = classify(msg)
+    assert result["youtube"] == ["https://www.youtube.com/watch?v=x"]
+    assert result["gif"] == ["https://media.tenor.com:443/a"]
+    assert result["link"] == [
+        "https://nottenor.com/view/1",
+        "https://youtube.com.evil.net/v",
+    ]
+
+
+def test_classify_slices_sets_mask_bits():
+    msg = make_message("hey https://youtu.be/abc https://example.com")
+    mask, slices = classify_slices(msg)
+    assert mask == (1 << TEXT) | (1 << LINK) | (1 << YOUTUBE)
+    assert slices[TEXT] == "hey"
+    assert slices[YOUTUBE] == ["https://youtu.be/abc"]
+    assert slices[LINK] == ["https://example.com"]
+
+
 async def _fake_summarize_url(url, enable_citations=True):
     return f"summary of {url}"
 
@@ -87,3 +116,54 @@ def test_text_handler_drops_bot_mentions_from_text():
     assert len(fragments) == 1
     assert isinstance(fragments[0], TextFragment)
     assert fragments[0].description == "do you remember the price?"
+
+
+def test_fragment_from_dict_round_trips_each_type():
+    link = LinkFragment(title="t", url="https://example.com", site_name="ex")
+    link.id = "l1"
+    yt = YouTubeFragment(title="v", channel="c", duration="1:00")
+    yt.id = "y1"
+    for frag in (link, yt):
+        data = frag.to_dict()
+        rebuilt = fragment_from_dict(data)
+        assert type(rebuilt) is type(frag)
+        assert rebuilt.to_dict() == data
+
+
+def test_fragment_factory_uses_default_factory_for_missing_keys():
+    from dataclasses import dataclass, field
+
+    from gregg_limper.formatter.model import _build_factory
+
+    @dataclass
+    class Tagged:
+        type: str = "tagged"
+        name: str = ""
+        tags: list = field(default_factory=list)
+
+    make = _build_factory(Tagged)
+    first, second = make({}), make({})
+    assert first.tags == [] and first.tags is not second.tags
+    assert make({"name": "n", "tags": ["x"]}) == Tagged(name="n", tags=["x"])
+
+
+def test_link_summaries_are_reused_across_messages(monkeypatch):
+    from gregg_limper.formatter.handlers import link
+
+    calls = []
+
+    async def counting_summarize(url, enable_citations=True):
+        calls.append(url)
+        return f"summary of {url}"
+
+    monkeypatch.setattr(link, "summarize_url", counting_summarize)
+    monkeypatch.setattr(link, "_summaries", link.OrderedDict())
+
+    urls = ["https://a.example", "https://a.example", "https://b.example"]
+    first = asyncio.run(link.LinkHandler.handle(urls))
+    again = asyncio.run(link.LinkHandler.handle(["https://a.example"]))
+
+    assert calls == ["https://a.example", "https://b.example"]
+    assert [f.url for f in first] == urls
+    assert first[0] is not first[1]
+    assert again[0].description == "summary of https://a.example"
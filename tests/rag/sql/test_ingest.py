@@ -10,8 +10,8 @@ from gregg_limper.config import rag, milvus
 class DummyRepo:
     def __init__(self):
         self.rows = []
-    async def insert_or_update_fragment(self, row):
-        self.rows.append(row)
+    async def insert_or_update_fragments(self, rows):
+        self.rows.extend(rows)
     async def lookup_fragment_id(self, message_id, source_idx, typ, content_hash):
         return 1
 
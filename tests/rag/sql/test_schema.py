@@ -0,0 +1,112 @@
+import asyncio
+import sqlite3
+import time
+
+from gregg_limper.memory.rag.sql import admin, db
+from gregg_limper.memory.rag.sql.repositories import FragmentsRepo, MetaRepo
+
+
+def _plan(conn, sql, params):
+    return " ".join(row[-1] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params))
+
+
+def test_fragment_queries_use_indexes():
+    conn = sqlite3.connect(":memory:")
+    db.migrate(conn)
+
+    lookup = _plan(
+        conn,
+        "SELECT id FROM fragments WHERE message_id=? AND source_idx=? AND type=? AND content_hash=?",
+        (1, 0, "text", "h"),
+    )
+    assert lookup.startswith("SEARCH") and "INDEX" in lookup
+
+    exists = _plan(conn, "SELECT 1 FROM fragments WHERE message_id=? LIMIT 1", (1,))
+    assert "USING COVERING INDEX" in exists
+
+    recent = _plan(
+        conn,
+        "SELECT id, content, type, ts, embedding FROM fragments "
+        "WHERE server_id=? AND channel_id=? AND ts>=? ORDER BY ts DESC LIMIT ?",
+        (1, 2, 0.0, 10),
+    )
+    assert "idx_frag_chan_ts" in recent
+    assert "TEMP B-TREE" not in recent
+
+    prune = _plan(conn, "SELECT id FROM fragments WHERE ts < ?", (0.0,))
+    assert "idx_frag_ts" in prune
+
+
+def test_migrate_drops_redundant_indexes():
+    conn = sqlite3.connect(":memory:")
+    db.migrate(conn)
+    conn.execute("CREATE INDEX idx_frag_msg ON fragments(message_id)")
+    db.migrate(conn)
+
+    names = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")}
+    assert "idx_frag_msg" not in names
+    assert "idx_frag_sc" not in names
+    assert "idx_frag_chan_ts" in names
+
+
+def test_retention_prune_deletes_old_rows_once():
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    db.migrate(conn)
+    now = time.time()
+    for mid, ts in ((1, now - 1000), (2, now - 1000), (3, now)):
+        conn.execute(
+            "INSERT INTO fragments (server_id, channel_id, message_id, author_id, ts, content, type,"
+            " media_id, embedding, emb_model, emb_dim, source_idx, content_hash)"
+            " VALUES (1, 1, ?, 1, ?, 'c', 'text', 'm', x'00', 'e', 1, 0, 'h')",
+            (mid, ts),
+        )
+    conn.commit()
+
+    assert asyncio.run(admin.retention_prune(conn, 500)) == 2
+    assert [r[0] for r in conn.execute("SELECT message_id FROM fragments")] == [3]
+
+
+def test_rows_by_ids_uses_primary_key():
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    db.migrate(conn)
+    for mid in (1, 2, 3):
+        conn.execute(
+            "INSERT INTO fragments (server_id, channel_id, message_id, author_id, ts, content, type,"
+            " media_id, embedding, emb_model, emb_dim, source_idx, content_hash)"
+            " VALUES (1, 1, ?, 1, 0, 'c', 'text', 'm', x'00', 'e', 1, 0, 'h')",
+            (mid,),
+        )
+    conn.commit()
+
+    plan = _plan(conn, FragmentsRepo._BY_IDS_SQL, ("[1]",))
+    assert "USING INTEGER PRIMARY KEY" in plan
+
+    rows = asyncio.run(FragmentsRepo(conn).rows_by_ids([3, 1, 99]))
+    assert sorted(r[0] for r in rows) == [1, 3]
+
+
+def test_get_user_profiles_fetches_in_one_query():
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    db.migrate(conn)
+    repo = MetaRepo(conn)
+    asyncio.run(repo.set_user_profile(1, '{"a": 1}'))
+    asyncio.run(repo.set_user_profile(2, '{"b": 2}'))
+
+    assert asyncio.run(repo.get_user_profiles([2, 3, 1])) == {1: '{"a": 1}', 2: '{"b": 2}'}
+    assert asyncio.run(repo.get_user_profiles([])) == {}
+
+
+def test_profile_blobs_with_nan_from_json_dumps_still_load(monkeypatch):
+    import math
+
+    from gregg_limper.memory import rag
+
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    db.migrate(conn)
+    repo = MetaRepo(conn)
+    # Blobs written before the orjson switch may carry NaN literals.
+    asyncio.run(repo.set_user_profile(1, '{"score": NaN}'))
+    monkeypatch.setattr(rag, "_meta_repo", repo)
+
+    assert math.isnan(asyncio.run(rag.user_profile(1))["score"])
+    assert math.isnan(asyncio.run(rag.user_profiles([1]))[1]["score"])
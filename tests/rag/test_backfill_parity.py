@@ -24,6 +24,7 @@ def test_backfill_matches_live_ingestion(monkeypatch):
 
     monkeypatch.setattr(core_cfg, "CHANNEL_IDS", [1])
     monkeypatch.setattr(memo, "save", lambda *_, **__: None)
+    monkeypatch.setattr(memo, "append", lambda *_, **__: None)
     monkeypatch.setattr(memo, "prune", lambda _channel_id, memo_dict: memo_dict)
 
     async def fake_is_opted_in(user_id: int) -> bool:
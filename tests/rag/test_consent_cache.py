@@ -23,6 +23,25 @@ def test_consent_registry():
     assert asyncio.run(consent.is_opted_in(uid)) is False
 
 
+def test_consent_checks_use_memory_mirror(monkeypatch):
+    uid = 9998
+    asyncio.run(consent.add_user(uid))
+
+    async def boom(*_args):
+        raise AssertionError("consent check should not query sqlite")
+
+    monkeypatch.setattr(consent._repo, "is_opted_in", boom)
+    monkeypatch.setattr(consent._repo, "opted_in_users", boom)
+    assert asyncio.run(consent.is_opted_in(uid)) is True
+    assert asyncio.run(consent.are_opted_in([uid, uid + 1])) == {uid}
+
+    asyncio.run(consent.remove_user(uid))
+    assert asyncio.run(consent.is_opted_in(uid)) is False
+
+    consent.invalidate_cache()
+    assert asyncio.run(consent.is_opted_in(uid)) is False
+
+
 def test_bot_whitelisted_on_init():
     assert asyncio.run(consent.is_opted_in(core_cfg.BOT_USER_ID)) is True
 
@@ -57,6 +76,9 @@ def test_cache_ingestion_gate(monkeypatch):
     monkeypatch.setattr(rag, "message_exists", fake_message_exists)
     monkeypatch.setattr(rag, "ingest_cache_message", fake_ingest)
     monkeypatch.setattr("gregg_limper.memory.cache.memo.save", lambda cid, data: None)
+    monkeypatch.setattr(
+        "gregg_limper.memory.cache.memo.append", lambda cid, mid, data: None
+    )
     monkeypatch.setattr("gregg_limper.memory.cache.memo.prune", lambda cid, data: data)
 
     async def consent_false(uid):
@@ -98,6 +120,9 @@ def test_commands_skipped_from_ingest(monkeypatch):
     )
     monkeypatch.setattr(rag, "ingest_cache_message", fake_ingest)
     monkeypatch.setattr("gregg_limper.memory.cache.memo.save", lambda cid, data: None)
+    monkeypatch.setattr(
+        "gregg_limper.memory.cache.memo.append", lambda cid, mid, data: None
+    )
     monkeypatch.setattr("gregg_limper.memory.cache.memo.prune", lambda cid, data: data)
 
     message_exists_calls = []
@@ -0,0 +1,42 @@
+import asyncio
+import sqlite3
+
+import numpy as np
+
+from gregg_limper.config import rag
+from gregg_limper.memory.rag import embed_cache
+from gregg_limper.memory.rag.sql import db
+
+
+def test_embed_cached_reuses_vectors_and_skips_failures(monkeypatch):
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    db.migrate(conn)
+    monkeypatch.setattr(embed_cache, "_repo", None)
+    embed_cache.bind(conn)
+    embed_cache.clear()
+
+    calls = []
+
+    async def fake_embed(text):
+        calls.append(text)
+        if text == "broken":
+            return np.zeros(rag.EMB_DIM, dtype=np.float32)
+        return np.ones(rag.EMB_DIM, dtype=np.float32)
+
+    monkeypatch.setattr(embed_cache, "embed", fake_embed)
+
+    first = asyncio.run(embed_cache.embed_cached("pizza"))
+    again = asyncio.run(embed_cache.embed_cached(" pizza "))
+    assert again is first
+    assert calls == ["pizza"]
+
+    # A cold in-memory tier falls back to the SQLite copy.
+    embed_cache.clear()
+    restored = asyncio.run(embed_cache.embed_cached("pizza"))
+    assert np.array_equal(restored, first)
+    assert calls == ["pizza"]
+
+    asyncio.run(embed_cache.embed_cached("broken"))
+    asyncio.run(embed_cache.embed_cached("broken"))
+    assert calls == ["pizza", "broken", "broken"]
+    embed_cache.clear()
@@ -0,0 +1,22 @@
+from gregg_limper.memory.rag.media_id import stable_media_id, stable_media_ids
+
+
+def test_stable_media_ids_matches_per_fragment_ids():
+    cfs = [
+        {"type": "text", "description": "hello"},
+        {"type": "youtube", "url": "https://youtu.be/dQw4w9WgXcQ"},
+        {"type": "image", "url": "https://cdn.discordapp.com/attachments/1/2/a.png"},
+        {"type": "link", "url": "https://Example.com/a?b=2&a=1"},
+        {"type": "gif", "title": "no url"},
+    ]
+
+    batched = stable_media_ids(cfs, server_id=1, channel_id=2, message_id=3)
+
+    assert batched == [
+        stable_media_id(cf=cf, server_id=1, channel_id=2, message_id=3, source_idx=i)
+        for i, cf in enumerate(cfs)
+    ]
+    assert batched[0] == "msg:3:0:text"
+    assert batched[1] == "yt:dQw4w9WgXcQ"
+    assert batched[2] == "dc:attachments/1/2/a.png"
+    assert batched[4].startswith("fallback:")
@@ -53,3 +53,37 @@ def test_message_has_trigger_reaction_detects_any_match():
 
     assert message_has_trigger_reaction(msg, triggers=triggers)
 
+
+def test_message_has_trigger_reaction_matches_custom_emojis():
+    triggers = build_trigger_set(["brain:12345", ":thumbsup:"])
+    msg = SimpleNamespace(
+        reactions=[
+            SimpleNamespace(emoji="💡"),
+            SimpleNamespace(emoji=FakeEmoji("wave", 1)),
+            SimpleNamespace(emoji=FakeEmoji("other", 12345)),
+        ]
+    )
+    assert message_has_trigger_reaction(msg, triggers=triggers)
+
+    msg.reactions = [SimpleNamespace(emoji=FakeEmoji("thumbsup", None))]
+    assert message_has_trigger_reaction(msg, triggers=triggers)
+
+    msg.reactions = [SimpleNamespace(emoji=FakeEmoji("wave", 1))]
+    assert not message_has_trigger_reaction(msg, triggers=triggers)
+
+
+def test_get_trigger_set_memoizes_until_invalidated(monkeypatch):
+    from gregg_limper.config import rag as rag_cfg
+    from gregg_limper.memory.rag import triggers as triggers_mod
+
+    monkeypatch.setattr(rag_cfg, "REACTION_TRIGGERS", ["🧠"])
+    triggers_mod.invalidate_triggers()
+    first = triggers_mod.get_trigger_set()
+    assert first.unicode_emojis == {"🧠"}
+
+    monkeypatch.setattr(rag_cfg, "REACTION_TRIGGERS", ["🔥"])
+    assert triggers_mod.get_trigger_set() is first
+
+    triggers_mod.invalidate_triggers()
+    assert triggers_mod.get_trigger_set().unicode_emojis == {"🔥"}
+    triggers_mod.invalidate_triggers()
@@ -82,7 +82,6 @@ def _make_conn():
 
 def test_vector_maintenance_startup_and_periodic(monkeypatch):
     conn = _make_conn()
-    lock = asyncio.Lock()
 
     # Insert initial fragment
     _insert_fragment(conn, "alpha")
@@ -126,13 +125,13 @@ def test_vector_maintenance_startup_and_periodic(monkeypatch):
     monkeypatch.setattr(vector_index, "_get_collection", lambda: fake_col)
     monkeypatch.setattr(milvus, "ENABLE_MILVUS", True, raising=False)
 
-    async def _no_sql(conn, lock):
+    async def _no_sql(conn):
         return None
 
     monkeypatch.setattr(sql_tasks, "run", _no_sql)
 
     async def run_test():
-        await scheduler.start(interval=0.1, conn=conn, lock=lock)
+        await scheduler.start(interval=0.1, conn=conn)
         await asyncio.sleep(0.05)
         # Insert another fragment to be picked up by the periodic cycle
         _insert_fragment(conn, "beta")
@@ -84,3 +84,40 @@ def test_upsert_many(monkeypatch):
     asyncio.run(vector_index.upsert_many(items))
     results = asyncio.run(vector_index.search(1, 2, vec, k=2))
     assert {r for r, _ in results} == {1, 2}
+
+
+def test_vector_search_skips_short_queries(monkeypatch):
+    from gregg_limper.memory.rag import embed_cache
+    from gregg_limper.memory.rag.vector import search
+
+    monkeypatch.setattr(embed_cache, "_repo", None)
+    embed_cache.clear()
+    fake = FakeCollection()
+    monkeypatch.setattr(vector_index, "_collection", fake)
+    monkeypatch.setattr(vector_index, "_get_collection", lambda: fake)
+    monkeypatch.setattr(milvus, "ENABLE_MILVUS", True, raising=False)
+    embedded = []
+
+    async def counting_embed(text, model=None):
+        embedded.append(text)
+        return await fake_embed_text(text)
+
+    monkeypatch.setattr(embeddings, "embed_text", counting_embed)
+    vec = asyncio.run(fake_embed_text("hello"))
+    asyncio.run(vector_index.upsert_many([(1, 1, 2, vec)]))
+
+    class Repo:
+        async def rows_by_ids(self, ids):
+            return [(rid, 1, 2, rid, 9, 0.0, f"c{rid}", "text", None, None, "m", 0) for rid in ids]
+
+    def run(query):
+        return asyncio.run(
+            search.vector_search(repo=Repo(), server_id=1, channel_id=2, query=query, k=1)
+        )
+
+    assert run("ok") == []
+    assert embedded == []
+    # Three-letter terms are real queries.
+    assert search._searchable("SQL")
+    assert run("pizza night")[0]["content"] == "c1"
+    assert embedded == ["pizza night"]
@@ -0,0 +1,40 @@
+import asyncio
+from types import SimpleNamespace
+
+from gregg_limper.response import context
+
+
+def test_gather_context_skips_profiles_without_participants(monkeypatch):
+    async def fake_summary(channel_id):
+        return "summary"
+
+    async def fail(*_args, **_kwargs):
+        raise AssertionError("profile lookup should be skipped")
+
+    monkeypatch.setattr(context, "fetch_channel_summary", fake_summary)
+    monkeypatch.setattr(context, "_gather_user_profiles", fail)
+
+    message = SimpleNamespace(channel=SimpleNamespace(id=7))
+    result = asyncio.run(context.gather_context(message, participant_ids=[None]))
+
+    assert result.channel_summary == "summary"
+    assert result.user_profiles == []
+
+
+def test_user_profiles_only_fetched_for_opted_in(monkeypatch):
+    fetched = []
+
+    async def fake_are_opted_in(ids):
+        return {2}
+
+    async def fake_profiles(uids):
+        fetched.extend(uids)
+        return {uid: {"id": uid} for uid in uids}
+
+    monkeypatch.setattr(context.consent, "are_opted_in", fake_are_opted_in)
+    monkeypatch.setattr(context, "fetch_user_profiles", fake_profiles)
+
+    profiles = asyncio.run(context._gather_user_profiles([1, 2, 3]))
+
+    assert profiles == [{"id": 2}]
+    assert fetched == [2]
@@ -0,0 +1,42 @@
+from types import SimpleNamespace
+
+from gregg_limper.response import history
+
+
+def test_convert_history_roles_and_rendering(monkeypatch):
+    bot = SimpleNamespace(user=SimpleNamespace(display_name="Gregg"))
+    monkeypatch.setattr(history.disc, "bot", bot)
+
+    converted = history._convert_history(
+        [
+            {"author": "alice", "fragments": [{"type": "text", "description": " hi "}]},
+            {
+                "author": "Gregg",
+                "fragments": [
+                    {"type": "image", "title": "cat", "caption": "a cat", "url": "http://x"}
+                ],
+            },
+            {"author": None, "fragments": []},
+        ]
+    )
+
+    assert converted == [
+        {"role": "user", "content": "alice said:\nhi"},
+        {"role": "assistant", "content": "Gregg said:\nIMAGE - cat - a cat - (http://x)"},
+        {"role": "user", "content": "Unknown speaker shared non-text content."},
+    ]
+
+
+def test_extract_participants_skips_bot_and_missing_ids(monkeypatch):
+    monkeypatch.setattr(history.disc, "bot", SimpleNamespace(user=SimpleNamespace(id=99)))
+
+    def user(uid):
+        return SimpleNamespace(id=uid)
+
+    raw = [
+        SimpleNamespace(author=user(1), mentions=[user(99), user(2)]),
+        SimpleNamespace(author=user(99), mentions=None),
+        SimpleNamespace(author=SimpleNamespace(), mentions=[user(3), SimpleNamespace()]),
+    ]
+
+    assert history._extract_participants(raw) == {1, 2, 3}
@@ -0,0 +1,65 @@
+import asyncio
+from types import SimpleNamespace
+
+from gregg_limper.response import pipeline
+from gregg_limper.response.context import ConversationContext
+from gregg_limper.response.history import HistoryContext
+
+
+def _build(monkeypatch, history_msgs, summary):
+    async def fake_history(channel_id, limit):
+        return HistoryContext(messages=list(history_msgs), participant_ids=set())
+
+    async def fake_context(message, *, participant_ids):
+        return ConversationContext(channel_summary=summary, user_profiles=[])
+
+    monkeypatch.setattr(pipeline, "build_history", fake_history)
+    monkeypatch.setattr(pipeline, "gather_context", fake_context)
+    message = SimpleNamespace(channel=SimpleNamespace(id=1))
+    return asyncio.run(pipeline.build_prompt_payload(message)).messages
+
+
+def test_dynamic_context_follows_history_and_prefix_is_stable(monkeypatch):
+    first = _build(monkeypatch, [{"role": "user", "content": "hi"}], "old summary")
+    second = _build(
+        monkeypatch,
+        [{"role": "user", "content": "hi"}, {"role": "user", "content": "again"}],
+        "new summary",
+    )
+
+    assert first[-1]["content"].startswith("### Context")
+    assert "new summary" in second[-1]["content"]
+    assert first[-2] == {"role": "user", "content": "hi"}
+    # Everything before the history is identical across turns.
+    assert first[:-2] == second[:-3]
+
+
+def test_system_message_is_shared_across_payloads(monkeypatch):
+    first = _build(monkeypatch, [], None)
+    second = _build(monkeypatch, [], None)
+
+    assert first[0] is second[0]
+    assert first[0]["role"] == "system"
+
+
+def test_user_profiles_render_as_indented_json_items():
+    from gregg_limper.response.context_messages import build_context_messages
+
+    context = ConversationContext(
+        channel_summary=None, user_profiles=[{"name": "Zoë"}, {"id": 2}]
+    )
+    content = build_context_messages(context)[0]["content"]
+
+    assert '- {\n  "name": "Zoë"\n}\n- {\n  "id": 2\n}' in content
+
+
+def test_context_block_is_reused_for_unchanged_context():
+    from gregg_limper.response.context_messages import build_context_messages
+
+    first = build_context_messages(ConversationContext("s", [{"id": 1}]))
+    again = build_context_messages(ConversationContext("s", [{"id": 1}]))
+    changed = build_context_messages(ConversationContext("s", [{"id": 2}]))
+
+    assert first[0] is again[0]
+    assert changed[0] is not first[0]
+    assert '"id": 2' in changed[0]["content"]
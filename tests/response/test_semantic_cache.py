@@ -0,0 +1,66 @@
+import asyncio
+from types import SimpleNamespace
+
+import numpy as np
+
+from gregg_limper import response
+from gregg_limper.config import core, rag
+from gregg_limper.response import semantic_cache
+
+
+def _vec(*head):
+    v = np.zeros(rag.EMB_DIM, dtype=np.float32)
+    v[: len(head)] = head
+    return v
+
+
+def test_lookup_respects_threshold_and_channel(monkeypatch):
+    monkeypatch.setattr(core, "SEMANTIC_CACHE_TAU", 0.9)
+    semantic_cache.clear()
+    semantic_cache.store(1, _vec(1, 0), "hi there")
+
+    assert semantic_cache.lookup(1, _vec(1, 0.1)) == "hi there"
+    assert semantic_cache.lookup(1, _vec(0, 1)) is None
+    assert semantic_cache.lookup(2, _vec(1, 0)) is None
+    semantic_cache.clear()
+
+
+def test_store_evicts_oldest(monkeypatch):
+    monkeypatch.setattr(core, "SEMANTIC_CACHE_TAU", 0.99)
+    monkeypatch.setattr(core, "SEMANTIC_CACHE_SIZE", 2)
+    semantic_cache.clear()
+    for i, reply in enumerate(["a", "b", "c"]):
+        semantic_cache.store(1, _vec(*([0] * i + [1])), reply)
+
+    assert semantic_cache.lookup(1, _vec(1)) is None
+    assert semantic_cache.lookup(1, _vec(0, 0, 1)) == "c"
+    semantic_cache.clear()
+
+
+def test_handle_short_circuits_on_hit(monkeypatch):
+    monkeypatch.setattr(core, "SEMANTIC_CACHE_TAU", 0.9)
+    semantic_cache.clear()
+    generated = []
+
+    async def fake_embed(text):
+        return _vec(1, 0)
+
+    async def fake_payload(message):
+        return f"payload-{message.id}"
+
+    async def fake_generate(message, payload=None):
+        assert payload == f"payload-{message.id}"
+        generated.append(message.id)
+        return "fresh reply"
+
+    monkeypatch.setattr(response, "embed_cached", fake_embed)
+    monkeypatch.setattr(response, "build_prompt_payload", fake_payload)
+    monkeypatch.setattr(response, "_generate", fake_generate)
+
+    def msg(mid):
+        return SimpleNamespace(id=mid, content="what's up?", channel=SimpleNamespace(id=5))
+
+    assert asyncio.run(response.handle(msg(1))) == "fresh reply"
+    assert asyncio.run(response.handle(msg(2))) == "fresh reply"
+    assert generated == [1]
+    semantic_cache.clear()
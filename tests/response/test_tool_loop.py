@@ -1,6 +1,6 @@
 import asyncio
 
-from gregg_limper.config import core
+from gregg_limper.config import core, prompt
 from gregg_limper.response import _run_with_tools
 from gregg_limper.tools import ToolContext, ToolResult, ToolSpec
 
@@ -47,7 +47,7 @@ def test_run_with_tools_executes_loop(monkeypatch):
         DummyResponse(DummyMessage("Final answer")),
     ]
 
-    async def fake_chat_full(messages, model, tools):
+    async def fake_chat_full(messages, model, tools, tool_choice=None):
         assert model == core.MSG_MODEL_ID
         return sequence.pop(0)
 
@@ -69,3 +69,193 @@ def test_run_with_tools_executes_loop(monkeypatch):
     assert text == "Final answer"
     roles = [msg["role"] for msg in conversation]
     assert "tool" in roles
+
+
+def test_run_with_tools_reuses_result_for_reordered_arguments(monkeypatch):
+    specs = [DummyToolSpec(name="dummy", description="test", parameters={"type": "object", "properties": {}})]
+
+    sequence = [
+        DummyResponse(DummyMessage("", [DummyCall("dummy", '{"a": 1, "b": 2}', "call-1")])),
+        DummyResponse(DummyMessage("", [DummyCall("dummy", '{"b":2,"a":1}', "call-2")])),
+        DummyResponse(DummyMessage("Final answer")),
+    ]
+    executed = []
+
+    async def fake_chat_full(messages, model, tools, tool_choice=None):
+        return sequence.pop(0)
+
+    async def fake_execute_tool(name, arguments, context):
+        executed.append(arguments)
+        return ToolResult(content="tool-output")
+
+    monkeypatch.setattr("gregg_limper.clients.oai.chat_full", fake_chat_full)
+    monkeypatch.setattr("gregg_limper.response.execute_tool", fake_execute_tool)
+
+    asyncio.run(
+        _run_with_tools(
+            messages=[{"role": "system", "content": "sys"}],
+            tool_specs=specs,
+            context=ToolContext(guild_id=1, channel_id=2, message_id=3),
+        )
+    )
+
+    assert executed == ['{"a": 1, "b": 2}']
+
+
+def test_run_with_tools_executes_calls_in_one_turn_concurrently(monkeypatch):
+    specs = [DummyToolSpec(name="dummy", description="test", parameters={"type": "object", "properties": {}})]
+
+    sequence = [
+        DummyResponse(
+            DummyMessage(
+                "",
+                [
+                    DummyCall("dummy", '{"n": 1}', "call-1"),
+                    DummyCall("dummy", '{"n": 2}', "call-2"),
+                    DummyCall("dummy", '{"n":1}', "call-3"),
+                ],
+            )
+        ),
+        DummyResponse(DummyMessage("Final answer")),
+    ]
+    executed = []
+
+    async def fake_chat_full(messages, model, tools, tool_choice=None):
+        return sequence.pop(0)
+
+    async def fake_execute_tool(name, arguments, context):
+        executed.append(arguments)
+        # The first call only finishes once the second has started.
+        if arguments == '{"n": 1}':
+            while len(executed) < 2:
+                await asyncio.sleep(0)
+        return ToolResult(content=f"out {arguments}")
+
+    monkeypatch.setattr("gregg_limper.clients.oai.chat_full", fake_chat_full)
+    monkeypatch.setattr("gregg_limper.response.execute_tool", fake_execute_tool)
+
+    _, conversation = asyncio.run(
+        asyncio.wait_for(
+            _run_with_tools(
+                messages=[{"role": "system", "content": "sys"}],
+                tool_specs=specs,
+                context=ToolContext(guild_id=1, channel_id=2, message_id=3),
+            ),
+            timeout=1,
+        )
+    )
+
+    tool_msgs = [(m["tool_call_id"], m["content"]) for m in conversation if m["role"] == "tool"]
+    assert tool_msgs == [
+        ("call-1", 'out {"n": 1}'),
+        ("call-2", 'out {"n": 2}'),
+        ("call-3", 'out {"n": 1}'),
+    ]
+    assert len(executed) == 2
+
+
+def test_run_with_tools_starts_streamed_calls_before_response_ends(monkeypatch):
+    monkeypatch.setattr(prompt, "STREAM_TOOL_CALLS", True)
+    turns = [
+        ("", [("call-1", "dummy", '{"n": 1}'), ("call-2", "dummy", '{"n": 2}')]),
+        ("Final answer", []),
+    ]
+    executed = []
+
+    async def fake_stream(messages, model, tools, on_tool_call, tool_choice=None):
+        content, calls = turns.pop(0)
+        if calls:
+            on_tool_call(*calls[0])
+            # The first call runs while the rest of the response streams in.
+            await asyncio.sleep(0)
+            assert executed == ['{"n": 1}']
+            on_tool_call(*calls[1])
+        return content, calls
+
+    async def fake_execute_tool(name, arguments, context):
+        executed.append(arguments)
+        return ToolResult(content=f"out {arguments}")
+
+    monkeypatch.setattr("gregg_limper.clients.oai.chat_stream_tools", fake_stream)
+    monkeypatch.setattr("gregg_limper.response.execute_tool", fake_execute_tool)
+
+    text, conversation = asyncio.run(
+        _run_with_tools(
+            messages=[{"role": "system", "content": "sys"}],
+            openai_tools=[],
+            context=ToolContext(guild_id=1, channel_id=2, message_id=3),
+        )
+    )
+
+    assert text == "Final answer"
+    tool_msgs = [(m["tool_call_id"], m["content"]) for m in conversation if m["role"] == "tool"]
+    assert tool_msgs == [("call-1", 'out {"n": 1}'), ("call-2", 'out {"n": 2}')]
+    assert executed == ['{"n": 1}', '{"n": 2}']
+
+
+def test_run_with_tools_disables_tool_calls_after_deadline(monkeypatch):
+    monkeypatch.setattr(prompt, "TOOL_LOOP_DEADLINE", 0)
+    seen = []
+
+    async def fake_chat_full(messages, model, tools, tool_choice=None):
+        seen.append((tools, tool_choice))
+        return DummyResponse(DummyMessage("Final answer"))
+
+    monkeypatch.setattr("gregg_limper.clients.oai.chat_full", fake_chat_full)
+
+    text, _ = asyncio.run(
+        _run_with_tools(
+            messages=[{"role": "system", "content": "sys"}],
+            openai_tools=[{"type": "function"}],
+            context=ToolContext(guild_id=1, channel_id=2, message_id=3),
+        )
+    )
+
+    assert text == "Final answer"
+    # Tools stay in the request (same cached prefix); calling them is disabled.
+    assert seen == [([{"type": "function"}], "none")]
+
+
+def test_run_with_tools_cancels_sibling_tools_when_one_fails(monkeypatch):
+    sequence = [
+        DummyResponse(
+            DummyMessage(
+                "",
+                [DummyCall("dummy", '{"n": 1}', "call-1"), DummyCall("dummy", '{"n": 2}', "call-2")],
+            )
+        ),
+    ]
+    cancelled = []
+
+    async def fake_chat_full(messages, model, tools, tool_choice=None):
+        return sequence.pop(0)
+
+    async def fake_execute_tool(name, arguments, context):
+        if arguments == '{"n": 1}':
+            await asyncio.sleep(0)
+            raise KeyError("boom")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(arguments)
+            raise
+
+    monkeypatch.setattr("gregg_limper.clients.oai.chat_full", fake_chat_full)
+    monkeypatch.setattr("gregg_limper.response.execute_tool", fake_execute_tool)
+
+    async def scenario():
+        try:
+            await _run_with_tools(
+                messages=[{"role": "system", "content": "sys"}],
+                openai_tools=[{"type": "function"}],
+                context=ToolContext(guild_id=1, channel_id=2, message_id=3),
+            )
+        except KeyError:
+            pass
+        else:
+            raise AssertionError("expected the tool failure to propagate")
+        await asyncio.sleep(0)
+        # Checked before asyncio.run's own shutdown cancels leftover tasks.
+        assert cancelled == ['{"n": 2}']
+
+    asyncio.run(asyncio.wait_for(scenario(), timeout=1))
@@ -2,8 +2,16 @@ import asyncio
 
 import pytest
 
-from gregg_limper.tools import ToolContext, get_registered_tool_specs
+from gregg_limper.tools import ToolContext, ToolExecutionError, ToolSpec, get_registered_tool_specs
 from gregg_limper.tools.executor import execute_tool
+from gregg_limper.tools.result_cache import tool_results
+
+
+@pytest.fixture(autouse=True)
+def _fresh_result_cache():
+    tool_results.clear()
+    yield
+    tool_results.clear()
 
 
 def test_registry_exposes_default_tool():
@@ -34,3 +42,121 @@ def test_execute_tool_uses_rag(monkeypatch):
 
     assert "Cheese pizza" in result.content
     assert "Pepperoni pizza" in result.content
+
+
+def test_retrieve_context_resolves_author_names_from_member_cache(monkeypatch):
+    fetched = []
+
+    class Member:
+        def __init__(self, name):
+            self.display_name = name
+
+    class Guild:
+        def get_member(self, uid):
+            return Member("cached") if uid == 1 else None
+
+        async def fetch_member(self, uid):
+            fetched.append(uid)
+            if uid == 3:
+                raise RuntimeError("unknown member")
+            return Member(f"fetched-{uid}")
+
+    async def fake_vector_search(guild_id, channel_id, query, k):
+        return [
+            {"content": "a", "author_id": 1, "message_id": 100},
+            {"content": "b", "author_id": 2, "message_id": 101},
+            {"content": "c", "author_id": 3, "message_id": 102},
+        ]
+
+    monkeypatch.setattr("gregg_limper.tools.handlers.rag.rag.vector_search", fake_vector_search)
+
+    result = asyncio.run(
+        execute_tool(
+            "retrieve_context",
+            {"query": "pizza", "k": 3},
+            context=ToolContext(guild_id=42, channel_id=13, message_id=7, guild=Guild()),
+        )
+    )
+
+    assert "author: cached" in result.content
+    assert "author: 2" in result.content
+    assert "author: 3" in result.content
+    assert fetched == []
+
+
+def test_tool_prompt_message_is_shared_until_registration(monkeypatch):
+    from gregg_limper import tools
+
+    monkeypatch.setattr(tools, "_registry", dict(tools._registry))
+    monkeypatch.setattr(tools, "_tool_prompt_message", None)
+    monkeypatch.setattr(tools, "_openai_tools", None)
+    first = tools.get_tool_prompt_message()
+    openai_tools = tools.get_openai_tools()
+    assert openai_tools is tools.get_openai_tools()
+    assert first is tools.get_tool_prompt_message()
+    assert "retrieve_context" in first["content"]
+
+    @tools.register_tool(ToolSpec(name="extra_tool", description="x", parameters={}))
+    class ExtraTool(tools.Tool):
+        pass
+
+    refreshed = tools.get_tool_prompt_message()
+    assert refreshed is not first
+    assert "extra_tool" in refreshed["content"]
+    assert "extra_tool" in {t["function"]["name"] for t in tools.get_openai_tools()}
+
+
+def test_cacheable_tool_results_are_shared_across_calls(monkeypatch):
+    calls = []
+
+    async def fake_vector_search(guild_id, channel_id, query, k):
+        calls.append((channel_id, query))
+        return [{"content": "Cheese pizza", "author_id": 1, "message_id": 100}]
+
+    monkeypatch.setattr("gregg_limper.tools.handlers.rag.rag.vector_search", fake_vector_search)
+
+    def run(args, channel_id=13):
+        return asyncio.run(
+            execute_tool(
+                "retrieve_context",
+                args,
+                context=ToolContext(guild_id=42, channel_id=channel_id, message_id=7),
+            )
+        )
+
+    first = run('{"query": "pizza", "k": 1}')
+    assert run('{"k": 1, "query": "pizza"}') is first
+    run('{"query": "pizza", "k": 1}', channel_id=14)
+
+    assert calls == [(13, "pizza"), (14, "pizza")]
+
+
+def test_execute_tool_rejects_invalid_json():
+    with pytest.raises(ToolExecutionError, match="Invalid JSON"):
+        asyncio.run(
+            execute_tool(
+                "retrieve_context",
+                "{not json",
+                context=ToolContext(guild_id=1, channel_id=2, message_id=3),
+            )
+        )
+
+
+def test_execute_tool_times_out_slow_tools(monkeypatch):
+    from gregg_limper import tools
+
+    async def slow_vector_search(guild_id, channel_id, query, k):
+        await asyncio.sleep(5)
+
+    monkeypatch.setattr("gregg_limper.tools.handlers.rag.rag.vector_search", slow_vector_search)
+    entry = tools.get_tool_entry("retrieve_context")
+    monkeypatch.setattr(entry.spec, "timeout_seconds", 0.01)
+
+    with pytest.raises(ToolExecutionError, match="timed out"):
+        asyncio.run(
+            execute_tool(
+                "retrieve_context",
+                {"query": "pizza"},
+                context=ToolContext(guild_id=1, channel_id=2, message_id=3),
+            )
+        )